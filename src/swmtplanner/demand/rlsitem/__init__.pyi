@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from typing import Any, Callable, TYPE_CHECKING
 
 from swmtplanner.support import HasID
-from swmtplanner.demand.order import WeeklyDemand
+from swmtplanner.demand.order import SafetyAwareOrder, WeeklyDemand
 from swmtplanner.demand.view import RawView, SafetyAwareView
 
 if TYPE_CHECKING:
@@ -43,6 +43,8 @@ class RlsItem(HasID[str]):
     @property
     def jobs(self) -> tuple['Job', ...]: ...
     @property
+    def version(self) -> int: ...
+    @property
     def raw_view(self) -> RawView: ...
     @property
     def safety_view(self) -> SafetyAwareView: ...
@@ -56,7 +58,14 @@ class RlsItem(HasID[str]):
     def on_hand_coverage(self) -> dict[str, float]: ...
     @property
     def replenishment_need_lbs(self) -> float: ...
+    @property
+    def first_unmet_order(self) -> SafetyAwareOrder | None: ...
     def register_jobs(self, jobs: list['Job']) -> None: ...
     def cost_if(
         self, jobs: list['Job'], detail_sink: 'Callable[..., Any] | None' = ...,
+        *, raw: bool = ..., safety: bool = ...,
     ) -> CostComponents: ...
+    def cost_if_many(
+        self, job_lists: list[list['Job']], *,
+        raw: bool = ..., safety: bool = ...,
+    ) -> list[CostComponents]: ...
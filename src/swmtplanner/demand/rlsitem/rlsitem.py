@@ -10,6 +10,7 @@ from swmtplanner.demand.order import WeeklyDemand
 from swmtplanner.demand.view import RawView, SafetyAwareView
 
 if TYPE_CHECKING:
+    from swmtplanner.demand.order import SafetyAwareOrder
     from swmtplanner.products import Greige
     from swmtplanner.schedule import Job
 
@@ -20,7 +21,7 @@ def _job_completion(job: 'Job') -> datetime:
     """Sort key for the production schedule: a job's final roll's
     `completion_time` (its effective end). A job with no rolls sorts
     first via `datetime.min`."""
-    return job.rolls[-1].completion_time if job.rolls else datetime.min
+    return job.completion_time or datetime.min
 
 @dataclass(frozen=True)
 class CostComponents:
@@ -46,11 +47,20 @@ class RlsItem(HasID[str]):
         self._safety_view = SafetyAwareView(self, list(self._weekly_demand))
 
         self._jobs: list['Job'] = []
+        self._version = 0
+        # Aggregates over the jobs and the safety view, refreshed whenever
+        # they change (`register_jobs` / `_recompute_views`) rather than on
+        # every read. `_first_unmet` indexes the earliest safety-view order
+        # with unmet demand (len(orders) when all are met).
+        self._total_demand_lbs = sum(w.qty_lbs for w in self._weekly_demand)
+        self._scheduled_lbs = 0.0
+        self._replenishment_need_lbs = 0.0
+        self._first_unmet = 0
 
         # Prime the views so their orders/cost-trackers reflect on_hand against
         # an empty job list. Without this the views are stale until the first
-        # register_job, and cost_if on a fresh RlsItem would observe a state
-        # change between its pre- and post-recompute snapshots.
+        # register_job, and cost_if on a fresh RlsItem (which reads the
+        # current state for an empty hypothetical) would disagree with them.
         self._recompute_views()
 
         # Snapshot what initial on-hand inventory covers, while the views are
@@ -92,6 +102,12 @@ class RlsItem(HasID[str]):
     def jobs(self) -> tuple['Job', ...]:
         return tuple(self._jobs)
 
+    @property
+    def version(self) -> int:
+        """Mutation counter — bumped by every `register_jobs` call (the only
+        mutating operation; `cost_if` never touches the views)."""
+        return self._version
+
     @property
     def raw_view(self) -> RawView:
         return self._raw_view
@@ -104,11 +120,11 @@ class RlsItem(HasID[str]):
 
     @property
     def scheduled_lbs(self) -> float:
-        return sum(j.total_lbs for j in self._jobs)
+        return self._scheduled_lbs
 
     @property
     def total_demand_lbs(self) -> float:
-        return sum(w.qty_lbs for w in self._weekly_demand)
+        return self._total_demand_lbs
 
     @property
     def excess_lbs(self) -> float:
@@ -128,15 +144,30 @@ class RlsItem(HasID[str]):
     def replenishment_need_lbs(self) -> float:
         # "What the scheduler still has to place" — every unfilled lb in
         # the safety view's orders plus any gap left in the safety pool.
-        order_remaining = sum(o.remaining_lbs for o in self._safety_view.orders)
-        safety_shortfall = max(
-            0.0, self._safety_view.safety_target - self._safety_view.safety_pool
-        )
-        return order_remaining + safety_shortfall
+        return self._replenishment_need_lbs
+
+    @property
+    def first_unmet_order(self) -> 'SafetyAwareOrder | None':
+        """The earliest safety-view order with unmet demand (`remaining_lbs
+        > 0`), or `None` once every order is met. Orders are in week order,
+        so no later order is unmet before it."""
+        orders = self._safety_view.orders
+        if self._first_unmet == len(orders):
+            return None
+        return orders[self._first_unmet]
 
     def _recompute_views(self):
         for v in (self._raw_view, self._safety_view):
             v.recompute(self._jobs, self._on_hand_lbs)
+        view = self._safety_view
+        orders = view.orders
+        order_remaining = sum(o.remaining_lbs for o in orders)
+        safety_shortfall = max(0.0, view.safety_target - view.safety_pool)
+        self._replenishment_need_lbs = order_remaining + safety_shortfall
+        self._first_unmet = next(
+            (i for i, o in enumerate(orders) if o.remaining_lbs > 0),
+            len(orders),
+        )
 
     def register_jobs(self, jobs: list['Job']):
         """Insert each of `jobs` into the internal job list (kept sorted by
@@ -148,17 +179,31 @@ class RlsItem(HasID[str]):
                 self._jobs, _job_completion(job), key=_job_completion,
             )
             self._jobs.insert(idx, job)
+        self._scheduled_lbs = sum(j.total_lbs for j in self._jobs)
         self._recompute_views()
+        self._version += 1
 
-    def cost_if(self, jobs: list['Job'], detail_sink=None):
+    def cost_if(
+        self, jobs: list['Job'], detail_sink=None, *,
+        raw: bool = True, safety: bool = True,
+    ):
         """Return the `CostComponents` that would result if `jobs` were
         registered, without mutating any state. Empty `jobs` returns the
         current state's cost.
 
-        `detail_sink`, when given, is forwarded to both views' `recompute` so
-        they report their per-window cost detail (lateness / drainage /
-        carrying / excess) as the hypothetical is evaluated, before the state
-        is restored."""
+        Runs both views' `simulate` on the hypothetical job list: the
+        simulations work on scratch state and leave the item, its views and
+        their orders untouched, so nothing needs restoring afterwards and
+        several threads may call this at once (between `register_jobs`
+        calls).
+
+        `detail_sink`, when given, is forwarded to both simulations so they
+        report their per-window cost detail (lateness / drainage / carrying
+        / excess) as the hypothetical is evaluated.
+
+        A caller that has no use for one view's components can skip its
+        simulation: `raw=False` reports `lateness` as 0, `safety=False`
+        reports `drainage`, `carrying` and `excess` as 0."""
         new_jobs = list(self._jobs)
         for job in jobs:
             idx = bisect_right(
@@ -166,11 +211,30 @@ class RlsItem(HasID[str]):
             )
             new_jobs.insert(idx, job)
 
-        self._raw_view.recompute(new_jobs, self._on_hand_lbs, detail_sink)
-        self._safety_view.recompute(new_jobs, self._on_hand_lbs, detail_sink)
-        res = CostComponents(self._raw_view.lateness,
-                             self._safety_view.drainage,
-                             self._safety_view.carrying,
-                             self._safety_view.excess)
-        self._recompute_views()
-        return res
\ No newline at end of file
+        lateness = drainage = carrying = excess = 0.0
+        if raw:
+            lateness = self._raw_view.simulate(
+                new_jobs, self._on_hand_lbs, detail_sink,
+            )
+        if safety:
+            drainage, carrying, excess = self._safety_view.simulate(
+                new_jobs, self._on_hand_lbs, detail_sink,
+            )
+        return CostComponents(lateness, drainage, carrying, excess)
+
+    def cost_if_many(
+        self, job_lists: list[list['Job']], *,
+        raw: bool = True, safety: bool = True,
+    ) -> list[CostComponents]:
+        """`cost_if(jobs, raw=raw, safety=safety)` for each of `job_lists`,
+        in order — the way to price many candidate placements against one
+        committed schedule.
+
+        Each hypothetical only adds jobs, so both views resume their
+        simulation from the latest recompute's checkpoint just before the
+        hypothetical's first roll: the work per candidate is in the events
+        after it, not in the whole schedule. Pure, like `cost_if`."""
+        return [
+            self.cost_if(jobs, raw=raw, safety=safety) for jobs in job_lists
+        ]
+
@@ -22,6 +22,10 @@ class RawView:
         self, jobs: list['Job'], on_hand: float,
         detail_sink: Callable[..., Any] | None = ...,
     ) -> None: ...
+    def simulate(
+        self, jobs: list['Job'], on_hand: float,
+        detail_sink: Callable[..., Any] | None = ...,
+    ) -> float: ...
 
 
 class SafetyAwareView:
@@ -48,3 +52,7 @@ class SafetyAwareView:
         self, jobs: list['Job'], on_hand: float,
         detail_sink: Callable[..., Any] | None = ...,
     ) -> None: ...
+    def simulate(
+        self, jobs: list['Job'], on_hand: float,
+        detail_sink: Callable[..., Any] | None = ...,
+    ) -> tuple[float, float, float]: ...
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING
 from abc import abstractmethod
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+import numpy as np
 
 from swmtplanner.demand.order import (
     RawOrder, SafetyAwareOrder, WeeklyDemand, Safety,
@@ -10,13 +14,25 @@ from swmtplanner.demand.order import (
 
 if TYPE_CHECKING:
     from swmtplanner.demand.rlsitem import RlsItem
-    from swmtplanner.demand.order import Order
     from swmtplanner.schedule import Job, Roll
 
 _SECONDS_PER_DAY = 86400.0
 
-_EventQty = (tuple[Literal['chunk'], float, 'Roll | None']
-             | tuple[Literal['drain'], 'Order'])
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_us(t: datetime) -> int:
+    """`t` as integer microseconds since 1970-01-01 (naive)."""
+    return (t - _EPOCH) // _MICROSECOND
+
+
+# One event of a `SafetyAwareView` simulation: `(time_us, kind, job, idx,
+# lbs, roll)`. Kind 0 is a chunk arriving — `idx` the roll's index in `job`,
+# both None/0 with no roll for on-hand; kind 1 is order `idx` draining.
+_SafetyEvent = tuple[int, int, 'Job | None', int, float, 'Roll | None']
+
+
 
 class RawView:
 
@@ -24,6 +40,18 @@ class RawView:
         self._rls_item = rls_item
         self._orders = tuple(RawOrder(rls_item, week) for week in weekly_demand)
         self._lateness: float = 0.0
+        # Incremental-recompute state (see `recompute`). `_stream` is the
+        # sorted chunk stream of the latest recompute, one
+        # `(time, lbs, job, roll_idx)` per chunk (`job` is None for on-hand);
+        # `_basis` / `_basis_on_hand` are the jobs and on-hand it was built
+        # from. `_enter[i]` is the walk state on first reaching chunk `i`
+        # (i >= 1; a last entry at `len(_stream)` means the walk ran out of
+        # chunks): `(order_idx, needed, allocated_lbs, late_lbs,
+        # late_fill_date, lateness)`.
+        self._stream: list[tuple[datetime, float, 'Job | None', int]] = []
+        self._enter: list[tuple | None] = []
+        self._basis: tuple['Job', ...] | None = None
+        self._basis_on_hand: float | None = None
 
     @property
     def orders(self) -> tuple[RawOrder, ...]:
@@ -44,45 +72,156 @@ class RawView:
         # On-hand is available "now"; stamping it at the first order's
         # due date keeps it on-time for every order without taking
         # start_date as a caller-supplied param.
+        #
+        # Incremental: when `jobs` is the previous call's jobs plus some
+        # new ones (same on-hand, no detail wanted), the new rolls are
+        # merged into the kept stream and the walk resumes from the state
+        # it had on reaching the first new chunk — every float operation
+        # before that point would repeat exactly, so the result is
+        # bit-for-bit the full recompute's. Anything else recomputes from
+        # scratch.
+        if detail_sink is None and on_hand == self._basis_on_hand:
+            new_jobs = _added_jobs(self._basis, jobs)
+            if new_jobs is not None:
+                self._extend(jobs, new_jobs)
+                return
+        self._full_recompute(jobs, on_hand, detail_sink)
+
+    def simulate(self, jobs: list['Job'], on_hand: float,
+                 detail_sink=None) -> float:
+        """The `lateness` that `recompute(jobs, on_hand, detail_sink)` would
+        leave, without touching the view or its orders — the walk runs on
+        local scratch state. Like `recompute`, it resumes from the kept walk
+        state when `jobs` extends the latest recompute's jobs. Safe to call
+        from several threads at once, as long as no `recompute` runs
+        meanwhile."""
+        if detail_sink is None and on_hand == self._basis_on_hand:
+            basis, enter = self._basis, self._enter
+            if _same_jobs(jobs, basis):
+                return self._lateness
+            new_jobs = _added_jobs(basis, jobs)
+            if new_jobs is not None:
+                first_new, tail = _merge_rolls(self._stream, jobs, new_jobs)
+                if not tail or first_new >= len(enter):
+                    return self._lateness
+                if first_new > 0:
+                    return self._walk(tail, 0, None, *enter[first_new])
+        return self._walk(
+            self._build_stream(jobs, on_hand), 0, None,
+            0, self._orders[0].week.qty_lbs, 0.0, 0.0, None, 0.0,
+            detail_sink=detail_sink,
+        )
+
+    def _build_stream(
+        self, jobs: list['Job'], on_hand: float,
+    ) -> list[tuple[datetime, float, 'Job | None', int]]:
         first_due = self._orders[0].week.due_date
-        stream: list[tuple[datetime, float]] = [(first_due, on_hand)]
+        stream: list[tuple[datetime, float, 'Job | None', int]] = [
+            (first_due, on_hand, None, 0)
+        ]
         for j in jobs:
             stream.extend(
-                (roll.completion_time, roll.lbs) for roll in j.rolls
+                (roll.completion_time, roll.lbs, j, i)
+                for i, roll in enumerate(j.rolls)
             )
         # Multiple machines producing the same item can interleave
         # rolls in time; sort to keep the FIFO walk well-formed.
         stream.sort(key=lambda e: e[0])
-
-        chunk_idx = 0
-        chunk_remaining = stream[0][1]
-        self._lateness = 0.0
-
-        for order in self._orders:
-            order.allocated_lbs = 0.0
-            order.late_lbs = 0.0
-            order.late_fill_date = None
-            needed = order.week.qty_lbs
-
-            while needed > 0 and chunk_idx < len(stream):
+        return stream
+
+    def _full_recompute(self, jobs: list['Job'], on_hand: float,
+                        detail_sink) -> None:
+        stream = self._build_stream(jobs, on_hand)
+        enter: list[tuple | None] = [None]
+        fills: list[tuple[float, float, datetime | None]] = []
+        self._lateness = self._walk(
+            stream, 0, enter,
+            0, self._orders[0].week.qty_lbs, 0.0, 0.0, None, 0.0,
+            detail_sink=detail_sink, fills=fills,
+        )
+        self._stream, self._enter = stream, enter
+        self._basis = tuple(jobs)
+        self._basis_on_hand = on_hand
+        self._store_fills(0, fills)
+
+    def _extend(self, jobs: list['Job'], new_jobs: list['Job']) -> None:
+        """Merge `new_jobs`' rolls into the stream (`jobs` is the full new
+        list) and resume the walk from the first new chunk."""
+        first_new, tail = _merge_rolls(self._stream, jobs, new_jobs)
+        if not tail or first_new >= len(self._enter):
+            # The walk never reached the new chunks (every order was filled
+            # first): nothing changes but the stream.
+            self._stream = self._stream[:first_new] + tail
+            self._basis = tuple(jobs)
+            return
+        if first_new == 0:
+            self._full_recompute(jobs, self._basis_on_hand, None)
+            return
+
+        oi = self._enter[first_new][0]
+        stream = self._stream[:first_new] + tail
+        enter = self._enter[:first_new + 1]
+        fills: list[tuple[float, float, datetime | None]] = []
+        self._lateness = self._walk(
+            stream, first_new, enter, *enter[first_new], fills=fills,
+        )
+        self._stream, self._enter = stream, enter
+        self._basis = tuple(jobs)
+        self._store_fills(oi, fills)
+
+    def _store_fills(self, oi: int, fills) -> None:
+        """Write `(allocated_lbs, late_lbs, late_fill_date)` triples onto
+        the orders from index `oi` on."""
+        for order, (allocated, late, late_fill) in zip(
+            self._orders[oi:], fills,
+        ):
+            order.allocated_lbs = allocated
+            order.late_lbs = late
+            order.late_fill_date = late_fill
+
+    def _walk(
+        self, stream: list[tuple[datetime, float, 'Job | None', int]],
+        chunk_idx: int, enter: list[tuple | None] | None,
+        oi: int, needed: float, allocated: float, late: float,
+        late_fill: datetime | None, lateness: float, *,
+        detail_sink=None, fills: list | None = None,
+    ) -> float:
+        """The FIFO walk over `stream`, from first reaching chunk
+        `chunk_idx` with order `oi` still `needed` lbs short (its fields so
+        far `allocated`, `late`, `late_fill`) and `lateness` accrued, through
+        the last order. Returns the final lateness. Runs on locals only:
+        appends the walk state on reaching each later chunk to `enter` and
+        each order's final `(allocated_lbs, late_lbs, late_fill_date)` to
+        `fills`, when given."""
+        orders = self._orders
+        n = len(stream)
+        chunk_remaining = stream[chunk_idx][1]
+        due = orders[oi].week.due_date
+
+        while True:
+            while needed > 0 and chunk_idx < n:
                 if chunk_remaining <= 0:
                     chunk_idx += 1
-                    if chunk_idx >= len(stream):
+                    if enter is not None:
+                        enter.append((
+                            oi, needed, allocated, late, late_fill, lateness,
+                        ))
+                    if chunk_idx >= n:
                         break
                     chunk_remaining = stream[chunk_idx][1]
                     continue
 
                 take = min(needed, chunk_remaining)
-                order.allocated_lbs += take
+                allocated += take
 
                 avail_time = stream[chunk_idx][0]
-                if order.late_fill_date is None or avail_time > order.late_fill_date:
-                    order.late_fill_date = avail_time
-                if avail_time > order.week.due_date:
-                    order.late_lbs += take
-                    days_late = (avail_time - order.week.due_date).total_seconds() / _SECONDS_PER_DAY
+                if late_fill is None or avail_time > late_fill:
+                    late_fill = avail_time
+                if avail_time > due:
+                    late += take
+                    days_late = (avail_time - due).total_seconds() / _SECONDS_PER_DAY
                     contribution = take * (2.0 ** days_late)
-                    self._lateness += contribution
+                    lateness += contribution
                     if detail_sink is not None:
                         # One row per late delivery of material to an order.
                         detail_sink('lateness', self._rls_item.item.id,
@@ -91,6 +230,73 @@ class RawView:
                 chunk_remaining -= take
                 needed -= take
 
+            if fills is not None:
+                fills.append((allocated, late, late_fill))
+            oi += 1
+            if oi == len(orders):
+                return lateness
+            week = orders[oi].week
+            due = week.due_date
+            needed = week.qty_lbs
+            allocated = late = 0.0
+            late_fill = None
+
+
+def _same_jobs(jobs: list['Job'], basis: tuple['Job', ...] | None) -> bool:
+    """Whether `jobs` is exactly `basis`, job for job."""
+    return (
+        basis is not None and len(jobs) == len(basis)
+        and all(a is b for a, b in zip(jobs, basis))
+    )
+
+
+def _added_jobs(
+    basis: tuple['Job', ...] | None, jobs: list['Job'],
+) -> list['Job'] | None:
+    """The jobs of `jobs` not in `basis`, when `basis` is a subsequence of
+    `jobs` (same objects, same relative order) and `jobs` adds at least
+    one; otherwise `None`."""
+    if basis is None or len(jobs) <= len(basis):
+        return None
+    added = []
+    k = 0
+    for job in jobs:
+        if k < len(basis) and job is basis[k]:
+            k += 1
+        else:
+            added.append(job)
+    return added if k == len(basis) else None
+
+
+def _merge_rolls(
+    stream: list[tuple[datetime, float, 'Job | None', int]],
+    jobs: list['Job'], new_jobs: list['Job'],
+) -> tuple[int, list[tuple[datetime, float, 'Job | None', int]]]:
+    """Merge `new_jobs`' rolls into `stream` — built from the other jobs of
+    `jobs` — in the order `RawView._build_stream` would give them. Returns
+    the index of the first new chunk and the merged stream from there on
+    (before it, the merged stream is `stream` unchanged); `(len(stream),
+    [])` when the new jobs have no rolls."""
+    # The full build's stable sort orders chunks by (time, position of the
+    # job in `jobs`, roll index), on-hand first on a tie. The kept jobs keep
+    # their relative order, so `stream` is already sorted by that key and
+    # the new chunks slot in by bisection.
+    pos = {id(j): i for i, j in enumerate(jobs)}
+    def key(e):
+        return (e[0], -1 if e[2] is None else pos[id(e[2])], e[3])
+
+    added = sorted(
+        (
+            (roll.completion_time, roll.lbs, j, i)
+            for j in new_jobs for i, roll in enumerate(j.rolls)
+        ),
+        key=key,
+    )
+    if not added:
+        return len(stream), []
+    first = bisect_right(stream, key(added[0]), key=key)
+    return first, list(merge(stream[first:], added, key=key))
+
 
 class SafetyAwareView:
 
@@ -101,21 +307,23 @@ class SafetyAwareView:
         self._excess: float = 0.0
         self._carrying: float = 0.0
         self._drainage: float = 0.0
-        # Transient simulation state used during recompute. _physical_pool is
-        # the safety pool's actual level at the current sim time (affected by
-        # bucket-2 fills, late-fill refunds, and demand drains). _drained
-        # holds the orders whose due_date has already passed in the sim.
-        self._physical_pool: float = 0.0
-        self._drained: set = set()
+        # Array forms of the orders' due dates (integer microseconds) and
+        # quantities, and of the lead time, for the simulation.
+        self._due_us_list = [_to_us(o.week.due_date) for o in self._orders]
+        self._due_us = np.array(self._due_us_list, dtype=np.int64)
+        self._qtys = [o.week.qty_lbs for o in self._orders]
+        self._lead_us = rls_item.lead_time // _MICROSECOND
         # Safety-replenishment "order" + resolved roll->order fill links.
         self._safety = Safety(rls_item, self)
         self._roll_order_links: list[tuple['Roll', str]] = []
-        # Transient: the roll awaiting its first fill-link during the current
-        # _distribute_chunk (None for the on_hand pseudo-roll, or once linked).
-        self._link_target: 'Roll | None' = None
-        # Transient: the per-window cost-detail sink active during recompute
-        # (set each recompute; None when not collecting detail).
-        self._detail_sink = None
+        # Checkpoints of the latest recompute (see `simulate`): the events
+        # it walked, the simulation state on reaching each (`_marks[i]`
+        # before event i; the last one after them all), and the jobs and
+        # on-hand it ran on.
+        self._events: list[_SafetyEvent] = []
+        self._marks: list[tuple] = []
+        self._basis: tuple['Job', ...] | None = None
+        self._basis_on_hand: float | None = None
 
     @property
     def orders(self) -> tuple[SafetyAwareOrder, ...]:
@@ -158,106 +366,215 @@ class SafetyAwareView:
 
     def recompute(self, jobs: list['Job'], on_hand: float,
                   detail_sink=None) -> None:
+        # The simulation itself runs on a `_SafetySim`'s scratch state; the
+        # view takes over its results once it's done, and keeps the events
+        # walked and the state on reaching each as checkpoints for
+        # `simulate`.
+        sim = _SafetySim(self, detail_sink, keep_links=True)
+        marks: list[tuple] = []
+        self._events = sim.run(jobs, on_hand, marks)
+        self._marks = marks
+        self._basis = tuple(jobs)
+        self._basis_on_hand = on_hand
+        for order, allocated in zip(self._orders, sim.allocated):
+            order.allocated_lbs = allocated
+        self._safety_pool = sim.safety_pool
+        self._excess = sim.excess
+        self._carrying = sim.carrying
+        self._drainage = sim.drainage
+        self._roll_order_links = sim.links
+
+    def simulate(self, jobs: list['Job'], on_hand: float,
+                 detail_sink=None) -> tuple[float, float, float]:
+        """The `(drainage, carrying, excess)` that `recompute(jobs, on_hand,
+        detail_sink)` would leave, without touching the view or its orders.
+        When `jobs` extends the latest recompute's jobs (same on-hand, no
+        detail wanted), the simulation resumes from that run's checkpoint
+        just before the first new roll, so only the events from there on
+        are walked. Safe to call from several threads at once, as long as
+        no `recompute` runs meanwhile."""
+        sim = _SafetySim(self, detail_sink, keep_links=False)
+        if detail_sink is None and on_hand == self._basis_on_hand:
+            if _same_jobs(jobs, self._basis):
+                return self._drainage, self._carrying, self._excess
+            new_jobs = _added_jobs(self._basis, jobs)
+            if new_jobs is not None:
+                first, tail = _merge_events(self._events, jobs, new_jobs)
+                if not tail:
+                    return self._drainage, self._carrying, self._excess
+                sim.resume(
+                    self._marks[first], tail,
+                    self._events[first - 1][0] if first
+                    else self._due_us_list[0],
+                )
+                return sim.drainage, sim.carrying, sim.excess
+        sim.run(jobs, on_hand)
+        return sim.drainage, sim.carrying, sim.excess
+
+
+class _SafetySim:
+    """Scratch state for one `SafetyAwareView` simulation: per-order
+    allocations, the safety pools, the cost trackers and the fill links,
+    kept apart from the view so `simulate` leaves it untouched."""
+
+    __slots__ = (
+        'view', 'orders', 'allocated', 'first_open', 'drained',
+        'safety_target', 'safety_pool', 'physical_pool', 'excess',
+        'carrying', 'drainage', 'links', 'link_target', 'detail_sink',
+    )
+
+    def __init__(self, view: SafetyAwareView, detail_sink,
+                 keep_links: bool) -> None:
+        self.view = view
+        self.orders = view._orders
+        # allocated[i] mirrors orders[i].allocated_lbs; drained[i] marks an
+        # order whose due_date has already passed in the sim.
+        self.allocated = [0.0] * len(self.orders)
+        self.drained = [False] * len(self.orders)
+        # Index of the first order with lbs still to fill (orders only ever
+        # gain lbs, so everything before it stays filled).
+        self.first_open = 0
+        self.safety_target = view.safety_target
+        # safety_pool is the safety "order"'s allocation; physical_pool the
+        # pool's actual level at the current sim time (affected by bucket-2
+        # fills, late-fill refunds, and demand drains).
+        self.safety_pool = 0.0
+        self.physical_pool = 0.0
+        self.excess = 0.0
+        self.carrying = 0.0
+        self.drainage = 0.0
+        # Resolved roll->order fill links (None: not collected), and the roll
+        # awaiting its first fill-link during the current _distribute_chunk
+        # (None for the on_hand pseudo-roll, or once linked).
+        self.links: list[tuple['Roll', str]] | None = [] if keep_links else None
+        self.link_target: 'Roll | None' = None
+        # The per-window cost-detail sink (None when not collecting detail).
+        self.detail_sink = detail_sink
+
+    def run(self, jobs: list['Job'], on_hand: float,
+            marks: list[tuple] | None = None) -> list[_SafetyEvent]:
+        """Simulate `jobs` against `on_hand` from scratch. Returns the
+        events walked, in order; appends the state on reaching each of them
+        (and a last one past the end) to `marks`, when given."""
         # On-hand is processed as a pseudo-job at the first order's due_date
         # (so it's on-time for every order). Roll arrivals are merged into
-        # the event list below and sorted by time, so job order doesn't
+        # the event order below and sorted by time, so job order doesn't
         # matter here.
-        for order in self._orders:
-            order.allocated_lbs = 0.0
-        self._safety_pool = 0.0
-        self._excess = 0.0
-        self._carrying = 0.0
-        self._drainage = 0.0
-        self._physical_pool = 0.0
-        self._drained.clear()
-        self._roll_order_links = []
-        self._link_target = None
-        self._detail_sink = detail_sink            # used by _fill_orders too
-        item_id = self._rls_item.item.id
-
-        first_due = self._orders[0].week.due_date
-        last_due = self._orders[-1].week.due_date
-
-        # Merge chunk arrivals with order drain events. Chunks (priority 0)
-        # fire before drains (priority 1) at the same timestamp — material is
-        # available at the start of the period, demand ships at the end.
-        # Each Job expands into one chunk per `Roll` via `Job.rolls` so the
-        # drainage sim sees fabric arriving as rolls come off the machine.
-        # A Job with no rolls contributes nothing.
-        events: list[tuple[datetime, int, _EventQty]] = [
-            (first_due, 0, ('chunk', on_hand, None))
+        #
+        # Times are integer microseconds. Everything that doesn't depend on
+        # the running pools — event order, the stretch before each event —
+        # is planned up front (see `_plan_events`). The walk itself stays a
+        # loop, accumulating in event order, so the floats match the
+        # per-event arithmetic exactly.
+        due_us = self.view._due_us_list
+
+        # Chunk k: 0 is on-hand, k >= 1 is a roll, in job order. Each Job
+        # expands into one chunk per `Roll` via `Job.rolls` so the drainage
+        # sim sees fabric arriving as rolls come off the machine. A Job with
+        # no rolls contributes nothing.
+        entries: list[_SafetyEvent] = [
+            (due_us[0], 0, None, 0, on_hand, None),
         ]
         for j in jobs:
-            events.extend(
-                (roll.completion_time, 0, ('chunk', roll.lbs, roll))
-                for roll in j.rolls
+            entries.extend(
+                (_to_us(roll.completion_time), 0, j, ri, roll.lbs, roll)
+                for ri, roll in enumerate(j.rolls)
             )
-        events.extend(
-            (order.week.due_date, 1, ('drain', order)) for order in self._orders
+        n_chunks = len(entries)
+        entries.extend(
+            (t, 1, None, i, 0.0, None) for i, t in enumerate(due_us)
+        )
+        order, stretch_days = _plan_events(
+            [e[0] for e in entries[:n_chunks]], due_us, self.view._due_us,
         )
-        events.sort(key=lambda e: (e[0], e[1]))
-
-        # Walk events, accumulating drainage piecewise (constant between
-        # events) up to last_due. Deficits past last_due are not modeled —
-        # the raw view's lateness covers reality from there.
-        last_t = first_due
-        for t, _, ev in events:
-            if t > last_t and last_t < last_due:
-                end_t = min(t, last_due)
-                duration_days = (end_t - last_t).total_seconds() / _SECONDS_PER_DAY
+        events = [entries[k] for k in order]
+        self.walk(events, stretch_days, marks)
+        return events
+
+    def resume(self, mark: tuple, events: list[_SafetyEvent],
+               prev_us: int) -> None:
+        """Continue a simulation from `mark` (a state `run` recorded) over
+        `events`, the previous one having happened at `prev_us`."""
+        (allocated, drained, self.first_open, self.safety_pool,
+         self.physical_pool, self.excess, self.carrying,
+         self.drainage) = mark
+        self.allocated = list(allocated)
+        self.drained = list(drained)
+        self.walk(
+            events,
+            _stretch_days([e[0] for e in events], prev_us,
+                          self.view._due_us_list[-1]),
+        )
+
+    def walk(self, events: list[_SafetyEvent], stretch_days: list[float],
+             marks: list[tuple] | None = None) -> None:
+        """Apply `events` in order, each after the drainage of the
+        `stretch_days` before it, then the stretch to the last due date."""
+        detail_sink = self.detail_sink
+        view = self.view
+        item_id = view._rls_item.item.id
+        due_us = view._due_us_list
+        qtys = view._qtys
+        allocated = self.allocated
+        for days, (t, kind, _, idx, lbs, roll) in zip(stretch_days, events):
+            if marks is not None:
+                marks.append(self.mark())
+            if days > 0:
                 # Cap deficit at safety_target: any over-drain below 0 means
                 # demand exceeded what safety could cover — real shipment
                 # lateness, which the raw view accounts for. We don't
                 # double-count those lbs here.
-                deficit = self.safety_target - max(0.0, self._physical_pool)
-                self._drainage += deficit * duration_days
+                deficit = self.safety_target - max(0.0, self.physical_pool)
+                self.drainage += deficit * days
                 if detail_sink is not None and deficit > 0:
                     # One row per stretch the pool sits below target.
-                    detail_sink('drainage', item_id, duration_days, deficit,
-                                deficit * duration_days)
-
-            if ev[0] == 'chunk':
-                _, available, roll = ev
-                self._distribute_chunk(t, available, roll)
-            else:  # 'drain'
-                order = ev[1]
-                gap = max(0.0, order.week.qty_lbs - order.allocated_lbs)
-                self._physical_pool -= gap
-                self._drained.add(order)
-
-            last_t = t
-
+                    detail_sink('drainage', item_id, days, deficit,
+                                deficit * days)
+
+            if kind == 0:
+                self._distribute_chunk(lbs, roll, bisect_left(due_us, t), t)
+            else:
+                gap = max(0.0, qtys[idx] - allocated[idx])
+                self.physical_pool -= gap
+                self.drained[idx] = True
+        if marks is not None:
+            marks.append(self.mark())
+
+        last_t, last_due = events[-1][0], due_us[-1]
         if last_t < last_due:
-            duration_days = (last_due - last_t).total_seconds() / _SECONDS_PER_DAY
-            deficit = self.safety_target - max(0.0, self._physical_pool)
-            self._drainage += deficit * duration_days
+            days = (last_due - last_t) / 1e6 / _SECONDS_PER_DAY
+            deficit = self.safety_target - max(0.0, self.physical_pool)
+            self.drainage += deficit * days
             if detail_sink is not None and deficit > 0:
-                detail_sink('drainage', item_id, duration_days, deficit,
-                            deficit * duration_days)
+                detail_sink('drainage', item_id, days, deficit,
+                            deficit * days)
 
         # Excess has no time dimension: one aggregate row (days = None).
-        if detail_sink is not None and self._excess > 0:
-            detail_sink('excess', item_id, None, self._excess, self._excess)
+        if detail_sink is not None and self.excess > 0:
+            detail_sink('excess', item_id, None, self.excess, self.excess)
+
+    def mark(self) -> tuple:
+        """The simulation state, as `resume` takes it back."""
+        return (
+            tuple(self.allocated), tuple(self.drained), self.first_open,
+            self.safety_pool, self.physical_pool, self.excess,
+            self.carrying, self.drainage,
+        )
 
     def _distribute_chunk(
-        self, avail_time: datetime, available: float,
-        roll: 'Roll | None' = None,
+        self, available: float, roll: 'Roll | None', on_time_idx: int,
+        chunk_us: int,
     ) -> None:
         # Record the first destination this roll's lbs reach as its fill-link
         # (see "Roll → order fill links" in DESIGN.md). The on_hand pseudo-roll
         # has no Roll, so it never links. `_fill_orders` / `_refill_safety`
-        # consume `_link_target` on their first positive take, so any later
-        # destination for the same roll is left unlinked.
-        self._link_target = roll
-
-        # Find earliest on-time order (smallest index whose due_date >= avail_time).
-        on_time_idx: int | None = None
-        for i, order in enumerate(self._orders):
-            if order.week.due_date >= avail_time:
-                on_time_idx = i
-                break
-
-        if on_time_idx is not None:
+        # consume `link_target` on their first positive take, so any later
+        # destination for the same roll is left unlinked. Without `links`
+        # nothing is linked.
+        self.link_target = roll if self.links is not None else None
+        n_orders = len(self.orders)
+
+        if on_time_idx < n_orders:
             # Bucket 1: cumulative unfilled demand across orders 0..on_time_idx,
             # earliest-first (late orders before the on-time one are paid down
             # first; this matches reality where material catches up missed
@@ -271,73 +588,166 @@ class SafetyAwareView:
             # on any lbs held longer than lead_time before the order's due
             # date.
             available = self._fill_orders(
-                on_time_idx + 1, len(self._orders), available, chunk_time=avail_time,
+                on_time_idx + 1, n_orders, available, chunk_us=chunk_us,
             )
         else:
             # Job late to every order: bucket 1 spans all orders (earliest
             # first), bucket 3 is empty, bucket 2 still applies. Nothing
             # contributes to carrying.
-            available = self._fill_orders(0, len(self._orders), available)
+            available = self._fill_orders(0, n_orders, available)
             available = self._refill_safety(available)
 
         # Bucket 4: anything still left over after demand + safety is excess.
         if available > 0:
-            self._excess += available
+            self.excess += available
 
     def _fill_orders(
         self,
         start_idx: int,
         end_idx: int,
         available: float,
-        chunk_time: datetime | None = None,
+        chunk_us: int | None = None,
     ) -> float:
-        # When chunk_time is supplied, this fill is treated as a bucket-3
-        # pass: lbs held from chunk_time to order.due_date beyond lead_time
-        # accrue carrying. When chunk_time is None (buckets 1 and the
+        # When chunk_us is supplied, this fill is treated as a bucket-3
+        # pass: lbs held from chunk_us to order.due_date beyond lead_time
+        # accrue carrying. When chunk_us is None (buckets 1 and the
         # late-to-all bucket 1), no carrying is recorded.
-        for i in range(start_idx, end_idx):
+        view = self.view
+        qtys = view._qtys
+        allocated = self.allocated
+        # Orders before `first_open` are filled: they'd take nothing.
+        for i in range(max(start_idx, self.first_open), end_idx):
             if available <= 0:
                 return available
-            order = self._orders[i]
-            take = min(order.remaining_lbs, available)
-            order.allocated_lbs += take
-            if take > 0:
-                self._link_roll(order.id)
-                # Late fills (bucket 1 lbs going to an order that has already
-                # drained) refund the safety that covered the order earlier.
-                if order in self._drained:
-                    self._physical_pool += take
-                if chunk_time is not None:
-                    hold = order.week.due_date - chunk_time
-                    beyond_lead = max(timedelta(0), hold - self.lead_time)
-                    beyond_lead_days = (
-                        beyond_lead.total_seconds() / _SECONDS_PER_DAY
+            remaining = qtys[i] - allocated[i]
+            if remaining <= 0:
+                if i == self.first_open:
+                    self.first_open += 1
+                continue
+            take = remaining if remaining < available else available
+            allocated[i] += take
+            self._link_roll(self.orders[i].id)
+            # Late fills (bucket 1 lbs going to an order that has already
+            # drained) refund the safety that covered the order earlier.
+            if self.drained[i]:
+                self.physical_pool += take
+            if chunk_us is not None:
+                beyond_lead = view._due_us_list[i] - chunk_us - view._lead_us
+                beyond_lead_days = (
+                    beyond_lead / 1e6 / _SECONDS_PER_DAY
+                    if beyond_lead > 0 else 0.0
+                )
+                self.carrying += take * beyond_lead_days
+                if self.detail_sink is not None and beyond_lead_days > 0:
+                    # One row per fill held beyond lead time.
+                    self.detail_sink(
+                        'carrying', view._rls_item.item.id,
+                        beyond_lead_days, take, take * beyond_lead_days,
                     )
-                    self._carrying += take * beyond_lead_days
-                    if self._detail_sink is not None and beyond_lead_days > 0:
-                        # One row per fill held beyond lead time.
-                        self._detail_sink(
-                            'carrying', self._rls_item.item.id,
-                            beyond_lead_days, take, take * beyond_lead_days,
-                        )
             available -= take
         return available
 
     def _refill_safety(self, available: float) -> float:
         if available <= 0:
             return 0.0
-        room = max(0.0, self.safety_target - self._safety_pool)
+        room = max(0.0, self.safety_target - self.safety_pool)
         take = min(room, available)
         if take > 0:
-            self._link_roll(self._safety.id)
-        self._safety_pool += take
-        self._physical_pool += take
+            self._link_roll(self.view._safety.id)
+        self.safety_pool += take
+        self.physical_pool += take
         return available - take
 
     def _link_roll(self, order_id: str) -> None:
         """Record the current chunk's roll as filling `order_id` — but only
         the first destination it reaches (and never the on_hand pseudo-roll).
-        Consumes `_link_target` so later buckets for the same roll no-op."""
-        if self._link_target is not None:
-            self._roll_order_links.append((self._link_target, order_id))
-            self._link_target = None
+        Consumes `link_target` so later buckets for the same roll no-op."""
+        if self.link_target is not None:
+            self.links.append((self.link_target, order_id))
+            self.link_target = None
+
+
+# Simulations with at least this many chunks plan their events with NumPy;
+# below it the array calls cost more than they save.
+_ARRAY_MIN_CHUNKS = 48
+
+
+def _plan_events(
+    chunk_us: list[int], due_us: list[int], due_arr: np.ndarray,
+) -> tuple[list[int], list[float]]:
+    """The event plan of a `SafetyAwareView` simulation over chunks arriving
+    at `chunk_us` and orders due at `due_us` (`due_arr` as an array).
+
+    Event `k` is chunk `k` for `k < len(chunk_us)`, else the drain of order
+    `k - len(chunk_us)`. Returns the events in time order (a chunk before a
+    drain at the same time, ties otherwise in index order) and the days of
+    the drainage stretch ending at each (0.0 for none). Large simulations
+    are planned on arrays; both ways give the same floats."""
+    n_chunks = len(chunk_us)
+    first_due, last_due = due_us[0], due_us[-1]
+    if n_chunks >= _ARRAY_MIN_CHUNKS:
+        event_us = np.concatenate((np.array(chunk_us, dtype=np.int64), due_arr))
+        drain_flag = np.zeros(len(event_us), dtype=np.int64)
+        drain_flag[n_chunks:] = 1
+        events = np.argsort(event_us * 2 + drain_flag, kind='stable')
+        times = event_us[events]
+        prev = np.empty_like(times)
+        prev[0] = first_due
+        prev[1:] = times[:-1]
+        stretch = np.where(
+            (times > prev) & (prev < last_due),
+            np.minimum(times, last_due) - prev, 0,
+        )
+        return events.tolist(), (stretch / 1e6 / _SECONDS_PER_DAY).tolist()
+
+    event_us = chunk_us + due_us
+    keys = [t * 2 for t in chunk_us] + [t * 2 + 1 for t in due_us]
+    events = sorted(range(len(keys)), key=keys.__getitem__)
+    return events, _stretch_days(
+        [event_us[k] for k in events], first_due, last_due,
+    )
+
+
+def _stretch_days(times: list[int], prev: int, last_due: int) -> list[float]:
+    """The days of the drainage stretch ending at each of `times` (in
+    order, the one before at `prev`), cut off at `last_due`."""
+    stretch_days = []
+    for t in times:
+        if t > prev and prev < last_due:
+            stretch_days.append(
+                ((t if t < last_due else last_due) - prev)
+                / 1e6 / _SECONDS_PER_DAY
+            )
+        else:
+            stretch_days.append(0.0)
+        prev = t
+    return stretch_days
+
+
+def _merge_events(
+    events: list[_SafetyEvent], jobs: list['Job'], new_jobs: list['Job'],
+) -> tuple[int, list[_SafetyEvent]]:
+    """Merge `new_jobs`' rolls into `events` — a run over the other jobs of
+    `jobs` — in the order `_SafetySim.run` would walk them. Returns the
+    index of the first new event and the merged events from there on;
+    `(len(events), [])` when the new jobs have no rolls."""
+    # The full run orders events by (time, chunk before drain, chunk index),
+    # and chunk index follows (position of the job in `jobs`, roll index),
+    # on-hand first. Drains are ordered by order index.
+    pos = {id(j): i for i, j in enumerate(jobs)}
+    def key(e):
+        if e[1]:
+            return (e[0], 1, e[3], 0)
+        return (e[0], 0, -1 if e[2] is None else pos[id(e[2])], e[3])
+
+    added = sorted(
+        (
+            (_to_us(roll.completion_time), 0, j, ri, roll.lbs, roll)
+            for j in new_jobs for ri, roll in enumerate(j.rolls)
+        ),
+        key=key,
+    )
+    if not added:
+        return len(events), []
+    first = bisect_right(events, key(added[0]), key=key)
+    return first, list(merge(events[first:], added, key=key))
@@ -1,13 +1,14 @@
 from .state import Move, State
 from .costing import CostWeights, Costing
 from .coordination import (
-    OrderKey, RegularOrder, SafetyOrder, ScoringContext,
-    eligible_orders, assign_priorities,
+    OrderKey, RegularOrder, SafetyOrder, OrderBook, ScoringContext,
+    eligible_orders, assign_priorities, build_order_book,
 )
 from .loop import (
-    DecisionPoint,
-    eligible_decision_points, enumerate_candidates,
-    PlanReport, plan,
+    CandidatePool, DecisionPoint,
+    eligible_decision_points, enumerate_candidates, next_decision_time,
+    PlanReport, plan, ScoringPool, ThreadScoringPool, Checkpoint,
+    PhaseStats, PhaseTimer,
 )
 from .report import (
     schedule_dataframe, production_dataframe, unmet_demand_dataframe,
@@ -18,11 +19,12 @@ from .run import run
 
 __all__ = [
     'Move', 'State', 'CostWeights', 'Costing',
-    'OrderKey', 'RegularOrder', 'SafetyOrder', 'ScoringContext',
-    'eligible_orders', 'assign_priorities',
-    'DecisionPoint',
-    'eligible_decision_points', 'enumerate_candidates',
-    'PlanReport', 'plan',
+    'OrderKey', 'RegularOrder', 'SafetyOrder', 'OrderBook', 'ScoringContext',
+    'eligible_orders', 'assign_priorities', 'build_order_book',
+    'CandidatePool', 'DecisionPoint',
+    'eligible_decision_points', 'enumerate_candidates', 'next_decision_time',
+    'PlanReport', 'plan', 'ScoringPool', 'ThreadScoringPool', 'Checkpoint',
+    'PhaseStats', 'PhaseTimer',
     'schedule_dataframe', 'production_dataframe', 'unmet_demand_dataframe',
     'late_orders_dataframe',
     'write_plan_report_xlsx', 'run',
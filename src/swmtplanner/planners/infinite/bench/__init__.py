@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+
+"""`bench` — synthetic-plant benchmarks for the planner: generate inputs at
+a chosen scale (`synthetic`) and time `plan` over them (`runner`). Run as
+`python -m swmtplanner.planners.infinite.bench`. See
+`planners/infinite/DESIGN.md`."""
+
+from .synthetic import (
+    BENCH_WEIGHTS, PlantSpec, synthetic_config, synthetic_state,
+)
+from .runner import BenchResult, run_benchmark, run_suite
+
+__all__ = [
+    'BENCH_WEIGHTS', 'PlantSpec', 'synthetic_config', 'synthetic_state',
+    'BenchResult', 'run_benchmark', 'run_suite',
+]
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Literal
+
+from swmtplanner.planners.infinite.state import State
+
+__all__ = [
+    'BENCH_WEIGHTS', 'PlantSpec', 'synthetic_config', 'synthetic_state',
+    'BenchResult', 'run_benchmark', 'run_suite',
+]
+
+BenchPath = Literal['hot', 'debug']
+WorkerMode = Literal['process', 'thread']
+
+BENCH_WEIGHTS: dict[str, float]
+
+
+@dataclass(frozen=True)
+class PlantSpec:
+    n_machines: int = ...
+    n_items: int = ...
+    n_weeks: int = ...
+    seed: int = ...
+    new_machine_share: float = ...
+    start_date: datetime = ...
+    @property
+    def label(self) -> str: ...
+
+
+def synthetic_config(spec: PlantSpec) -> dict[str, Any]: ...
+def synthetic_state(spec: PlantSpec, **state_cfg) -> State: ...
+
+
+@dataclass
+class BenchResult:
+    scale: str
+    seed: int
+    path: BenchPath
+    workers: int
+    worker_mode: WorkerMode
+    moves: int
+    runtime_s: float
+    moves_per_s: float
+    iteration_ms: float
+    peak_rss_mb: float | None
+    n_records: int
+    record_mb: float
+    phases: dict
+    def to_dict(self) -> dict: ...
+
+
+def run_benchmark(
+    spec: PlantSpec, *, path: BenchPath = ..., workers: int = ...,
+    worker_mode: WorkerMode = ...,
+) -> BenchResult: ...
+def run_suite(
+    specs: Iterable[PlantSpec], *,
+    paths: Iterable[BenchPath] = ..., workers: int = ...,
+    worker_mode: WorkerMode = ..., isolate: bool = ...,
+) -> list[BenchResult]: ...
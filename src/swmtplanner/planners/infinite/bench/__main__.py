@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""Synthetic-plant benchmark for the infinite planner.
+
+    python -m swmtplanner.planners.infinite.bench \\
+        [--scale 20x60x8 ...] [--seed 0] [--path hot|debug ...]
+        [--workers N [--threads]] [--no-isolate] [--output results.json]
+        [--dump-config DIR]
+
+Runs offline — nothing is read from or written to a database. See
+"Benchmarks" in `planners/infinite/DESIGN.md`."""
+
+import json
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from .runner import run_suite
+from .synthetic import PlantSpec, synthetic_config
+
+
+_Scale = Annotated[list[str] | None, typer.Option(
+    '--scale', '-s',
+    help='Plant size as MACHINESxITEMSxWEEKS, e.g. 20x60x8. Repeat for a '
+         'scaling curve. Defaults to 20x60x8.',
+)]
+_Seed = Annotated[int, typer.Option(
+    '--seed', help='Seed of the synthetic inputs.',
+)]
+_Path = Annotated[list[str] | None, typer.Option(
+    '--path', '-p',
+    help='Planner path to time: hot or debug (the DebugLog path). Repeat '
+         'for both; defaults to both.',
+)]
+_Workers = Annotated[int, typer.Option(
+    '--workers', '-j', min=0,
+    help='Planner worker processes (hot path only), as for the planner.',
+)]
+_Threads = Annotated[bool, typer.Option(
+    '--threads',
+    help='Score on --workers threads instead of processes, as for the '
+         'planner.',
+)]
+_NoIsolate = Annotated[bool, typer.Option(
+    '--no-isolate',
+    help='Run every case in this process instead of a fresh one each '
+         '(peak RSS then becomes a running maximum).',
+)]
+_Output = Annotated[Path | None, typer.Option(
+    '--output', '-o', dir_okay=False,
+    help='Write the JSON results here instead of to stdout.',
+)]
+_DumpConfig = Annotated[Path | None, typer.Option(
+    '--dump-config', file_okay=False,
+    help='Also write each scale\'s generated run config to '
+         'DIR/synthetic_<scale>_s<seed>.json (usable with `plan infinite`).',
+)]
+
+
+def main(
+    scale: _Scale = None,
+    seed: _Seed = 0,
+    path: _Path = None,
+    workers: _Workers = 0,
+    threads: _Threads = False,
+    no_isolate: _NoIsolate = False,
+    output: _Output = None,
+    dump_config: _DumpConfig = None,
+) -> None:
+    """Time `plan` over synthetic plants and print (or write) the results
+    as JSON."""
+    specs = [_parse_scale(s, seed) for s in (scale or ['20x60x8'])]
+    paths = path or ['hot', 'debug']
+    for p in paths:
+        if p not in ('hot', 'debug'):
+            raise typer.BadParameter(
+                f"must be 'hot' or 'debug', got {p!r}", param_hint='--path',
+            )
+
+    if dump_config is not None:
+        dump_config.mkdir(parents=True, exist_ok=True)
+        for spec in specs:
+            target = dump_config / f'synthetic_{spec.label}_s{spec.seed}.json'
+            target.write_text(json.dumps(synthetic_config(spec), indent=2))
+            typer.echo(f'wrote {target}', err=True)
+
+    results = []
+    for spec in specs:
+        for p in paths:
+            typer.echo(f'running {spec.label} ({p})...', err=True)
+            [result] = run_suite(
+                [spec], paths=[p], workers=workers,
+                worker_mode='thread' if threads else 'process',
+                isolate=not no_isolate,
+            )
+            typer.echo(
+                f'  {result.moves} moves in {result.runtime_s:.2f}s '
+                f'({result.moves_per_s:.1f} moves/s)',
+                err=True,
+            )
+            results.append(result.to_dict())
+
+    doc = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    text = json.dumps(doc, indent=2)
+    if output is None:
+        typer.echo(text)
+    else:
+        output.write_text(text)
+        typer.echo(f'wrote {output}', err=True)
+
+
+def _parse_scale(value: str, seed: int) -> PlantSpec:
+    try:
+        n_machines, n_items, n_weeks = (int(x) for x in value.split('x'))
+        return PlantSpec(
+            n_machines=n_machines, n_items=n_items, n_weeks=n_weeks,
+            seed=seed,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(
+            f'expected MACHINESxITEMSxWEEKS (positive ints), got {value!r}: '
+            f'{exc}',
+            param_hint='--scale',
+        )
+
+
+if __name__ == '__main__':
+    typer.run(main)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+import contextlib
+import io
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Iterable, Literal, TYPE_CHECKING
+
+from swmtplanner.planners.infinite.costing import Costing, CostWeights
+from swmtplanner.planners.infinite.loop import PhaseTimer, plan
+
+from .synthetic import BENCH_WEIGHTS, PlantSpec, synthetic_state
+
+if TYPE_CHECKING:
+    from swmtplanner.planners.infinite.state import State
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+BenchPath = Literal['hot', 'debug']
+WorkerMode = Literal['process', 'thread']
+
+
+@dataclass
+class BenchResult:
+    """One timed `plan` run over a synthetic plant. `moves` is the number
+    of committed moves (= loop iterations that placed something);
+    `iteration_ms` is the loop time per move (the run less building the
+    final report). `peak_rss_mb` is the peak resident set size of the
+    process that ran it (`None` where the platform can't report it) — so
+    it is per-run only when the run had a process to itself (see
+    `run_suite`). `record_mb` is the memory held by the final schedule's
+    `Job`, `Roll` and `Activity` records (`n_records` of them). `phases` is
+    the run's `PhaseTimer.to_dict()['phases']`."""
+    scale: str
+    seed: int
+    path: BenchPath
+    workers: int
+    worker_mode: WorkerMode
+    moves: int
+    runtime_s: float
+    moves_per_s: float
+    iteration_ms: float
+    peak_rss_mb: float | None
+    n_records: int
+    record_mb: float
+    phases: dict
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def run_benchmark(
+    spec: PlantSpec, *, path: BenchPath = 'hot', workers: int = 0,
+    worker_mode: WorkerMode = 'process',
+) -> BenchResult:
+    """Build the plant `spec` describes and time one `plan` run over it,
+    on the hot path or with a live `DebugLog` (`path='debug'`). Building
+    the inputs is not timed; the planner's progress output is
+    suppressed."""
+    if path not in ('hot', 'debug'):
+        raise ValueError(f"path must be 'hot' or 'debug', got {path!r}")
+    state = synthetic_state(spec)
+    costing = Costing(CostWeights(**BENCH_WEIGHTS))
+    debuglog = None
+    if path == 'debug':
+        # Deferred: run.py pulls in the CLI stack.
+        from swmtplanner.planners.infinite.run import _build_debug_log
+        debuglog = _build_debug_log()
+
+    timer = PhaseTimer()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        plan(
+            state, costing, debuglog=debuglog, workers=workers,
+            worker_mode=worker_mode, timer=timer,
+        )
+    runtime = time.perf_counter() - t0
+
+    n_records, record_bytes = _record_footprint(state)
+    stats = timer.stats
+    moves = stats['commit'].count if 'commit' in stats else 0
+    loop_s = runtime - stats['report'].total_ns / 1e9
+    return BenchResult(
+        scale=spec.label,
+        seed=spec.seed,
+        path=path,
+        workers=workers,
+        worker_mode=worker_mode,
+        moves=moves,
+        runtime_s=runtime,
+        moves_per_s=moves / runtime if runtime > 0 else 0.0,
+        iteration_ms=loop_s * 1e3 / moves if moves else 0.0,
+        peak_rss_mb=_peak_rss_mb(),
+        n_records=n_records,
+        record_mb=record_bytes / 2**20,
+        phases=timer.to_dict()['phases'],
+    )
+
+
+def run_suite(
+    specs: Iterable[PlantSpec], *,
+    paths: Iterable[BenchPath] = ('hot', 'debug'), workers: int = 0,
+    worker_mode: WorkerMode = 'process', isolate: bool = True,
+) -> list[BenchResult]:
+    """`run_benchmark` for every spec × path, in order. With `isolate`
+    (the default) each run gets a fresh interpreter, so its
+    `peak_rss_mb` is its own and no run warms caches for the next; without
+    it the runs share this process and `peak_rss_mb` is a running
+    maximum."""
+    paths = tuple(paths)
+    results = []
+    for spec in specs:
+        for path in paths:
+            if not isolate:
+                results.append(run_benchmark(
+                    spec, path=path, workers=workers,
+                    worker_mode=worker_mode,
+                ))
+                continue
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as ex:
+                results.append(ex.submit(
+                    run_benchmark, spec, path=path, workers=workers,
+                    worker_mode=worker_mode,
+                ).result())
+    return results
+
+
+def _record_footprint(state: 'State') -> tuple[int, int]:
+    """`(count, bytes)` of the `Job`, `Roll` and `Activity` records on
+    `state`'s machines: each record's own size plus its instance `__dict__`,
+    if it has one. The objects they point at (items, beams, times) are
+    shared or small, and not counted."""
+    records = []
+    for machine in state.machines.values():
+        records.extend(machine.activities)
+        for job in machine.jobs:
+            records.append(job)
+            records.extend(job.rolls)
+    size = 0
+    for record in records:
+        size += sys.getsizeof(record)
+        if hasattr(record, '__dict__'):
+            size += sys.getsizeof(record.__dict__)
+    return len(records), size
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak RSS of this process in MiB (`ru_maxrss` is KiB on Linux,
+    bytes on macOS)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / 2**20
+    return peak / 2**10
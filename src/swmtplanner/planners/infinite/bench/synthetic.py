@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from swmtplanner.products import greige_styles_from_list
+from swmtplanner.demand import rls_items_from_list
+from swmtplanner.schedule import machines_from_list
+from swmtplanner.support import workcal_from_dict
+
+from swmtplanner.planners.infinite.state import State
+
+
+# Plant-wide calendar of the synthetic plant: two shifts, Monday–Friday,
+# with the usual US holidays.
+_WORK_DAYS = [0, 1, 2, 3, 4]
+_DAY_START, _DAY_END = 6, 22
+_HOLIDAYS = [
+    {'kind': 'fixed', 'name': "New Year's Day", 'month': 1, 'day': 1},
+    {'kind': 'flex', 'name': 'Memorial Day', 'month': 5, 'weekday': 0,
+     'n': -1},
+    {'kind': 'fixed', 'name': 'Independence Day', 'month': 7, 'day': 4},
+    {'kind': 'flex', 'name': 'Labor Day', 'month': 9, 'weekday': 0, 'n': 1},
+    {'kind': 'flex', 'name': 'Thanksgiving', 'month': 11, 'weekday': 3,
+     'n': 4},
+    {'kind': 'fixed', 'name': 'Christmas Day', 'month': 12, 'day': 25},
+]
+
+# Yarn vocabulary for beam ids (`<denier>D <desc> <ends>X<spools>[ S/L]`).
+_DENIERS = [20, 30, 40, 55, 70, 90]
+_COLORS = ['BLACK', 'WHITE', 'NATURAL', 'NAVY', 'RED', 'GREY']
+_ENDS = [(1000, 4), (1172, 4), (1360, 6)]
+
+# Cost weights the benchmark scores with: every term switched on, at
+# magnitudes in the range the production configs use.
+BENCH_WEIGHTS: dict[str, float] = {
+    'lateness': 5.0, 'drainage': 0.02, 'carrying': 0.01, 'excess': 0.3,
+    'tape_out_single': 50.0, 'tape_out_both': 80.0, 'style_change': 10.0,
+    'runner_change': 30.0, 'pattern_change': 60.0, 'idle_time': 2.0,
+    'waste_lbs': 0.5, 'priority': 0.001, 'level_loading': 1.0,
+    'old_machine': 20.0,
+}
+
+
+@dataclass(frozen=True)
+class PlantSpec:
+    """Scale and seed of a synthetic plant. Items are grouped into
+    families (about ten items each) that share most of their yarn, so
+    within-family transitions are cheap and cross-family ones need beam
+    work, as on the real floor. `new_machine_share` of the machines are
+    `is_new`. The same spec always generates the same plant."""
+    n_machines: int = 20
+    n_items: int = 60
+    n_weeks: int = 8
+    seed: int = 0
+    new_machine_share: float = 0.3
+    start_date: datetime = datetime(2026, 1, 5)
+
+    def __post_init__(self) -> None:
+        for name in ('n_machines', 'n_items', 'n_weeks'):
+            if getattr(self, name) < 1:
+                raise ValueError(
+                    f'{name} must be >= 1, got {getattr(self, name)}'
+                )
+        if not 0 <= self.new_machine_share <= 1:
+            raise ValueError(
+                f'new_machine_share must be in [0, 1], got '
+                f'{self.new_machine_share}'
+            )
+
+    @property
+    def label(self) -> str:
+        """`<machines>x<items>x<weeks>`, the CLI's `--scale` syntax."""
+        return f'{self.n_machines}x{self.n_items}x{self.n_weeks}'
+
+
+def synthetic_config(spec: PlantSpec) -> dict[str, Any]:
+    """A complete, all-inline run config (the `plan infinite` config
+    shape: `start_date`, `weights`, `products`, `workcal`, `machines`,
+    `demand`) for the plant `spec` describes. JSON-serializable, so it can
+    be written out and fed to the CLI as-is."""
+    rng = random.Random(spec.seed)
+    machine_ids = [f'M{i:03}' for i in range(1, spec.n_machines + 1)]
+    yarns = _yarn_pool(rng, max(4, spec.n_items // 4))
+
+    n_families = max(1, round(spec.n_items / 10))
+    families = [chr(ord('A') + i % 26) * (1 + i // 26) for i in range(n_families)]
+    # Each family has a home yarn on one bar and a home group of machines.
+    family_yarn = {fam: rng.choice(yarns) for fam in families}
+    family_machines = {
+        fam: rng.sample(
+            machine_ids, max(1, min(len(machine_ids), len(machine_ids) // 3 + 1)),
+        )
+        for fam in families
+    }
+
+    products = []
+    for i in range(spec.n_items):
+        fam = families[i % n_families]
+        home = family_yarn[fam]
+        other = rng.choice([y for y in yarns if y != home] or yarns)
+        top, btm = (home, other) if rng.random() < 0.5 else (other, home)
+        top_pct = rng.choice([0.3, 0.4, 0.5, 0.6, 0.7])
+        tgt_wt = rng.choice([100.0, 200.0, 350.0, 500.0])
+        runs_on = set(rng.sample(
+            family_machines[fam],
+            rng.randint(1, len(family_machines[fam])),
+        ))
+        # A few items also run outside their family's machines.
+        if rng.random() < 0.2:
+            runs_on.add(rng.choice(machine_ids))
+        products.append({
+            'id': f'G{i:04}',
+            'family': fam,
+            'tgt_wt': tgt_wt,
+            'top_beam': top, 'top_pct': top_pct,
+            'btm_beam': btm, 'btm_pct': round(1 - top_pct, 2),
+            'safety': tgt_wt * rng.choice([0, 0, 1, 2, 4]),
+            'machines': [
+                {'id': m, 'rate': round(rng.uniform(40.0, 90.0), 1)}
+                for m in sorted(runs_on)
+            ],
+        })
+
+    runnable: dict[str, list[str]] = {m: [] for m in machine_ids}
+    for p in products:
+        for m in p['machines']:
+            runnable[m['id']].append(p['id'])
+    machines = [
+        {
+            'id': m,
+            'init_item': rng.choice(runnable[m] or [p['id'] for p in products]),
+            'init_top_lbs': round(rng.uniform(200.0, 3000.0), 1),
+            'init_btm_lbs': round(rng.uniform(200.0, 2000.0), 1),
+            'is_new': rng.random() < spec.new_machine_share,
+        }
+        for m in machine_ids
+    ]
+
+    # Quantities are whole rolls: the planner only places whole rolls, so
+    # an order left with a sub-roll remainder would never be filled and
+    # would hold back the item's later weeks.
+    demand = []
+    for p in products:
+        wt = p['tgt_wt']
+        base = rng.choice([1, 2, 4, 8])
+        demand.append({
+            'item_id': p['id'],
+            'on_hand': wt * rng.choice([0, 1, 2, 4]),
+            'lead_time_days': rng.choice([3, 7, 10, 14]),
+            # Lumpy weekly demand: some weeks empty, others around `base`
+            # rolls.
+            'weekly_dmnd': [
+                0.0 if rng.random() < 0.35
+                else wt * max(1, round(base * rng.uniform(0.5, 1.5)))
+                for _ in range(spec.n_weeks)
+            ],
+        })
+
+    return {
+        'start_date': spec.start_date.strftime('%Y-%m-%d'),
+        'weights': dict(BENCH_WEIGHTS),
+        'products': products,
+        'workcal': {
+            'work_days': list(_WORK_DAYS),
+            'day_start': _DAY_START, 'day_end': _DAY_END,
+            'holidays': list(_HOLIDAYS),
+        },
+        'machines': machines,
+        'demand': demand,
+    }
+
+
+def synthetic_state(spec: PlantSpec, **state_cfg) -> State:
+    """A fresh `State` over the plant `spec` describes, built from
+    `synthetic_config` through the same loaders the CLI uses. `state_cfg`
+    is passed through to `State` (its tuning knobs)."""
+    cfg = synthetic_config(spec)
+    start = datetime.strptime(cfg['start_date'], '%Y-%m-%d')
+    greige_by_id = greige_styles_from_list(cfg['products'])
+    workcal = workcal_from_dict(cfg['workcal'])
+    machines = machines_from_list(
+        cfg['machines'], start_date=start, workcal=workcal,
+        greige_by_id=greige_by_id,
+    )
+    rls_items = rls_items_from_list(
+        cfg['demand'], start_date=start, greige_by_id=greige_by_id,
+    )
+    return State(
+        machines=machines, rls_items=rls_items,
+        start_date=start, window_end=start, **state_cfg,
+    )
+
+
+def _yarn_pool(rng: random.Random, n: int) -> list[str]:
+    """`n` distinct beam ids."""
+    pool: set[str] = set()
+    while len(pool) < n:
+        ends, spools = rng.choice(_ENDS)
+        yarn = (
+            f'{rng.choice(_DENIERS)}D {rng.choice(_COLORS)} {ends}X{spools}'
+        )
+        if rng.random() < 0.15:
+            yarn += ' S/L'
+        pool.add(yarn)
+    return sorted(pool)
@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 
 from .coordination import (
-    OrderKey, RegularOrder, SafetyOrder, ScoringContext,
-    eligible_orders, assign_priorities,
-    build_new_machine_avail, build_earliest_dp_excluding, build_context,
+    OrderKey, RegularOrder, SafetyOrder, OrderBook, ScoringContext,
+    eligible_orders, assign_priorities, build_order_book,
+    build_new_machine_avail, build_earliest_dp_excluding,
+    deferral_cost, build_priority_prefix, CandidateSummary,
+    summarize_candidates, merge_summaries, build_context,
+    build_context_from_summary,
 )
 
 __all__ = [
-    'OrderKey', 'RegularOrder', 'SafetyOrder', 'ScoringContext',
-    'eligible_orders', 'assign_priorities',
-    'build_new_machine_avail', 'build_earliest_dp_excluding', 'build_context',
+    'OrderKey', 'RegularOrder', 'SafetyOrder', 'OrderBook', 'ScoringContext',
+    'eligible_orders', 'assign_priorities', 'build_order_book',
+    'build_new_machine_avail', 'build_earliest_dp_excluding',
+    'deferral_cost', 'build_priority_prefix', 'CandidateSummary',
+    'summarize_candidates', 'merge_summaries', 'build_context',
+    'build_context_from_summary',
 ]
@@ -5,9 +5,12 @@ from swmtplanner.products import Greige
 from swmtplanner.planners.infinite.state import Move, State
 
 __all__ = [
-    'OrderKey', 'RegularOrder', 'SafetyOrder', 'ScoringContext',
-    'eligible_orders', 'assign_priorities',
-    'build_new_machine_avail', 'build_earliest_dp_excluding', 'build_context',
+    'OrderKey', 'RegularOrder', 'SafetyOrder', 'OrderBook', 'ScoringContext',
+    'eligible_orders', 'assign_priorities', 'build_order_book',
+    'build_new_machine_avail', 'build_earliest_dp_excluding',
+    'deferral_cost', 'build_priority_prefix', 'CandidateSummary',
+    'summarize_candidates', 'merge_summaries', 'build_context',
+    'build_context_from_summary',
 ]
 
 
@@ -33,6 +36,16 @@ class SafetyOrder:
     order_id: str
 
 
+@dataclass(frozen=True)
+class OrderBook:
+    orders: tuple[RegularOrder | SafetyOrder, ...]
+    keys: tuple[OrderKey, ...]
+    priorities: dict[OrderKey, int]
+    regular_orders_by_key: dict[OrderKey, RegularOrder]
+    relative_safety: dict[str, float]
+    reference_week_idx: int
+
+
 @dataclass(frozen=True)
 class ScoringContext:
     priorities: dict[OrderKey, int]
@@ -40,16 +53,46 @@ class ScoringContext:
     earliest_dp_excluding: dict[str, datetime]
     earliest_dp_time: datetime
     new_machine_avail: dict[Greige, bool]
+    order_book: OrderBook | None = ...
+    priority_prefix: dict[datetime, tuple[float, ...]] | None = ...
 
 
 def eligible_orders(state: State) -> list[RegularOrder | SafetyOrder]: ...
 def assign_priorities(state: State) -> dict[OrderKey, int]: ...
+def build_order_book(state: State) -> OrderBook: ...
 def build_new_machine_avail(
     state: State, candidates: list[Move],
 ) -> dict[Greige, bool]: ...
 def build_earliest_dp_excluding(
     state: State, candidates: list[Move],
 ) -> dict[str, datetime]: ...
+def deferral_cost(
+    order: RegularOrder, other_dp: datetime,
+) -> tuple[float, float]: ...
+def build_priority_prefix(
+    priorities: dict[OrderKey, int],
+    regular_orders_by_key: dict[OrderKey, RegularOrder],
+    reach: dict[datetime, int],
+) -> dict[datetime, tuple[float, ...]]: ...
+
+
+@dataclass(frozen=True)
+class CandidateSummary:
+    n_candidates: int
+    earliest_dp: dict[str, datetime]
+    worst_rank: dict[str, int]
+    new_machine_avail: dict[str, bool]
+
+
+def summarize_candidates(
+    state: State, candidates: list[Move], book: OrderBook,
+) -> CandidateSummary: ...
+def merge_summaries(
+    summaries: list[CandidateSummary],
+) -> CandidateSummary: ...
 def build_context(
-    state: State, candidates: list[Move],
+    state: State, candidates: list[Move], book: OrderBook | None = ...,
+) -> ScoringContext: ...
+def build_context_from_summary(
+    state: State, summary: CandidateSummary, book: OrderBook,
 ) -> ScoringContext: ...
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from swmtplanner.demand.order import SafetyAwareOrder
+    from swmtplanner.demand.rlsitem import RlsItem
     from swmtplanner.products import Greige
     from swmtplanner.planners.infinite.state import Move, State
 
@@ -55,6 +57,34 @@ class SafetyOrder:
     order_id: str
 
 
+# ----- Order book ---------------------------------------------------------
+
+@dataclass(frozen=True)
+class OrderBook:
+    """One snapshot of the plant's eligible orders, built once per main-loop
+    iteration by `build_order_book` and shared by candidate enumeration,
+    `build_context` and — through the `ScoringContext` — the cost layer, so
+    none of them re-derives it.
+
+    Fields:
+
+    - `orders` is `eligible_orders(state)`, in its order.
+    - `keys` is each order's `OrderKey`, parallel to `orders`.
+    - `priorities` maps every key to its rank (`assign_priorities`).
+    - `regular_orders_by_key` maps each `RegularOrder`'s key to the order.
+    - `relative_safety` maps the item id of every order to its
+      `safety_pool / safety_target` (0 for a zero target), the ratio the
+      priority sort keys on.
+    - `reference_week_idx` is the reference week the book was built
+      under."""
+    orders: tuple['RegularOrder | SafetyOrder', ...]
+    keys: tuple[OrderKey, ...]
+    priorities: dict[OrderKey, int]
+    regular_orders_by_key: dict[OrderKey, RegularOrder]
+    relative_safety: dict[str, float]
+    reference_week_idx: int
+
+
 # ----- Scoring context ----------------------------------------------------
 
 @dataclass(frozen=True)
@@ -87,12 +117,23 @@ class ScoringContext:
     - `new_machine_avail` maps each `Greige` that appears in the
       candidate pool to `True` iff at least one of that item's
       candidates targets a `Machine.is_new` machine, used by the
-      old-machine penalty."""
+      old-machine penalty.
+    - `order_book` is the `OrderBook` the priorities and regular orders
+      were taken from (`None` on a hand-built context).
+    - `priority_prefix` maps each distinct fill-from time the candidates
+      use (their `earliest_dp_excluding` entry, else `earliest_dp_time`)
+      to the running sums of `deferral_cost` over the orders in rank
+      order: entry `r - 1` is the total over every regular order ranked
+      better than `r`, for each candidate rank `r`. Lets a candidate's
+      priority cost be one lookup. `None` on a hand-built context, where
+      the cost layer scans `priorities` instead."""
     priorities: dict[OrderKey, int]
     regular_orders_by_key: dict[OrderKey, 'RegularOrder']
     earliest_dp_excluding: dict[str, datetime]
     earliest_dp_time: datetime
     new_machine_avail: dict['Greige', bool]
+    order_book: OrderBook | None = None
+    priority_prefix: dict[datetime, tuple[float, ...]] | None = None
 
 
 # ----- Order eligibility --------------------------------------------------
@@ -118,47 +159,55 @@ def eligible_orders(state: 'State') -> list[RegularOrder | SafetyOrder]:
     the eligible-order set is plant-wide — both candidate enumeration
     and priority assignment consume it, and `coordination/` is the
     architectural home for cross-cutting order data."""
+    # Items whose `version` and the reference week are unchanged since the
+    # last call reuse that call's pick; only the rest are re-examined.
+    cache = state.eligible_cache
+    ref = state.reference_week_idx
     out: list[RegularOrder | SafetyOrder] = []
-    for rls in state.rls_items.values():
-        # Regular: earliest safety-aware order with unmet demand. The
-        # safety_view.orders tuple is week_idx-ordered by construction.
-        added_flag = False
-        for order in rls.safety_view.orders:
-            if order.remaining_lbs > 0 and order.week.week_idx <= state.reference_week_idx:
-                out.append(RegularOrder(
-                    item=rls.item,
-                    week_idx=order.week.week_idx,
-                    due_date=order.week.due_date,
-                    lbs=order.remaining_lbs,
-                    order_id=order.id,
-                ))
-                added_flag = True
-                break
-        # Safety: top-up if pool is below target.
-        safety_gap = (
-            rls.safety_view.safety_target - rls.safety_view.safety_pool
-        )
-        if safety_gap > 0 and not added_flag:
-            out.append(SafetyOrder(
-                item=rls.item, lbs=safety_gap,
-                order_id=rls.safety_view.safety.id,
-            ))
-            added_flag = True
-        
-        if not added_flag:
-            for order in rls.safety_view.orders:
-                if order.remaining_lbs > 0:
-                    out.append(RegularOrder(
-                        item=rls.item,
-                        week_idx=order.week.week_idx,
-                        due_date=order.week.due_date,
-                        lbs=order.remaining_lbs,
-                        order_id=order.id
-                    ))
-                    break
+    for item_id, rls in state.rls_items.items():
+        hit = cache.get(item_id)
+        if (hit is None or hit[0] is not rls or hit[1] != rls.version
+                or hit[2] != ref):
+            hit = (rls, rls.version, ref, _eligible_order(rls, ref))
+            cache[item_id] = hit
+        if hit[3] is not None:
+            out.append(hit[3])
     return out
 
 
+def _eligible_order(
+    rls: 'RlsItem', reference_week_idx: int,
+) -> RegularOrder | SafetyOrder | None:
+    """`rls`'s pick for `eligible_orders`, or `None`."""
+    # Regular: earliest safety-aware order with unmet demand. The
+    # safety_view.orders tuple is week_idx-ordered by construction, so
+    # when the first unmet order is past the reference week, every unmet
+    # one is.
+    order = rls.first_unmet_order
+    if order is not None and order.week.week_idx <= reference_week_idx:
+        return _regular_order(rls, order)
+    # Safety: top-up if pool is below target.
+    safety_gap = rls.safety_view.safety_target - rls.safety_view.safety_pool
+    if safety_gap > 0:
+        return SafetyOrder(
+            item=rls.item, lbs=safety_gap,
+            order_id=rls.safety_view.safety.id,
+        )
+    if order is not None:
+        return _regular_order(rls, order)
+    return None
+
+
+def _regular_order(rls: 'RlsItem', order: 'SafetyAwareOrder') -> RegularOrder:
+    return RegularOrder(
+        item=rls.item,
+        week_idx=order.week.week_idx,
+        due_date=order.week.due_date,
+        lbs=order.remaining_lbs,
+        order_id=order.id,
+    )
+
+
 # ----- Priority assignment ------------------------------------------------
 
 def assign_priorities(state: 'State') -> dict[OrderKey, int]:
@@ -183,45 +232,66 @@ def assign_priorities(state: 'State') -> dict[OrderKey, int]:
        `week_idx > state.reference_week_idx`. Same intra-bucket sort.
 
     Placing safety in the middle is intentional — see "Priority order"
-    in DESIGN.md."""
-    orders = eligible_orders(state)
+    in DESIGN.md.
 
-    # Helper: relative safety-pool fraction per item. `safety_target ==
-    # 0` is rare (items whose Greige sets safety=0) but plausible; we
-    # treat it as ratio = 0 so those items don't dominate the sort.
-    def _relative_safety(item_id: str) -> float:
-        view = state.rls_items[item_id].safety_view
-        if view.safety_target <= 0:
-            return 0.0
-        return view.safety_pool / view.safety_target
+    The ranks are those of `build_order_book(state)`; the main loop reads
+    them off its per-iteration book rather than calling this."""
+    return build_order_book(state).priorities
 
-    regs = [o for o in orders if isinstance(o, RegularOrder)]
-    safes = [o for o in orders if isinstance(o, SafetyOrder)]
 
+def build_order_book(state: 'State') -> OrderBook:
+    """Snapshot `state`'s eligible orders into an `OrderBook`: the orders
+    and their keys, each item's relative safety ratio (read once), and the
+    priority ranks — see `assign_priorities` for the order."""
+    orders = tuple(eligible_orders(state))
     ref = state.reference_week_idx
-    urgent = [r for r in regs if r.week_idx <= ref]
-    future = [r for r in regs if r.week_idx > ref]
 
-    def _reg_key(r: RegularOrder) -> tuple:
-        return (r.due_date, _relative_safety(r.item.id))
+    # Relative safety-pool fraction per item. `safety_target == 0` is rare
+    # (items whose Greige sets safety=0) but plausible; we treat it as
+    # ratio = 0 so those items don't dominate the sort.
+    relative_safety: dict[str, float] = {}
+    for o in orders:
+        view = state.rls_items[o.item.id].safety_view
+        relative_safety[o.item.id] = (
+            view.safety_pool / view.safety_target
+            if view.safety_target > 0 else 0.0
+        )
+
+    keys = tuple(
+        OrderKey(item_id=o.item.id, week_idx=o.week_idx)
+        if isinstance(o, RegularOrder)
+        else OrderKey(item_id=o.item.id, week_idx=None)
+        for o in orders
+    )
+    regs = [
+        (k, o) for k, o in zip(keys, orders) if isinstance(o, RegularOrder)
+    ]
+    safes = [
+        (k, o) for k, o in zip(keys, orders) if isinstance(o, SafetyOrder)
+    ]
+    urgent = [(k, r) for k, r in regs if r.week_idx <= ref]
+    future = [(k, r) for k, r in regs if r.week_idx > ref]
+
+    def _reg_key(entry: tuple[OrderKey, RegularOrder]) -> tuple:
+        r = entry[1]
+        return (r.due_date, relative_safety[r.item.id])
 
     urgent.sort(key=_reg_key)
     future.sort(key=_reg_key)
-    safes.sort(key=lambda s: _relative_safety(s.item.id))
-
-    ranks: dict[OrderKey, int] = {}
-    rank = 1
-    for r in urgent:
-        ranks[OrderKey(item_id=r.item.id, week_idx=r.week_idx)] = rank
-        rank += 1
-    for s in safes:
-        ranks[OrderKey(item_id=s.item.id, week_idx=None)] = rank
-        rank += 1
-    for r in future:
-        ranks[OrderKey(item_id=r.item.id, week_idx=r.week_idx)] = rank
-        rank += 1
-
-    return ranks
+    safes.sort(key=lambda entry: relative_safety[entry[1].item.id])
+
+    priorities: dict[OrderKey, int] = {}
+    for rank, (key, _) in enumerate(urgent + safes + future, start=1):
+        priorities[key] = rank
+
+    return OrderBook(
+        orders=orders,
+        keys=keys,
+        priorities=priorities,
+        regular_orders_by_key=dict(regs),
+        relative_safety=relative_safety,
+        reference_week_idx=ref,
+    )
 
 
 # ----- New-machine availability -------------------------------------------
@@ -261,47 +331,189 @@ def build_earliest_dp_excluding(
     Machines whose only DPs are their own (i.e., no other machine has
     a candidate this iteration) are absent from the returned dict —
     callers fall back to `ctx.earliest_dp_time` in that case."""
-    def _dp_time(move: 'Move') -> datetime:
-        machine = state.machines[move.machine_id]
-        if move.start_at == 'schedule_tail':
-            return machine.schedule_tail
-        return machine.next_runout
-
-    # First pass: best (earliest) DP per machine that has any candidate.
+    # Best (earliest) DP per machine that has any candidate.
     best_per_machine: dict[str, datetime] = {}
     for move in candidates:
-        t = _dp_time(move)
+        t = _dp_time(state, move)
         prev = best_per_machine.get(move.machine_id)
         if prev is None or t < prev:
             best_per_machine[move.machine_id] = t
+    return _excluding_own(best_per_machine)
 
-    # Second pass: for each machine, the min across all OTHER machines'
-    # best DP times. O(machines^2), which is fine — the plant has tens
-    # of machines, not thousands.
-    out: dict[str, datetime] = {}
-    for excluded in best_per_machine:
-        others = [
-            t for mid, t in best_per_machine.items() if mid != excluded
-        ]
-        if others:
-            out[excluded] = min(others)
+
+def _dp_time(state: 'State', move: 'Move') -> datetime:
+    """The move's decision-point time: its machine's `schedule_tail` for
+    `start_at='schedule_tail'`, else its `next_runout`."""
+    machine = state.machines[move.machine_id]
+    if move.start_at == 'schedule_tail':
+        return machine.schedule_tail
+    return machine.next_runout
+
+
+def _excluding_own(
+    best_per_machine: dict[str, datetime],
+) -> dict[str, datetime]:
+    """`build_earliest_dp_excluding` from each machine's earliest DP."""
+    # The earliest and second-earliest machines. Every machine but the
+    # earliest sees the earliest; the earliest sees the runner-up (equal
+    # to it on a tie).
+    if len(best_per_machine) < 2:
+        return {}
+    first_id = second_t = None
+    for mid, t in best_per_machine.items():
+        if first_id is None or t < best_per_machine[first_id]:
+            if first_id is not None:
+                second_t = best_per_machine[first_id]
+            first_id = mid
+        elif second_t is None or t < second_t:
+            second_t = t
+    first_t = best_per_machine[first_id]
+    return {
+        mid: second_t if mid == first_id else first_t
+        for mid in best_per_machine
+    }
+
+
+# ----- Priority cost precomputation ---------------------------------------
+
+_ONE_DAY = timedelta(days=1)
+
+
+def deferral_cost(
+    order: RegularOrder, other_dp: datetime,
+) -> tuple[float, float]:
+    """`(days_late, lbs × 2^days_late)` for a regular order deferred to
+    another machine whose next DP is `other_dp`: it is assumed filled at
+    `max(due_date + 1 day, other_dp)`. The per-order term of the priority
+    cost — see "Priority cost" in DESIGN.md."""
+    fill_time = max(order.due_date + _ONE_DAY, other_dp)
+    days_late = (fill_time - order.due_date) / _ONE_DAY
+    return days_late, order.lbs * (2.0 ** days_late)
+
+
+def build_priority_prefix(
+    priorities: dict[OrderKey, int],
+    regular_orders_by_key: dict[OrderKey, RegularOrder],
+    reach: dict[datetime, int],
+) -> dict[datetime, tuple[float, ...]]:
+    """For each fill-from time `t` in `reach`, the running sums of
+    `deferral_cost(order, t)` over `priorities` in rank order (safety
+    orders add nothing): entry `i` sums the `i` best-ranked orders. With
+    ranks contiguous from 1, as `assign_priorities` gives, a move at rank
+    `r` defers exactly the orders summed in entry `r - 1`.
+
+    `reach[t]` is the worst rank that will be looked up under `t`; the
+    sums stop there, so no order is costed that a scan over the same
+    moves wouldn't cost. They run in rank order, the order the priority
+    cost's scan adds them in, so a lookup equals the scanned total
+    exactly."""
+    ranked = [
+        regular_orders_by_key.get(key)
+        for key, _ in sorted(priorities.items(), key=lambda kv: kv[1])
+    ]
+    out: dict[datetime, tuple[float, ...]] = {}
+    for t, rank in reach.items():
+        total = 0.0
+        sums = [total]
+        for order in ranked[:rank - 1]:
+            if order is not None:
+                total += deferral_cost(order, t)[1]
+            sums.append(total)
+        out[t] = tuple(sums)
     return out
 
 
+# ----- Candidate summaries -----------------------------------------------
+
+@dataclass(frozen=True)
+class CandidateSummary:
+    """Everything `build_context` reads off a candidate pool, in a few
+    small plain-valued dicts. Summaries of consecutive slices of a pool
+    merge (`merge_summaries`) into the whole pool's summary, so a pool
+    enumerated in pieces — as the `ScoringPool` workers enumerate theirs —
+    yields the same context as the pool built in one place.
+
+    Fields:
+
+    - `n_candidates` is the number of candidates.
+    - `earliest_dp` maps each `machine_id` with a candidate to its
+      earliest decision-point time among them, in order of each
+      machine's first candidate.
+    - `worst_rank` maps each `machine_id` to the worst (largest)
+      priority rank among its candidates that have one, in the same
+      order.
+    - `new_machine_avail` is `build_new_machine_avail`, keyed by item
+      id."""
+    n_candidates: int
+    earliest_dp: dict[str, datetime]
+    worst_rank: dict[str, int]
+    new_machine_avail: dict[str, bool]
+
+
+def summarize_candidates(
+    state: 'State', candidates: list['Move'], book: OrderBook,
+) -> CandidateSummary:
+    """The `CandidateSummary` of `candidates`, ranked by `book`."""
+    earliest: dict[str, datetime] = {}
+    worst: dict[str, int] = {}
+    new_avail: dict[str, bool] = {}
+    priorities = book.priorities
+    for c in candidates:
+        t = _dp_time(state, c)
+        prev = earliest.get(c.machine_id)
+        if prev is None or t < prev:
+            earliest[c.machine_id] = t
+        rank = priorities.get(OrderKey(item_id=c.item.id, week_idx=c.week_idx))
+        if rank is not None and rank > worst.get(c.machine_id, 0):
+            worst[c.machine_id] = rank
+        is_new = state.machines[c.machine_id].is_new
+        new_avail[c.item.id] = new_avail.get(c.item.id, False) or is_new
+    return CandidateSummary(
+        n_candidates=len(candidates), earliest_dp=earliest,
+        worst_rank=worst, new_machine_avail=new_avail,
+    )
+
+
+def merge_summaries(summaries: list[CandidateSummary]) -> CandidateSummary:
+    """The summary of the concatenation of the pools `summaries`
+    summarize, in order."""
+    n = 0
+    earliest: dict[str, datetime] = {}
+    worst: dict[str, int] = {}
+    new_avail: dict[str, bool] = {}
+    for summary in summaries:
+        n += summary.n_candidates
+        for machine_id, t in summary.earliest_dp.items():
+            prev = earliest.get(machine_id)
+            if prev is None or t < prev:
+                earliest[machine_id] = t
+        for machine_id, rank in summary.worst_rank.items():
+            if rank > worst.get(machine_id, 0):
+                worst[machine_id] = rank
+        for item_id, is_new in summary.new_machine_avail.items():
+            new_avail[item_id] = new_avail.get(item_id, False) or is_new
+    return CandidateSummary(
+        n_candidates=n, earliest_dp=earliest, worst_rank=worst,
+        new_machine_avail=new_avail,
+    )
+
+
 # ----- ScoringContext construction ----------------------------------------
 
 def build_context(
     state: 'State',
     candidates: list['Move'],
+    book: OrderBook | None = None,
 ) -> ScoringContext:
     """Build the per-iteration `ScoringContext` from `state` and the
     enumerated candidate pool. Combines the five cross-candidate inputs:
 
-    - `priorities` from `assign_priorities(state)`.
-    - `regular_orders_by_key` derived from `eligible_orders(state)` —
-      a `{OrderKey: RegularOrder}` dict that the priority cost reads
-      to recover each higher-priority regular's `due_date` and `lbs`.
-      Safety orders are dropped.
+    - `priorities` and `regular_orders_by_key` from the iteration's
+      `OrderBook` (`book`, or `build_order_book(state)` when not given) —
+      the ranks of `assign_priorities(state)`, and a `{OrderKey:
+      RegularOrder}` dict that the priority cost reads to recover each
+      higher-priority regular's `due_date` and `lbs`. Safety orders are
+      dropped from the latter.
     - `earliest_dp_excluding` from `build_earliest_dp_excluding(state,
       candidates)`.
     - `earliest_dp_time` from `min(dp_time(c) for c in candidates)`
@@ -310,27 +522,51 @@ def build_context(
       time *before* any carrying-avoidance idle.
     - `new_machine_avail` from `build_new_machine_avail(state,
       candidates)`.
+    - `priority_prefix` from `build_priority_prefix`, covering each
+      candidate's fill-from time up to its rank.
+
+    The pool is read only through its `CandidateSummary`: this is
+    `build_context_from_summary(state, summarize_candidates(state,
+    candidates, book), book)`.
 
     Requires `candidates` to be non-empty — the main loop only invokes
     scoring on a non-empty pool, so an empty list is a programmer
     error (raises `ValueError` via the `min` call)."""
-    def _dp_time(move: 'Move') -> datetime:
-        machine = state.machines[move.machine_id]
-        if move.start_at == 'schedule_tail':
-            return machine.schedule_tail
-        return machine.next_runout
-
-    regular_orders_by_key: dict[OrderKey, RegularOrder] = {}
-    for order in eligible_orders(state):
-        if isinstance(order, RegularOrder):
-            regular_orders_by_key[OrderKey(
-                item_id=order.item.id, week_idx=order.week_idx,
-            )] = order
+    if book is None:
+        book = build_order_book(state)
+    return build_context_from_summary(
+        state, summarize_candidates(state, candidates, book), book,
+    )
+
+
+def build_context_from_summary(
+    state: 'State', summary: CandidateSummary, book: OrderBook,
+) -> ScoringContext:
+    """`build_context` for the candidate pool `summary` summarizes, under
+    the iteration's `book`. `new_machine_avail` is keyed by each item's
+    `state.rls_items` `Greige`."""
+    earliest_dp_excluding = _excluding_own(summary.earliest_dp)
+    earliest_dp_time = min(summary.earliest_dp.values())
+
+    # Worst candidate rank under each fill-from time: how far that time's
+    # priority prefix needs to run.
+    reach: dict[datetime, int] = {}
+    for machine_id, rank in summary.worst_rank.items():
+        t = earliest_dp_excluding.get(machine_id, earliest_dp_time)
+        if rank > reach.get(t, 0):
+            reach[t] = rank
 
     return ScoringContext(
-        priorities=assign_priorities(state),
-        regular_orders_by_key=regular_orders_by_key,
-        earliest_dp_excluding=build_earliest_dp_excluding(state, candidates),
-        earliest_dp_time=min(_dp_time(c) for c in candidates),
-        new_machine_avail=build_new_machine_avail(state, candidates),
+        priorities=book.priorities,
+        regular_orders_by_key=book.regular_orders_by_key,
+        earliest_dp_excluding=earliest_dp_excluding,
+        earliest_dp_time=earliest_dp_time,
+        new_machine_avail={
+            state.rls_items[item_id].item: is_new
+            for item_id, is_new in summary.new_machine_avail.items()
+        },
+        order_book=book,
+        priority_prefix=build_priority_prefix(
+            book.priorities, book.regular_orders_by_key, reach,
+        ),
     )
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from swmtplanner.planners.infinite.coordination import ScoringContext
 from swmtplanner.planners.infinite.state import Move, State
 from swmtplanner.debuglog import DebugLog
@@ -31,7 +33,9 @@ class CostWeights:
 
 
 class Costing:
-    def __init__(self, weights: CostWeights) -> None: ...
+    def __init__(
+        self, weights: CostWeights, *, specialize: bool = ...,
+    ) -> None: ...
     @property
     def weights(self) -> CostWeights: ...
     def score(self, state: State) -> float: ...
@@ -39,6 +43,15 @@ class Costing:
         self, state: State, move: Move, ctx: ScoringContext,
         debuglog: DebugLog | None = ...,
     ) -> float: ...
+    def lower_bound_after_move(
+        self, state: State, move: Move, ctx: ScoringContext,
+    ) -> float: ...
+    def score_many(
+        self, state: State, moves: list[Move], ctx: ScoringContext,
+    ) -> np.ndarray: ...
+    def argmin_after_move(
+        self, state: State, moves: list[Move], ctx: ScoringContext,
+    ) -> tuple[int, float]: ...
 
 
 def load_weights(path: str | Path) -> CostWeights: ...
@@ -1,23 +1,33 @@
 #!/usr/bin/env python
 
 from dataclasses import dataclass
-from datetime import timedelta
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from swmtplanner.schedule import (
-    Job, TapeOut, StyleChange, RunnerChange, PatternChange, Idle, Waste,
+    Job, ScheduleSummary,
+    TapeOut, StyleChange, RunnerChange, PatternChange, Idle, Waste,
 )
 
-from swmtplanner.planners.infinite.coordination import OrderKey, ScoringContext
+from swmtplanner.planners.infinite.coordination import (
+    OrderKey, ScoringContext, deferral_cost,
+)
 from swmtplanner.planners.infinite.report import _activity_desc
 from swmtplanner.planners.infinite.state import Move, State
 
 if TYPE_CHECKING:
-    from swmtplanner.schedule import Activity
+    from swmtplanner.schedule import Activity, Machine
+    from swmtplanner.demand.rlsitem import RlsItem
     from swmtplanner.support import WorkCal
     from swmtplanner.debuglog import DebugLog
 
 
+# Relative margin a candidate's lower bound must clear above the best exact
+# score before `argmin_after_move` prunes it.
+_BOUND_SLACK = 1e-9
+
+
 @dataclass
 class CostWeights:
     """Weights for Phase 1+2 cost scoring. Each component is multiplied
@@ -70,10 +80,34 @@ class Costing:
     `ctx` (priority, level-loading, old-machine). Pure — does not
     mutate `state`. `ctx` is required. When given a `debuglog`, it also
     writes the per-component breakdown to the log's tables (see
-    `debuglog/DESIGN.md`); the hot scoring loop skips that bookkeeping."""
-
-    def __init__(self, weights: CostWeights) -> None:
+    `debuglog/DESIGN.md`); the hot scoring loop skips that bookkeeping.
+
+    The weights are compiled at construction into an `_Evaluator` that
+    leaves out every component weighted 0: its quantity is never computed
+    (no priority walk, no level-loading work-hour count, no demand view
+    simulation whose components all weigh 0), since it would add an exact
+    0 to the score. Scores match the unspecialized evaluation
+    (`specialize=False`) exactly, as long as the skipped quantities are
+    finite. The debug breakdown always evaluates every component. Treat
+    `weights` as fixed once the `Costing` is built."""
+
+    def __init__(
+        self, weights: CostWeights, *, specialize: bool = True,
+    ) -> None:
         self._weights = weights
+        self._eval = _Evaluator.of(weights, specialize)
+        # Cached baseline: per-item weighted demand cost and per-machine
+        # schedule penalty, each stored with the object and the `version` it
+        # was computed at, plus their total. See `_sync_baseline`.
+        self._item_costs: dict[str, tuple['RlsItem', int, float]] = {}
+        self._machine_penalties: dict[str, tuple['Machine', int, float]] = {}
+        self._baseline_total = 0.0
+        self._baseline_ctx: ScoringContext | None = None
+        # Per-candidate demand cache: `_demand_key(machine, move)` ->
+        # {item_id: (item, version, weighted cost_if cost)}. See `_columns`.
+        self._demand_cache: dict[
+            tuple, dict[str, tuple['RlsItem', int, float]]
+        ] = {}
 
     @property
     def weights(self) -> CostWeights:
@@ -83,31 +117,26 @@ class Costing:
         """Score the current state — weighted sum of per-item demand
         costs (read from the rls_items' views as-is) and per-machine
         schedule penalties (counted off each machine's committed
-        activities)."""
-        total = 0.0
-        for rls in state.rls_items.values():
-            total += self._weighted_demand(
-                rls.raw_view.lateness,
-                rls.safety_view.drainage,
-                rls.safety_view.carrying,
-                rls.safety_view.excess,
-            )
-        for machine in state.machines.values():
-            total += self._schedule_penalty(machine)
-        return total
+        activities). Served from the cached baseline, refreshed for
+        whatever changed since it was last computed."""
+        self._sync_baseline(state)
+        return self._baseline_total
 
     def score_after_move(
         self, state: State, move: Move, ctx: ScoringContext,
         debuglog: 'DebugLog | None' = None,
     ) -> float:
         """Score the state as if `move` were committed. Pure — does not
-        mutate `state`. Internally uses `RlsItem.cost_if(jobs)` for the
-        item(s) the move's plan touches, and reads the current view
-        trackers for everything else. Schedule penalties for the
-        affected machine combine its existing activities with the plan's;
-        other machines use their current counts. Adds the move's
-        cross-cutting contributions (priority, level-loading,
-        old-machine) read off `ctx`.
+        mutate `state`. Each touched item's weighted demand cost is its
+        `RlsItem.cost_if(jobs)` cost, and the affected machine's schedule
+        penalty is that of its committed summary merged with the plan's;
+        every other item and machine keeps its cost from the cached
+        baseline, so only what the move touches is simulated. The costs
+        are then summed afresh in `state` order — items, then machines,
+        then the move's cross-cutting contributions (priority,
+        level-loading, old-machine) read off `ctx` — rather than applied
+        as a delta to the cached total, so the score rounds exactly as a
+        from-scratch sum would and near-ties break the same way.
 
         When `debuglog` is given, the per-component breakdown is written to its
         `cost_summary` table (one row per weighted component, tagged with the
@@ -115,7 +144,296 @@ class Costing:
         hot path (no `debuglog`) skips that bookkeeping."""
         if debuglog is not None:
             return self._emit_cost_summary(debuglog, state, move, ctx)
+        jobs_by_item, fixed = self._prepare_move(state, move, ctx)
+        return self._exact_after_move(state, move, jobs_by_item, fixed)
+
+    def lower_bound_after_move(
+        self, state: State, move: Move, ctx: ScoringContext,
+    ) -> float:
+        """A cheap lower bound on `score_after_move(state, move, ctx)`: the
+        same sum with every touched item's post-move demand cost replaced by
+        its floor. The schedule penalty and cross-cutting costs are exact;
+        no `RlsItem.cost_if` simulation is run.
+
+        The demand components (lateness, drainage, carrying, excess) are
+        never negative (up to rounding), so with non-negative demand weights
+        the floor is 0 and the bound is admissible; with any negative demand weight it is
+        `-inf` (nothing can be pruned)."""
+        jobs_by_item, fixed = self._prepare_move(state, move, ctx)
+        return self._bound_after_move(state, move, jobs_by_item, fixed)
+
+    def score_many(
+        self, state: State, moves: list[Move], ctx: ScoringContext,
+    ) -> np.ndarray:
+        """`score_after_move(state, move, ctx)` for every move of `moves`,
+        as a float array in the same order — bit-identical to scoring them
+        one at a time.
+
+        The pool is laid out as columns (see `_MoveColumns`) and the
+        weighted schedule, cross-cutting and demand terms are summed
+        column-wise, in the order `score_after_move` adds them. Every
+        touched item is simulated, through `RlsItem.cost_if_many` once per
+        item; `argmin_after_move` reads the same columns but simulates
+        only what its bounds can't rule out. Either way, an item whose
+        cost under the move is cached (see `_columns`) is not simulated
+        again."""
+        cols = self._columns(state, moves, ctx)
+        stale = [c for c in cols.cells if not cols.known[c[0], c[1]]]
+        lateness = np.empty(len(stale))
+        drainage = np.empty(len(stale))
+        carrying = np.empty(len(stale))
+        excess = np.empty(len(stale))
+        by_item: dict[str, tuple['RlsItem', list[int]]] = {}
+        for c, (_, _, rls, _) in enumerate(stale):
+            by_item.setdefault(rls.item.id, (rls, []))[1].append(c)
+        for rls, cells in by_item.values():
+            results = rls.cost_if_many(
+                [stale[c][3] for c in cells],
+                raw=self._eval.raw, safety=self._eval.safety,
+            )
+            for c, cc in zip(cells, results):
+                lateness[c] = cc.lateness
+                drainage[c] = cc.drainage
+                carrying[c] = cc.carrying
+                excess[c] = cc.excess
+
+        w = self._weights
+        demand = cols.demand
+        if stale:
+            rows = [c[0] for c in stale]
+            slots = [c[1] for c in stale]
+            demand[rows, slots] = (
+                w.lateness * lateness
+                + w.drainage * drainage
+                + w.carrying * carrying
+                + w.excess * excess
+            )
+            for (i, _, rls, _), cost in zip(stale, demand[rows, slots]):
+                self._remember(cols.hits[i], rls, float(cost))
+        return cols.ordered_total(demand)
+
+    def argmin_after_move(
+        self, state: State, moves: list[Move], ctx: ScoringContext,
+    ) -> tuple[int, float]:
+        """`(index, score)` of the lowest-scoring move in `moves` — the
+        first one on a tie — exactly as
+        `min(range(len(moves)), key=lambda i: score_after_move(...))` would
+        pick it, but by branch and bound: every move's
+        `lower_bound_after_move` is computed first (column-wise, off the
+        same layout as `score_many`), moves are scored in bound order, and
+        a move whose bound exceeds the best exact score found so far is
+        never simulated (nor is anything after it). Only the work done
+        differs from the exhaustive scan."""
+        if not moves:
+            raise ValueError('argmin_after_move() needs at least one move')
+        cols = self._columns(state, moves, ctx)
+        n = len(moves)
+
+        # `_bound_after_move`, column-wise: each touched item's cost_if
+        # term at its floor, or at its cached value when it has one (so a
+        # move with every item cached is bounded by its exact score).
+        w = self._weights
+        floor = 0.0 if min(
+            w.lateness, w.drainage, w.carrying, w.excess,
+        ) >= 0 else float('-inf')
+        bounds = cols.ordered_total(np.where(cols.known, cols.demand, floor))
+
+        ev = self._eval
+        cells_by_move: list[list[tuple]] = [[] for _ in range(n)]
+        for cell in cols.cells:
+            cells_by_move[cell[0]].append(cell)
+        bound_list = bounds.tolist()
+        penalty = cols.penalty.tolist()
+        cross = cols.cross.tolist()
+        known = cols.known.tolist()
+        demand = cols.demand.tolist()
+
+        best_idx = best_score = None
+        for i in np.argsort(bounds, kind='stable').tolist():
+            if best_score is not None:
+                # The bound and the exact score round the same sum the same
+                # way, but drainage can dip a hair below zero by rounding,
+                # so only prune past a relative margin.
+                slack = _BOUND_SLACK * max(1.0, abs(best_score))
+                if bound_list[i] - best_score > slack:
+                    break
+            # `_exact_after_move` for move i.
+            costs: dict[str, float] = {}
+            for _, j, rls, jobs in cells_by_move[i]:
+                if known[i][j]:
+                    cost = demand[i][j]
+                else:
+                    cc = rls.cost_if(jobs, raw=ev.raw, safety=ev.safety)
+                    cost = self._weighted_demand(
+                        cc.lateness, cc.drainage, cc.carrying, cc.excess,
+                    )
+                    self._remember(cols.hits[i], rls, cost)
+                costs[rls.item.id] = cost
+            score = self._ordered_total(
+                costs, moves[i].machine_id, penalty[i], cross[i],
+            )
+            if (best_score is None or score < best_score
+                    or (score == best_score and i < best_idx)):
+                best_idx, best_score = i, score
+        return best_idx, best_score
+
+    def _columns(
+        self, state: State, moves: list[Move], ctx: ScoringContext,
+    ) -> '_MoveColumns':
+        """Lay `moves` out as `_MoveColumns` against an up-to-date
+        baseline. Each column entry is computed exactly as `_prepare_move`
+        computes it for the one move.
+
+        A move's weighted `cost_if` cost for an item depends only on its
+        plan's jobs and the item's committed schedule. The plan is fixed by
+        the machine's schedule (its `version`) and the `plan_production`
+        inputs the move carries, so the cost is cached under those
+        (`_demand_key`) rather than the move object: it carries over
+        between iterations, and to a re-planned or unpickled copy of the
+        move, for as long as the item's `version` holds. Those cached costs
+        fill the `demand` column (`known` marks them); the context-dependent
+        terms are recomputed every call. Entries whose machine or items
+        have moved on since are dropped, so the cache stays about the size
+        of the pool."""
+        self._sync_baseline(state)
+        self._baseline_ctx = ctx
+        w = self._weights
+        ev = self._eval
+        n = len(moves)
+
+        # Demand cells: one per (move, touched item), in the order the
+        # move's jobs first name the item. None when every demand weight
+        # is 0 (the cost_if term and the baseline it replaces are both 0).
+        cells: list[tuple[int, int, 'RlsItem', list[Job]]] = []
+        n_slots = 0
+        cache: dict[tuple, dict] = {}
+        for key, costs in self._demand_cache.items():
+            machine = state.machines.get(key[0])
+            if machine is None or machine.version != key[1]:
+                continue
+            costs = {
+                item_id: hit for item_id, hit in costs.items()
+                if hit[1] == hit[0].version
+            }
+            if costs:
+                cache[key] = costs
+        hits: list[dict[str, tuple['RlsItem', int, float]]] = []
+        for i, move in enumerate(moves if ev.demand else ()):
+            jobs_by_item: dict[str, list[Job]] = {}
+            for job in move.plan.jobs:
+                jobs_by_item.setdefault(job.item.id, []).append(job)
+            j = 0
+            for item_id, jobs in jobs_by_item.items():
+                rls = state.rls_items.get(item_id)
+                if rls is None:
+                    continue
+                cells.append((i, j, rls, jobs))
+                j += 1
+            n_slots = max(n_slots, j)
+            hits.append(cache.setdefault(
+                _demand_key(state.machines[move.machine_id], move), {},
+            ))
+        self._demand_cache = cache
+
+        item_index = {
+            item_id: c for c, item_id in enumerate(self._item_costs)
+        }
+        item_cols = np.zeros((n, n_slots), dtype=np.intp)
+        touched = np.zeros((n, n_slots), dtype=bool)
+        demand = np.zeros((n, n_slots))
+        known = np.zeros((n, n_slots), dtype=bool)
+        for i, j, rls, _ in cells:
+            item_cols[i, j] = item_index[rls.item.id]
+            touched[i, j] = True
+            hit = hits[i].get(rls.item.id)
+            if hit is not None and hit[0] is rls and hit[1] == rls.version:
+                demand[i, j] = hit[2]
+                known[i, j] = True
+
+        # Schedule: the affected machine's summary counts merged with the
+        # plan's (`ScheduleSummary.merge`), one column per weight.
+        machine_index = {
+            machine_id: c
+            for c, machine_id in enumerate(self._machine_penalties)
+        }
+        machine_cols = np.empty(n, dtype=np.intp)
+        counts = np.empty((n, 7))
+        for i, move in enumerate(moves):
+            machine = state.machines[move.machine_id]
+            summary = machine.schedule_summary.merge(
+                _plan_summary(move.plan, machine.workcal),
+            )
+            machine_cols[i] = machine_index[move.machine_id]
+            counts[i] = (
+                summary.tape_out_single, summary.tape_out_both,
+                summary.style_change, summary.runner_change,
+                summary.pattern_change, summary.idle_hours,
+                summary.waste_lbs,
+            )
+        # Zero-weighted counts would each add an exact 0.
+        penalty = np.zeros(n)
+        for j, weight in ev.schedule:
+            penalty = penalty + weight * counts[:, j]
+
+        # Cross-cutting: the priority quantity, the level-loading work
+        # hours (once per distinct decision point) and the old-machine flag,
+        # each only when weighted. A skipped term is an exact 0.
+        priority = np.zeros(n)
+        hours = np.zeros(n)
+        old = np.zeros(n, dtype=bool)
+        dp_hours: dict[tuple[str, str], float] = {}
+        for i, move in enumerate(moves):
+            machine = state.machines[move.machine_id]
+            if ev.priority:
+                priority[i] = self._priority_raw(move, ctx)
+            if ev.level_loading:
+                dp = (move.machine_id, move.start_at)
+                h = dp_hours.get(dp)
+                if h is None:
+                    dp_time = (
+                        machine.schedule_tail
+                        if move.start_at == 'schedule_tail'
+                        else machine.next_runout
+                    )
+                    h = machine.workcal.get_work_hours_between(
+                        ctx.earliest_dp_time, dp_time,
+                    )
+                    dp_hours[dp] = h
+                hours[i] = h
+            if ev.old_machine:
+                old[i] = (ctx.new_machine_avail.get(move.item, False)
+                          and not machine.is_new)
+        cross = (
+            (w.priority * priority if ev.priority else priority)
+            + (w.level_loading * hours if ev.level_loading else hours)
+            + np.where(old, w.old_machine, 0.0)
+        )
+        return _MoveColumns(
+            n_slots=n_slots, cells=cells,
+            item_base=np.array([e[2] for e in self._item_costs.values()]),
+            item_cols=item_cols, touched=touched, demand=demand, known=known,
+            machine_base=np.array(
+                [e[2] for e in self._machine_penalties.values()],
+            ),
+            machine_cols=machine_cols, penalty=penalty, cross=cross,
+            hits=hits,
+        )
+
+    def _remember(
+        self, hits: dict[str, tuple['RlsItem', int, float]],
+        rls: 'RlsItem', cost: float,
+    ) -> None:
+        """Cache a move's weighted `cost_if` cost for `rls` at its current
+        `version` into the move's `hits` entry (see `_columns`)."""
+        hits[rls.item.id] = (rls, rls.version, cost)
 
+    def _prepare_move(
+        self, state: State, move: Move, ctx: ScoringContext,
+    ) -> tuple[dict[str, list[Job]], tuple[float, float]]:
+        """The move's jobs grouped by item id, and its `(machine's schedule
+        penalty, cross-cutting cost)` — the parts of its score that need no
+        demand simulation. Brings the baseline up to date for what it
+        touches."""
         # Group the plan's Job records by their item.id. A single plan
         # can carry Jobs for more than one item (the 'next_runout' run-up
         # adds a Job of the current item ahead of the new item's).
@@ -123,35 +441,77 @@ class Costing:
         for job in move.plan.jobs:
             jobs_by_item.setdefault(job.item.id, []).append(job)
 
-        total = 0.0
-        # Demand: cost_if for items touched by the plan, current for the rest.
-        for item_id, rls in state.rls_items.items():
-            if item_id in jobs_by_item:
-                cc = rls.cost_if(jobs_by_item[item_id])
-                total += self._weighted_demand(
-                    cc.lateness, cc.drainage, cc.carrying, cc.excess,
-                )
-            else:
-                total += self._weighted_demand(
-                    rls.raw_view.lateness,
-                    rls.safety_view.drainage,
-                    rls.safety_view.carrying,
-                    rls.safety_view.excess,
-                )
-
-        # Schedule: combined activities for the affected machine, current
-        # for the rest.
-        for machine_id, machine in state.machines.items():
-            if machine_id == move.machine_id:
-                total += self._schedule_penalty_for(
-                    list(machine.activities) + list(move.plan.activities),
-                    machine.workcal,
-                )
-            else:
-                total += self._schedule_penalty(machine)
+        # The baseline is revalidated in full once per scoring context (i.e.
+        # once per main-loop iteration); within one, only the entries this
+        # move touches are checked.
+        if (ctx is not self._baseline_ctx
+                or not self._baseline_covers(state, move, jobs_by_item)):
+            self._sync_baseline(state)
+            self._baseline_ctx = ctx
 
+        # Schedule: the affected machine's post-commit penalty is that of
+        # its committed summary merged with the plan's.
+        machine = state.machines[move.machine_id]
+        penalty = self._summary_penalty(machine.schedule_summary.merge(
+            _plan_summary(move.plan, machine.workcal),
+        ))
         # Cross-cutting per-move contributions (Phase 2).
-        total += self._cross_cutting_cost(state, move, ctx)
+        cross = self._cross_cutting_cost(state, move, ctx)
+        return jobs_by_item, (penalty, cross)
+
+    def _exact_after_move(
+        self, state: State, move: Move, jobs_by_item: dict[str, list[Job]],
+        fixed: tuple[float, float],
+    ) -> float:
+        # Demand: each touched item's cost_if cost replaces its baseline
+        # cost. With every demand weight 0 both are 0, and nothing is
+        # simulated.
+        ev = self._eval
+        costs: dict[str, float] = {}
+        for item_id, jobs in jobs_by_item.items() if ev.demand else ():
+            rls = state.rls_items.get(item_id)
+            if rls is None:
+                continue
+            cc = rls.cost_if(jobs, raw=ev.raw, safety=ev.safety)
+            costs[item_id] = self._weighted_demand(
+                cc.lateness, cc.drainage, cc.carrying, cc.excess,
+            )
+        penalty, cross = fixed
+        return self._ordered_total(costs, move.machine_id, penalty, cross)
+
+    def _bound_after_move(
+        self, state: State, move: Move, jobs_by_item: dict[str, list[Job]],
+        fixed: tuple[float, float],
+    ) -> float:
+        # `_exact_after_move` with each cost_if term at its floor, summed in
+        # the same order, so the rounding can only keep the bound lower.
+        w = self._weights
+        floor = 0.0 if min(
+            w.lateness, w.drainage, w.carrying, w.excess,
+        ) >= 0 else float('-inf')
+        costs = {
+            item_id: floor for item_id in jobs_by_item
+            if item_id in state.rls_items
+        }
+        penalty, cross = fixed
+        return self._ordered_total(costs, move.machine_id, penalty, cross)
+
+    def _ordered_total(
+        self, item_costs: dict[str, float], machine_id: str,
+        penalty: float, cross: float,
+    ) -> float:
+        """The post-move score, summed in its fixed order: each item's
+        weighted demand cost (`item_costs[item_id]` where given, else the
+        baseline's), then each machine's schedule penalty (`penalty` for
+        `machine_id`, else the baseline's), in `state` order, then `cross`.
+        Adding every entry afresh, rather than a delta to the baseline
+        total, rounds the way a from-scratch sum does."""
+        total = 0.0
+        for item_id, (_, _, cost) in self._item_costs.items():
+            total += item_costs.get(item_id, cost)
+        for other_id, (_, _, other) in self._machine_penalties.items():
+            total += penalty if other_id == machine_id else other
+        total += cross
         return total
 
     def _emit_cost_summary(
@@ -204,24 +564,21 @@ class Costing:
             excess_q += cc.excess
 
         # Schedule quantities, summed across machines (the affected machine
-        # combines its committed activities with the plan's).
+        # merges its committed summary with the plan's).
         tos_q = tob_q = sc_q = rc_q = pc_q = it_q = wl_q = 0.0
         for machine_id, machine in state.machines.items():
+            summary = machine.schedule_summary
             if machine_id == move.machine_id:
-                activities = (
-                    list(machine.activities) + list(move.plan.activities)
+                summary = summary.merge(
+                    _plan_summary(move.plan, machine.workcal),
                 )
-            else:
-                activities = machine.activities
-            stos, stob, ssc, src, spc, sit, swl = \
-                self._schedule_quantities_for(activities, machine.workcal)
-            tos_q += stos
-            tob_q += stob
-            sc_q += ssc
-            rc_q += src
-            pc_q += spc
-            it_q += sit
-            wl_q += swl
+            tos_q += summary.tape_out_single
+            tob_q += summary.tape_out_both
+            sc_q += summary.style_change
+            rc_q += summary.runner_change
+            pc_q += summary.pattern_change
+            it_q += summary.idle_hours
+            wl_q += summary.waste_lbs
 
         # Cross-cutting quantities (priority opportunity-cost, level-loading
         # work-hour delta, old-machine flag). Passing `debuglog` also emits the
@@ -303,8 +660,8 @@ class Costing:
         and weighted cost (`weight × quantity`); cost-free types return
         `(None, None)` so both cells render blank. A weighted type whose weight
         is `0` still returns `(0.0, 0.0)` — distinguishing a zero-valued cost
-        from no cost concept at all. Mirrors `_schedule_penalty_for`'s
-        per-activity charge."""
+        from no cost concept at all. Mirrors the per-activity charge
+        `_summary_penalty` applies to a `ScheduleSummary`."""
         w = self._weights
         if isinstance(a, TapeOut):
             weight = w.tape_out_both if a.bars == 'both' else w.tape_out_single
@@ -322,6 +679,73 @@ class Costing:
             return w.waste_lbs, w.waste_lbs * a.lbs
         return None, None
 
+    # ---- baseline ------------------------------------------------------
+
+    def _sync_baseline(self, state: State) -> None:
+        """Bring the cached baseline up to date with `state`. An entry is
+        recomputed only when its item / machine is a different object or its
+        `version` moved since it was cached; the total is re-summed (items,
+        then machines, in `state` order) whenever any entry changed, so it
+        never drifts from a fresh sum."""
+        changed = False
+
+        item_costs: dict[str, tuple['RlsItem', int, float]] = {}
+        for item_id, rls in state.rls_items.items():
+            entry = self._item_costs.get(item_id)
+            if entry is None or entry[0] is not rls \
+                    or entry[1] != rls.version:
+                entry = (rls, rls.version, self._weighted_demand(
+                    rls.raw_view.lateness,
+                    rls.safety_view.drainage,
+                    rls.safety_view.carrying,
+                    rls.safety_view.excess,
+                ))
+                changed = True
+            item_costs[item_id] = entry
+
+        machine_penalties: dict[str, tuple['Machine', int, float]] = {}
+        for machine_id, machine in state.machines.items():
+            entry = self._machine_penalties.get(machine_id)
+            if entry is None or entry[0] is not machine \
+                    or entry[1] != machine.version:
+                entry = (machine, machine.version,
+                         self._schedule_penalty(machine))
+                changed = True
+            machine_penalties[machine_id] = entry
+
+        if (len(item_costs) != len(self._item_costs)
+                or len(machine_penalties) != len(self._machine_penalties)):
+            changed = True
+        self._item_costs = item_costs
+        self._machine_penalties = machine_penalties
+        if changed:
+            total = 0.0
+            for _, _, cost in item_costs.values():
+                total += cost
+            for _, _, penalty in machine_penalties.values():
+                total += penalty
+            self._baseline_total = total
+
+    def _baseline_covers(
+        self, state: State, move: Move, jobs_by_item: dict[str, list[Job]],
+    ) -> bool:
+        """True when the cached entries for everything `move` touches (its
+        machine and the items its jobs feed) are still current."""
+        machine = state.machines[move.machine_id]
+        entry = self._machine_penalties.get(move.machine_id)
+        if entry is None or entry[0] is not machine \
+                or entry[1] != machine.version:
+            return False
+        for item_id in jobs_by_item:
+            rls = state.rls_items.get(item_id)
+            if rls is None:
+                continue
+            entry = self._item_costs.get(item_id)
+            if entry is None or entry[0] is not rls \
+                    or entry[1] != rls.version:
+                return False
+        return True
+
     # ---- helpers -------------------------------------------------------
 
     def _cross_cutting_cost(
@@ -331,23 +755,28 @@ class Costing:
         sum, level-loading work-hour delta × w.level_loading, and the
         flat old-machine penalty when applicable."""
         w = self._weights
+        ev = self._eval
         machine = state.machines[move.machine_id]
 
-        priority_cost = self._priority_cost(move, ctx)
+        # Each term is skipped (an exact 0) when its weight is 0.
+        priority_cost = self._priority_cost(move, ctx) if ev.priority else 0.0
 
         # Level-loading: work hours between the iteration's earliest DP
         # and this move's DP (pre-idle).
-        dp_time = (
-            machine.schedule_tail if move.start_at == 'schedule_tail'
-            else machine.next_runout
-        )
-        level_loading_cost = w.level_loading * machine.workcal.get_work_hours_between(
-            ctx.earliest_dp_time, dp_time,
-        )
+        level_loading_cost = 0.0
+        if ev.level_loading:
+            dp_time = (
+                machine.schedule_tail if move.start_at == 'schedule_tail'
+                else machine.next_runout
+            )
+            level_loading_cost = w.level_loading * machine.workcal.get_work_hours_between(
+                ctx.earliest_dp_time, dp_time,
+            )
 
         # Old-machine: flat penalty when scheduling a legacy machine
         # while at least one new-machine candidate exists for this item.
-        if (ctx.new_machine_avail.get(move.item, False)
+        if (ev.old_machine
+                and ctx.new_machine_avail.get(move.item, False)
                 and not machine.is_new):
             old_machine_cost = w.old_machine
         else:
@@ -370,7 +799,9 @@ class Costing:
 
         When `debuglog` is given, one `priority_detail` row is written per
         deferred order (its `cost` is the weighted contribution; the `move_id`
-        FK auto-links to the current `iteration_log` row)."""
+        FK auto-links to the current `iteration_log` row). Otherwise, when the
+        context's `priority_prefix` covers the move, the total is read off
+        it rather than scanned."""
         move_key = OrderKey(
             item_id=move.item.id, week_idx=move.week_idx,
         )
@@ -383,7 +814,10 @@ class Costing:
         other_dp = ctx.earliest_dp_excluding.get(
             move.machine_id, ctx.earliest_dp_time,
         )
-        one_day = timedelta(days=1)
+        if debuglog is None and ctx.priority_prefix is not None:
+            sums = ctx.priority_prefix.get(other_dp, ())
+            if move_rank <= len(sums):
+                return sums[move_rank - 1]
         w_priority = self._weights.priority
 
         lateness_lb_days = 0.0
@@ -394,9 +828,7 @@ class Costing:
             if order is None:
                 # Safety order — skipped (regulars-only scope).
                 continue
-            fill_time = max(order.due_date + one_day, other_dp)
-            days_late = (fill_time - order.due_date) / one_day
-            contribution = order.lbs * (2.0 ** days_late)
+            days_late, contribution = deferral_cost(order, other_dp)
             lateness_lb_days += contribution
             if debuglog is not None:
                 debuglog.add_row(
@@ -417,33 +849,6 @@ class Costing:
         """Weighted priority cost: `w.priority × _priority_raw(move, ctx)`."""
         return self._weights.priority * self._priority_raw(move, ctx)
 
-    def _schedule_quantities_for(
-        self, activities, workcal: 'WorkCal',
-    ) -> tuple[float, float, float, float, float, float, float]:
-        """Unweighted (tape_out_single, tape_out_both, style_change,
-        runner_change, pattern_change, idle_hours, waste_lbs)
-        counts/hours/lbs for a sequence of activities. Mirrors
-        `_schedule_penalty_for` but returns the seven quantities separately
-        so the breakdown methods can apply the weights themselves."""
-        tos_q = tob_q = sc_q = rc_q = pc_q = it_q = wl_q = 0.0
-        for a in activities:
-            if isinstance(a, TapeOut):
-                if a.bars == 'both':
-                    tob_q += 1
-                else:
-                    tos_q += 1
-            elif isinstance(a, StyleChange):
-                sc_q += 1
-            elif isinstance(a, RunnerChange):
-                rc_q += 1
-            elif isinstance(a, PatternChange):
-                pc_q += 1
-            elif isinstance(a, Idle):
-                it_q += workcal.get_work_hours_between(a.start, a.end)
-            elif isinstance(a, Waste):
-                wl_q += a.lbs
-        return tos_q, tob_q, sc_q, rc_q, pc_q, it_q, wl_q
-
     def _weighted_demand(
         self, lateness: float, drainage: float,
         carrying: float, excess: float,
@@ -455,30 +860,132 @@ class Costing:
                 + w.excess * excess)
 
     def _schedule_penalty(self, machine) -> float:
-        return self._schedule_penalty_for(machine.activities, machine.workcal)
+        return self._summary_penalty(machine.schedule_summary)
 
-    def _schedule_penalty_for(
-        self, activities, workcal: 'WorkCal',
-    ) -> float:
+    def _summary_penalty(self, summary: ScheduleSummary) -> float:
+        """Weighted schedule penalty of a `ScheduleSummary`: per-occurrence
+        weights times the tape-out / changeover counts, `idle_time` per
+        work hour of `Idle`, `waste_lbs` per lb of `Waste`."""
         w = self._weights
-        total = 0.0
-        for a in activities:
-            if isinstance(a, TapeOut):
-                total += (w.tape_out_both if a.bars == 'both'
-                          else w.tape_out_single)
-            elif isinstance(a, StyleChange):
-                total += w.style_change
-            elif isinstance(a, RunnerChange):
-                total += w.runner_change
-            elif isinstance(a, PatternChange):
-                total += w.pattern_change
-            elif isinstance(a, Idle):
-                # Idle duration is in work hours (set via
-                # workcal.offset_work_hours when the activity was created);
-                # extracting that back is what get_work_hours_between does.
-                work_hours = workcal.get_work_hours_between(a.start, a.end)
-                total += w.idle_time * work_hours
-            elif isinstance(a, Waste):
-                # Zero-duration; the per-lb charge is its only contribution.
-                total += w.waste_lbs * a.lbs
-        return total
+        return (w.tape_out_single * summary.tape_out_single
+                + w.tape_out_both * summary.tape_out_both
+                + w.style_change * summary.style_change
+                + w.runner_change * summary.runner_change
+                + w.pattern_change * summary.pattern_change
+                + w.idle_time * summary.idle_hours
+                + w.waste_lbs * summary.waste_lbs)
+
+
+@dataclass(frozen=True, slots=True)
+class _Evaluator:
+    """The evaluation plan a `Costing` compiles from its weights: which
+    components are worth computing.
+
+    - `raw` / `safety`: whether `cost_if` runs the raw view (lateness) /
+      the safety view (drainage, carrying, excess); `demand` is either.
+    - `schedule`: `(summary column, weight)` for each non-zero schedule
+      weight, in `_summary_penalty` order (see `_MoveColumns`).
+    - `priority`, `level_loading`, `old_machine`: whether each
+      cross-cutting term is computed."""
+    raw: bool
+    safety: bool
+    schedule: tuple[tuple[int, float], ...]
+    priority: bool
+    level_loading: bool
+    old_machine: bool
+
+    @property
+    def demand(self) -> bool:
+        return self.raw or self.safety
+
+    @classmethod
+    def of(cls, w: CostWeights, specialize: bool = True) -> '_Evaluator':
+        """The plan for `w`, leaving out its zero-weighted components —
+        or, with `specialize=False`, evaluating every one."""
+        schedule = tuple(enumerate((
+            w.tape_out_single, w.tape_out_both, w.style_change,
+            w.runner_change, w.pattern_change, w.idle_time, w.waste_lbs,
+        )))
+        if not specialize:
+            return cls(True, True, schedule, True, True, True)
+        return cls(
+            raw=w.lateness != 0,
+            safety=(w.drainage != 0 or w.carrying != 0 or w.excess != 0),
+            schedule=tuple((j, x) for j, x in schedule if x != 0),
+            priority=w.priority != 0,
+            level_loading=w.level_loading != 0,
+            old_machine=w.old_machine != 0,
+        )
+
+
+@dataclass(slots=True)
+class _MoveColumns:
+    """A candidate pool laid out column-wise for `Costing.score_many` /
+    `Costing.argmin_after_move`. Row `i` is move `i`; a move's touched
+    items take demand slots `0, 1, ...` (at most `n_slots`).
+
+    - `cells` lists `(row, slot, rls_item, jobs)` per touched item — the
+      `cost_if` calls the move's exact score needs.
+    - `item_base` is every item's baseline weighted demand cost, in
+      `state` order; `item_cols` / `touched` are `(rows, n_slots)`: each
+      cell's position in it, and whether the cell exists.
+    - `demand` / `known` are `(rows, n_slots)`: each cell's weighted
+      `cost_if` cost where it is cached, and whether it is.
+    - `machine_base` is every machine's baseline schedule penalty, in
+      `state` order; `machine_cols` is each move's machine's position in
+      it, and `penalty` that machine's penalty after the move.
+    - `cross` is each move's weighted cross-cutting cost.
+    - `hits` is each move's demand-cache entry, `{item_id: (rls_item,
+      version, weighted cost_if cost)}` (empty when no demand weight is
+      set)."""
+    n_slots: int
+    cells: list[tuple[int, int, 'RlsItem', list[Job]]]
+    item_base: np.ndarray
+    item_cols: np.ndarray
+    touched: np.ndarray
+    demand: np.ndarray
+    known: np.ndarray
+    machine_base: np.ndarray
+    machine_cols: np.ndarray
+    penalty: np.ndarray
+    cross: np.ndarray
+    hits: list[dict[str, tuple['RlsItem', int, float]]]
+
+    def ordered_total(self, demand: np.ndarray) -> np.ndarray:
+        """`Costing._ordered_total` for every row, with `demand[i, j]` as
+        the cost of each touched cell: the items' costs, then the machines'
+        penalties, then `cross`, added one column at a time in `state`
+        order. Entries are laid out one row per item / machine, so each
+        addition runs over contiguous memory."""
+        n = len(self.cross)
+        items = np.repeat(self.item_base[:, None], n, axis=1)
+        r, j = np.nonzero(self.touched)
+        items[self.item_cols[r, j], r] = demand[r, j]
+        machines = np.repeat(self.machine_base[:, None], n, axis=1)
+        machines[self.machine_cols, np.arange(n)] = self.penalty
+        total = np.zeros(n)
+        for entry in items:
+            total += entry
+        for entry in machines:
+            total += entry
+        return total + self.cross
+
+
+def _demand_key(machine: 'Machine', move: Move) -> tuple:
+    """The demand-cache key of `move` on `machine`: the machine's schedule
+    `version` and the `plan_production` inputs — `(start_at, item, lbs,
+    idle_for)`, with the targeted order's week — that fix the move's plan.
+    Plain values, so a pickled or re-planned copy of the move maps to the
+    same entry."""
+    return (
+        move.machine_id, machine.version, move.start_at, move.item.id,
+        move.week_idx, move.lbs, move.idle_for,
+    )
+
+
+def _plan_summary(plan, workcal: 'WorkCal') -> ScheduleSummary:
+    """The plan's `ScheduleSummary` — the one `plan_production` attached, or
+    (for a hand-built plan without one) summarized here."""
+    if plan.summary is not None:
+        return plan.summary
+    return ScheduleSummary.of(plan.activities, workcal)
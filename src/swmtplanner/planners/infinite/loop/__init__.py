@@ -4,13 +4,18 @@ from swmtplanner.planners.infinite.coordination import (
     RegularOrder, SafetyOrder, eligible_orders,
 )
 from .candidates import (
-    DecisionPoint,
-    eligible_decision_points, enumerate_candidates,
+    CandidatePool, DecisionPoint,
+    eligible_decision_points, enumerate_candidates, next_decision_time,
 )
+from .checkpoint import Checkpoint
 from .plan import PlanReport, plan
+from .timing import PhaseStats, PhaseTimer
+from .workers import ScoringPool, ThreadScoringPool
 
 __all__ = [
-    'DecisionPoint', 'RegularOrder', 'SafetyOrder',
+    'CandidatePool', 'DecisionPoint', 'RegularOrder', 'SafetyOrder',
     'eligible_decision_points', 'eligible_orders', 'enumerate_candidates',
-    'PlanReport', 'plan',
+    'next_decision_time',
+    'PlanReport', 'plan', 'ScoringPool', 'ThreadScoringPool', 'Checkpoint',
+    'PhaseStats', 'PhaseTimer',
 ]
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from pathlib import Path
+from typing import ContextManager, Iterable, Literal
 
+from swmtplanner.products import Greige
 from swmtplanner.schedule import Activity, Job
 from swmtplanner.demand.order import RawOrder
 from swmtplanner.demand.rlsitem import CostComponents, RlsItem
@@ -9,13 +11,15 @@ from swmtplanner.debuglog import DebugLog
 from swmtplanner.planners.infinite.costing import Costing
 from swmtplanner.planners.infinite.state import Move, State
 from swmtplanner.planners.infinite.coordination import (
-    RegularOrder, SafetyOrder, eligible_orders,
+    OrderBook, RegularOrder, SafetyOrder, ScoringContext, eligible_orders,
 )
 
 __all__ = [
-    'DecisionPoint', 'RegularOrder', 'SafetyOrder',
+    'CandidatePool', 'DecisionPoint', 'RegularOrder', 'SafetyOrder',
     'eligible_decision_points', 'eligible_orders', 'enumerate_candidates',
-    'PlanReport', 'plan',
+    'next_decision_time',
+    'PlanReport', 'plan', 'ScoringPool', 'ThreadScoringPool', 'Checkpoint',
+    'PhaseStats', 'PhaseTimer',
 ]
 
 
@@ -27,7 +31,92 @@ class DecisionPoint:
 
 
 def eligible_decision_points(state: State) -> list[DecisionPoint]: ...
-def enumerate_candidates(state: State) -> list[Move]: ...
+def enumerate_candidates(
+    state: State, book: OrderBook | None = ...,
+) -> list[Move]: ...
+def next_decision_time(state: State) -> datetime | None: ...
+
+
+class CandidatePool:
+    def __init__(self, machine_ids: Iterable[str] | None = ...) -> None: ...
+    def refresh(
+        self, state: State, book: OrderBook | None = ...,
+    ) -> list[Move]: ...
+    def clear(self) -> None: ...
+
+
+class ScoringPool:
+    def __init__(
+        self, state: State, costing: Costing, n_workers: int,
+    ) -> None: ...
+    @property
+    def n_workers(self) -> int: ...
+    def refresh(self) -> int: ...
+    def best(self) -> Move: ...
+    def commit(self, move: Move) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> ScoringPool: ...
+    def __exit__(self, *exc) -> None: ...
+
+
+class ThreadScoringPool:
+    def __init__(
+        self, state: State, costing: Costing, n_workers: int,
+    ) -> None: ...
+    @property
+    def n_workers(self) -> int: ...
+    def commit(self, move: Move) -> None: ...
+    def best(
+        self, candidates: list[Move], ctx: ScoringContext,
+    ) -> Move: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> ThreadScoringPool: ...
+    def __exit__(self, *exc) -> None: ...
+
+
+class Checkpoint:
+    @classmethod
+    def create(
+        cls, path: str | Path, state: State, *,
+        every_moves: int | None = ..., every_minutes: float | None = ...,
+    ) -> Checkpoint: ...
+    @classmethod
+    def resume(
+        cls, path: str | Path, state: State,
+        greige_by_id: dict[str, Greige], *,
+        every_moves: int | None = ..., every_minutes: float | None = ...,
+    ) -> Checkpoint: ...
+    @property
+    def move_count(self) -> int: ...
+    def record(self, state: State, move: Move) -> None: ...
+    def flush(self) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> Checkpoint: ...
+    def __exit__(self, *exc) -> None: ...
+
+
+@dataclass
+class PhaseStats:
+    count: int = ...
+    total_ns: int = ...
+    min_ns: int | None = ...
+    max_ns: int = ...
+    histogram: dict[int, int] = ...
+    def add(self, ns: int) -> None: ...
+    @property
+    def mean_ns(self) -> float: ...
+
+
+class PhaseTimer:
+    def __init__(self) -> None: ...
+    def phase(self, name: str) -> ContextManager[None]: ...
+    def add(self, name: str, ns: int) -> None: ...
+    @property
+    def stats(self) -> dict[str, PhaseStats]: ...
+    @property
+    def elapsed_s(self) -> float: ...
+    def to_dict(self) -> dict: ...
+    def summary(self) -> str: ...
 
 
 @dataclass
@@ -43,4 +132,6 @@ class PlanReport:
 
 def plan(
     state: State, costing: Costing, *, debuglog: DebugLog | None = ...,
+    workers: int = ..., worker_mode: Literal['process', 'thread'] = ...,
+    checkpoint: Checkpoint | None = ..., timer: PhaseTimer | None = ...,
 ) -> PlanReport: ...
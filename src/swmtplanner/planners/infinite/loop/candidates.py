@@ -3,11 +3,11 @@
 import math
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Literal
+from typing import Iterable, Literal
 
 from swmtplanner.planners.infinite.state import Move, State
 from swmtplanner.planners.infinite.coordination import (
-    RegularOrder, eligible_orders,
+    OrderBook, RegularOrder, eligible_orders,
 )
 
 
@@ -61,7 +61,23 @@ def eligible_decision_points(state: State) -> list[DecisionPoint]:
     return out
 
 
-def enumerate_candidates(state: State) -> list[Move]:
+def next_decision_time(state: State) -> datetime | None:
+    """The earliest decision point (`schedule_tail` or `next_runout`, on
+    any machine) still beyond `state.window_end`, or `None` when every
+    decision point is already in the window. The window has to reach this
+    time before `eligible_decision_points` — and so the candidate pool —
+    can change."""
+    out: datetime | None = None
+    for machine in state.machines.values():
+        for t in (machine.schedule_tail, machine.next_runout):
+            if t > state.window_end and (out is None or t < out):
+                out = t
+    return out
+
+
+def enumerate_candidates(
+    state: State, book: OrderBook | None = None,
+) -> list[Move]:
     """For each combination of (decision point × order) where the
     machine can run the order's item, derive `lbs`, `start_at`,
     `idle_for`, and a cached `plan` from `Machine.plan_production`, then
@@ -71,101 +87,193 @@ def enumerate_candidates(state: State) -> list[Move]:
 
     The Move's `plan` is computed once here so the same plan can be
     reused for scoring (via `Costing.score_after_move`) and committing
-    (via `State.commit_move`) without re-running `plan_production`."""
+    (via `State.commit_move`) without re-running `plan_production`.
+
+    The orders are `book.orders` when the iteration's `OrderBook` is
+    given, else `eligible_orders(state)`."""
     decision_points = eligible_decision_points(state)
-    orders = eligible_orders(state)
+    orders = eligible_orders(state) if book is None else book.orders
 
     out: list[Move] = []
     for dp in decision_points:
         machine = state.machines[dp.machine_id]
         for order in orders:
-            if not order.item.can_run_on_mchn(dp.machine_id):
-                continue
-
-            # 'next_runout' means "finish the current item, then change to a
-            # different one." Pairing it with an order for the machine's
-            # *current* item is a no-op changeover that `plan_production`
-            # rejects (its same-item guard); the 'schedule_tail' point already
-            # covers continuing the current item.
-            if (dp.start_at == 'next_runout'
-                    and order.item == machine.current_status.current_item):
-                continue
-
-            # Carrying-avoidance idle: regular orders idle to a target
-            # `due_date - lead_time - margin`, where `margin` (default
-            # 24h, configured on `State`) is an allowance under the
-            # strict no-carry moment. Computed as **work hours** between
-            # the decision point and the target — naturally clamps to 0
-            # when the target is already in the past. Safety orders
-            # don't idle.
-            if isinstance(order, RegularOrder):
-                rls = state.rls_items[order.item.id]
-                target = (
-                    order.due_date - rls.lead_time
-                    - state.carrying_avoidance_margin
-                )
-                idle_hours = machine.workcal.get_work_hours_between(
-                    dp.time, target,
-                )
-            else:
-                idle_hours = 0.0
-            idle_for = timedelta(hours=idle_hours)
-
-            # Effective production-begin time after any leading idle.
-            effective_start = machine.workcal.offset_work_hours(
-                dp.time, idle_hours,
-            )
+            move = _candidate_for(state, machine, dp, order)
+            if move is not None:
+                out.append(move)
 
-            # Cap window: normally `effective_start` through the end
-            # of the ISO week containing it. But if that window can't
-            # fit even one full roll (e.g., the schedule tail landed
-            # late Friday with not enough work hours left for a
-            # roll), bump the cap end to the end of the *following*
-            # ISO week so a tightly-loaded machine doesn't get
-            # artificially excluded from contention. The decision-
-            # window mechanism still spreads work across machines.
-            producible_cap = _producible_cap_with_bumpup(
-                machine, order.item, effective_start,
-            )
+    return out
+
+
+class CandidatePool:
+    """Candidate moves kept alive across main-loop iterations.
+
+    A committed move only changes the committed machine's schedule and
+    the demand of the items its jobs feed, so most of the previous
+    iteration's `(decision point × order)` pairings are still exactly
+    what `enumerate_candidates` would rebuild. The pool caches each
+    machine's pairings — including the ones that produced no `Move` —
+    against the `Status` object they were planned from. `Machine`
+    replaces its `current_status` on every `add_activities`, so a
+    committed machine misses wholesale; every other machine only misses
+    on orders it hasn't seen in that form before (an order is keyed by
+    value, so a partially filled order — new `lbs` — or an item whose
+    eligible order moved on is a fresh key). Pairings for orders that
+    are no longer eligible are dropped on each refresh.
+
+    `refresh` returns the same moves, in the same order, as
+    `enumerate_candidates` would for the current state, so the
+    main loop's first-encountered tie-break is unaffected. Moves are
+    reused objects: the same `Move` (and plan) is handed out every
+    iteration until it is invalidated or committed.
+
+    With `machine_ids`, the pool pairs only those machines' decision
+    points: `refresh` returns the subsequence of the full list on them.
+    The `ScoringPool` workers each enumerate one block of machines this
+    way."""
+
+    def __init__(self, machine_ids: Iterable[str] | None = None) -> None:
+        # machine_id -> (status planned from, {(start_at, order): move})
+        self._by_machine: dict[str, tuple[object, dict]] = {}
+        self._machine_ids = (
+            None if machine_ids is None else frozenset(machine_ids)
+        )
+
+    def refresh(
+        self, state: State, book: OrderBook | None = None,
+    ) -> list[Move]:
+        """Return the current candidate list, re-planning only the
+        pairings whose inputs changed since the last refresh. Takes the
+        orders from `book` when given, as `enumerate_candidates` does."""
+        decision_points = eligible_decision_points(state)
+        if self._machine_ids is not None:
+            decision_points = [
+                dp for dp in decision_points
+                if dp.machine_id in self._machine_ids
+            ]
+        orders = eligible_orders(state) if book is None else book.orders
+
+        out: list[Move] = []
+        seen: dict[str, dict] = {}
+        for dp in decision_points:
+            machine = state.machines[dp.machine_id]
+            status = machine.current_status
+            entry = self._by_machine.get(dp.machine_id)
+            cached = entry[1] if entry is not None and entry[0] is status \
+                else {}
+            fresh = seen.setdefault(dp.machine_id, {})
+            for order in orders:
+                key = (dp.start_at, order)
+                if key in cached:
+                    move = cached[key]
+                else:
+                    move = _candidate_for(state, machine, dp, order)
+                fresh[key] = move
+                if move is not None:
+                    out.append(move)
 
-            # Round min(order_lbs, producible_cap) down to whole rolls.
-            # Snap near-integer roll counts up to handle float drift
-            # from chained division in the cap calculation.
-            lbs_uncapped = min(order.lbs, producible_cap)
-            n_rolls_exact = lbs_uncapped / order.item.tgt_wt
-            n_rolls_rounded = round(n_rolls_exact)
-            if abs(n_rolls_rounded - n_rolls_exact) < _FLOAT_EPS:
-                n_rolls = n_rolls_rounded
-            else:
-                n_rolls = math.floor(n_rolls_exact)
-            if n_rolls <= 0:
-                continue
-            lbs = n_rolls * order.item.tgt_wt
-
-            plan = machine.plan_production(
-                order.item, lbs,
-                start_at=dp.start_at,
-                idle_for=idle_for,
-                tgt_order=order.order_id,
+        for machine_id, fresh in seen.items():
+            self._by_machine[machine_id] = (
+                state.machines[machine_id].current_status, fresh,
             )
+        return out
 
-            out.append(Move(
-                machine_id=dp.machine_id,
-                item=order.item,
-                lbs=lbs,
-                start_at=dp.start_at,
-                idle_for=idle_for,
-                plan=plan,
-                week_idx=(
-                    order.week_idx if isinstance(order, RegularOrder)
-                    else None
-                ),
-                # The targeted order's unfulfilled lbs (capped production
-                # `lbs` above is separate); carried for the debug log.
-                order_remaining_lbs=order.lbs,
-            ))
+    def clear(self) -> None:
+        """Drop every cached pairing."""
+        self._by_machine.clear()
 
-    return out
+
+def _candidate_for(state: State, machine, dp: DecisionPoint,
+                   order) -> Move | None:
+    """Build the `Move` for one `(decision point × order)` pairing, or
+    `None` when the pairing can't place anything (the item can't run on
+    the machine, it's a same-item `'next_runout'` pairing, or the
+    producible cap is under one roll)."""
+    if not order.item.can_run_on_mchn(dp.machine_id):
+        return None
+
+    # 'next_runout' means "finish the current item, then change to a
+    # different one." Pairing it with an order for the machine's
+    # *current* item is a no-op changeover that `plan_production`
+    # rejects (its same-item guard); the 'schedule_tail' point already
+    # covers continuing the current item.
+    if (dp.start_at == 'next_runout'
+            and order.item == machine.current_status.current_item):
+        return None
+
+    # Carrying-avoidance idle: regular orders idle to a target
+    # `due_date - lead_time - margin`, where `margin` (default
+    # 24h, configured on `State`) is an allowance under the
+    # strict no-carry moment. Computed as **work hours** between
+    # the decision point and the target — naturally clamps to 0
+    # when the target is already in the past. Safety orders
+    # don't idle.
+    if isinstance(order, RegularOrder):
+        rls = state.rls_items[order.item.id]
+        target = (
+            order.due_date - rls.lead_time
+            - state.carrying_avoidance_margin
+        )
+        idle_hours = machine.workcal.get_work_hours_between(
+            dp.time, target,
+        )
+    else:
+        idle_hours = 0.0
+    idle_for = timedelta(hours=idle_hours)
+
+    # Effective production-begin time after any leading idle.
+    effective_start = machine.workcal.offset_work_hours(
+        dp.time, idle_hours,
+    )
+
+    # Cap window: normally `effective_start` through the end
+    # of the ISO week containing it. But if that window can't
+    # fit even one full roll (e.g., the schedule tail landed
+    # late Friday with not enough work hours left for a
+    # roll), bump the cap end to the end of the *following*
+    # ISO week so a tightly-loaded machine doesn't get
+    # artificially excluded from contention. The decision-
+    # window mechanism still spreads work across machines.
+    producible_cap = _producible_cap_with_bumpup(
+        machine, order.item, effective_start,
+    )
+
+    # Round min(order_lbs, producible_cap) down to whole rolls.
+    # Snap near-integer roll counts up to handle float drift
+    # from chained division in the cap calculation.
+    lbs_uncapped = min(order.lbs, producible_cap)
+    n_rolls_exact = lbs_uncapped / order.item.tgt_wt
+    n_rolls_rounded = round(n_rolls_exact)
+    if abs(n_rolls_rounded - n_rolls_exact) < _FLOAT_EPS:
+        n_rolls = n_rolls_rounded
+    else:
+        n_rolls = math.floor(n_rolls_exact)
+    if n_rolls <= 0:
+        return None
+    lbs = n_rolls * order.item.tgt_wt
+
+    plan = machine.plan_production(
+        order.item, lbs,
+        start_at=dp.start_at,
+        idle_for=idle_for,
+        tgt_order=order.order_id,
+    )
+
+    return Move(
+        machine_id=dp.machine_id,
+        item=order.item,
+        lbs=lbs,
+        start_at=dp.start_at,
+        idle_for=idle_for,
+        plan=plan,
+        week_idx=(
+            order.week_idx if isinstance(order, RegularOrder)
+            else None
+        ),
+        # The targeted order's unfulfilled lbs (capped production
+        # `lbs` above is separate); carried for the debug log.
+        order_remaining_lbs=order.lbs,
+    )
 
 
 def _end_of_iso_week(t: datetime) -> datetime:
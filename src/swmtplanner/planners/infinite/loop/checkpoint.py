@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+
+import io
+import pickle
+import struct
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, TYPE_CHECKING
+
+from swmtplanner.products import Greige
+from swmtplanner.schedule import id_counters, restore_id_counters
+
+if TYPE_CHECKING:
+    from swmtplanner.planners.infinite.state import Move, State
+
+
+# Bumped whenever the record layout changes; `resume` refuses other versions.
+CHECKPOINT_FORMAT = 2
+
+# Length prefix of every record after the header: the pickled record's size
+# in bytes, little-endian.
+_FRAME = struct.Struct('<Q')
+
+
+class Checkpoint:
+    """Append-only checkpoint log of a `plan` run, from which `resume`
+    rebuilds the run's `State` and lets the loop carry on.
+
+    The log is a stream of pickled records. The first is a header naming
+    the run's inputs (start date, machine ids, rls_item ids) so a resume
+    against different inputs is refused. Every later record is framed by
+    its length (`_FRAME`) and holds the moves
+    committed since the previous one plus the loop knobs as of the last of
+    them: `window_end`, `reference_week_idx`, the move count, and the
+    activity / job id counters (see `schedule.id_counters`). Replaying the
+    moves through `State.commit_move` restores each machine's activity and
+    job logs and each `RlsItem`'s registered jobs, exactly as committed —
+    ids included.
+
+    Writing is incremental: `record` (called by the loop after each commit)
+    only queues the move, and the queue is pickled and appended as one
+    record once `every_moves` moves or `every_minutes` minutes have passed
+    since the last write (either trigger may be `None` to disable it), and
+    on `flush` / `close`. `Greige` items are written by id, not by value,
+    so a record is just the moves' own activities and jobs.
+
+    A record cut short (the process died mid-write) is dropped on resume,
+    along with the moves in it; the run continues from the last complete
+    record. The frame tells a cut-short record from a complete one before
+    it is unpickled, so whatever a partial pickle would raise never comes
+    into it.
+
+    Create with `create` or `resume`, and use as a context manager (or call
+    `close`) so the queued tail is written."""
+
+    def __init__(
+        self, fh: BinaryIO, move_count: int, *,
+        every_moves: int | None, every_minutes: float | None,
+    ) -> None:
+        if every_moves is not None and every_moves < 1:
+            raise ValueError(f'every_moves must be >= 1, got {every_moves}')
+        if every_minutes is not None and every_minutes <= 0:
+            raise ValueError(
+                f'every_minutes must be > 0, got {every_minutes}'
+            )
+        self._fh = fh
+        self._move_count = move_count
+        self._every_moves = every_moves
+        self._every_secs = None if every_minutes is None else every_minutes * 60
+        self._pending: list['Move'] = []
+        self._knobs: tuple[datetime, int] | None = None
+        self._last_write = time.monotonic()
+
+    @classmethod
+    def create(
+        cls, path: str | Path, state: 'State', *,
+        every_moves: int | None = 100, every_minutes: float | None = 5.0,
+    ) -> 'Checkpoint':
+        """Start a new checkpoint log at `path` for a run over `state`
+        (before any move is committed). Refuses to overwrite an existing
+        file."""
+        fh = open(path, 'xb')
+        pickle.dump(('header', _header(state)), fh)
+        fh.flush()
+        return cls(
+            fh, 0, every_moves=every_moves, every_minutes=every_minutes,
+        )
+
+    @classmethod
+    def resume(
+        cls, path: str | Path, state: 'State',
+        greige_by_id: dict[str, Greige], *,
+        every_moves: int | None = 100, every_minutes: float | None = 5.0,
+    ) -> 'Checkpoint':
+        """Restore the run logged at `path` onto `state` — freshly built
+        from the same inputs — and return a `Checkpoint` that appends to
+        the same log. `greige_by_id` resolves the logged item ids. Raises
+        `ValueError` if the log isn't a checkpoint, was written for
+        different inputs, or holds a complete record that won't load."""
+        fh = open(path, 'r+b')
+        try:
+            move_count = _replay(fh, state, greige_by_id)
+        except BaseException:
+            fh.close()
+            raise
+        return cls(
+            fh, move_count,
+            every_moves=every_moves, every_minutes=every_minutes,
+        )
+
+    @property
+    def move_count(self) -> int:
+        """Moves committed so far by the run, including replayed ones."""
+        return self._move_count
+
+    def record(self, state: 'State', move: 'Move') -> None:
+        """Queue `move`, just committed to `state`, and write the queue out
+        if a checkpoint is due."""
+        self._pending.append(move)
+        self._move_count += 1
+        self._knobs = (state.window_end, state.reference_week_idx)
+        if (
+            self._every_moves is not None
+            and len(self._pending) >= self._every_moves
+        ) or (
+            self._every_secs is not None
+            and time.monotonic() - self._last_write >= self._every_secs
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the queued moves (if any) as one record."""
+        if self._pending:
+            window_end, reference_week_idx = self._knobs
+            knobs = {
+                'move_count': self._move_count,
+                'window_end': window_end,
+                'reference_week_idx': reference_week_idx,
+                'id_counters': id_counters(),
+            }
+            buf = io.BytesIO()
+            _Pickler(buf).dump(('moves', tuple(self._pending), knobs))
+            payload = buf.getvalue()
+            self._fh.write(_FRAME.pack(len(payload)) + payload)
+            self._fh.flush()
+            self._pending = []
+        self._last_write = time.monotonic()
+
+    def close(self) -> None:
+        """Write the queued moves and close the log."""
+        if self._fh.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._fh.close()
+
+    def __enter__(self) -> 'Checkpoint':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _Pickler(pickle.Pickler):
+    """Writes `Greige` items as their id: they're input data, rebuilt (and
+    shared by identity) on resume."""
+
+    def persistent_id(self, obj):
+        # Exact-class check: `isinstance` against `Greige` goes through the
+        # protocol check `HasID` brings in.
+        if type(obj) is Greige:
+            return obj.id
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+
+    def __init__(self, fh: BinaryIO, greige_by_id: dict[str, Greige]) -> None:
+        super().__init__(fh)
+        self._greige_by_id = greige_by_id
+
+    def persistent_load(self, pid):
+        try:
+            return self._greige_by_id[pid]
+        except KeyError:
+            raise ValueError(
+                f'checkpoint references unknown greige item {pid!r}'
+            ) from None
+
+
+def _header(state: 'State') -> dict:
+    return {
+        'format': CHECKPOINT_FORMAT,
+        'start_date': state.start_date,
+        'machines': sorted(state.machines),
+        'rls_items': sorted(state.rls_items),
+    }
+
+
+def _replay(
+    fh: BinaryIO, state: 'State', greige_by_id: dict[str, Greige],
+) -> int:
+    """Apply every complete record of the log open on `fh` to `state`,
+    truncate anything after the last one, and return the logged move
+    count. Only whole frames are unpickled: a short length prefix or
+    payload is the tail of a write cut short."""
+    name = getattr(fh, 'name', '<checkpoint>')
+    try:
+        kind, header = pickle.load(fh)
+    except Exception:
+        raise ValueError(f'{name}: not a checkpoint file') from None
+    if kind != 'header' or header.get('format') != CHECKPOINT_FORMAT:
+        raise ValueError(f'{name}: not a checkpoint file of a supported format')
+    if header != _header(state):
+        raise ValueError(
+            f'{name}: checkpoint was written for different inputs '
+            f'(start date, machines or rls_items differ)'
+        )
+
+    move_count = 0
+    good_end = fh.tell()
+    while True:
+        prefix = fh.read(_FRAME.size)
+        if len(prefix) < _FRAME.size:
+            # End of log, or a record cut short in its length prefix.
+            break
+        (size,) = _FRAME.unpack(prefix)
+        payload = fh.read(size)
+        if len(payload) < size:
+            # A record cut short mid-write.
+            break
+        try:
+            _, moves, knobs = _Unpickler(
+                io.BytesIO(payload), greige_by_id,
+            ).load()
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise ValueError(
+                f'{name}: corrupt checkpoint record at byte {good_end}'
+            ) from exc
+        for move in moves:
+            state.commit_move(move)
+        state.window_end = knobs['window_end']
+        state.reference_week_idx = knobs['reference_week_idx']
+        restore_id_counters(knobs['id_counters'])
+        move_count = knobs['move_count']
+        good_end = fh.tell()
+
+    fh.seek(good_end)
+    fh.truncate()
+    return move_count
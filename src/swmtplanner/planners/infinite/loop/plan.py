@@ -1,19 +1,26 @@
 #!/usr/bin/env python
 
 from dataclasses import dataclass, fields
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Literal
 
 from swmtplanner.demand.rlsitem import CostComponents, RlsItem
 
-from swmtplanner.planners.infinite.coordination import build_context
+from swmtplanner.planners.infinite.coordination import (
+    build_context, build_order_book,
+)
 from swmtplanner.planners.infinite.costing import Costing
 from swmtplanner.planners.infinite.report import (
     demand_dataframe, unmet_demand_dataframe,
 )
 from swmtplanner.planners.infinite.state import State
 
-from .candidates import enumerate_candidates
+from .candidates import (
+    CandidatePool, enumerate_candidates, next_decision_time,
+)
+from .checkpoint import Checkpoint
+from .timing import PhaseTimer
+from .workers import ScoringPool, ThreadScoringPool
 
 if TYPE_CHECKING:
     from swmtplanner.demand.order import RawOrder
@@ -47,6 +54,8 @@ class PlanReport:
 
 def plan(
     state: State, costing: Costing, *, debuglog: 'DebugLog | None' = None,
+    workers: int = 0, worker_mode: Literal['process', 'thread'] = 'process',
+    checkpoint: Checkpoint | None = None, timer: PhaseTimer | None = None,
 ) -> PlanReport:
     """Greedy planner. Iterates enumerate → score → commit-lowest,
     advancing the decision window as needed to keep the candidate pool
@@ -74,25 +83,107 @@ def plan(
     copies are written once from the finished report. When absent, the hot path
     (scalar score, pick the min) runs and nothing is logged. (The old
     `verbose`-flag audit reconstruction stays divorced; the `PlanReport` detail
-    tuples remain `None`.)"""
+    tuples remain `None`.)
+
+    `workers` (hot path only) enumerates and scores each iteration's
+    candidates on that many persistent worker processes, one block of
+    machines each (see `ScoringPool`), instead of in-process, or — with
+    `worker_mode='thread'` — scores them on that many threads sharing
+    `state` (see `ThreadScoringPool`). The committed move — and so the
+    whole plan — is the same as the serial run's. `0` (the default) keeps
+    scoring serial; the debug path is always serial.
+
+    `checkpoint` is an optional `Checkpoint` the loop reports every committed
+    move to, so an interrupted run can be picked up again (see
+    `Checkpoint.resume`). When it was resumed, `state` already holds the
+    logged moves and the move count carries on from the log's. The caller
+    owns it and closes it after `plan` returns.
+
+    `timer` is an optional `PhaseTimer` the loop's phases are timed into
+    (`enumerate`, `advance_window`, `context`, `score`, `commit` and, within
+    it, `register_jobs`, plus `checkpoint` and the final `report`); the
+    caller reads the totals off it afterwards. Without one the loop still
+    times itself, into a throwaway timer."""
+    if workers < 0:
+        raise ValueError(f'workers must be >= 0, got {workers}')
+    if worker_mode not in ('process', 'thread'):
+        raise ValueError(
+            f"worker_mode must be 'process' or 'thread', got {worker_mode!r}"
+        )
     horizon = _compute_horizon(state)
+    if timer is None:
+        timer = PhaseTimer()
 
     if debuglog is not None:
         _emit_run_configs(debuglog, state, costing)
 
-    move_count = 0
+    # The hot path keeps its candidates alive across iterations and only
+    # re-plans what the last commit invalidated. The debug path always
+    # enumerates fresh: its per-candidate rows are keyed by activity / knit
+    # id, and reused moves would overwrite the previous iteration's rows.
+    if debuglog is None:
+        enumerate_moves = CandidatePool().refresh
+    else:
+        enumerate_moves = enumerate_candidates
+
+    pool = None
+    if workers > 0 and debuglog is None:
+        if worker_mode == 'thread':
+            pool = ThreadScoringPool(state, costing, workers)
+        else:
+            pool = ScoringPool(state, costing, workers)
+    try:
+        if isinstance(pool, ScoringPool):
+            _run_pool_loop(state, horizon, pool, checkpoint, timer)
+        else:
+            _run_loop(
+                state, costing, horizon, enumerate_moves, debuglog, pool,
+                checkpoint, timer,
+            )
+    finally:
+        if pool is not None:
+            pool.close()
 
+    print()
+    with timer.phase('report'):
+        report = _build_report(state, costing)
+    if debuglog is not None:
+        _emit_demand_tables(debuglog, report)
+    return report
+
+
+def _run_loop(
+    state: State, costing: Costing, horizon: datetime, enumerate_moves,
+    debuglog: 'DebugLog | None',
+    pool: ThreadScoringPool | None,
+    checkpoint: Checkpoint | None = None, timer: PhaseTimer | None = None,
+) -> None:
+    """The enumerate → score → commit loop of `plan`, run until no candidates
+    remain. Scores through `pool` when one is given, reports each commit
+    to `checkpoint` when one is given, and times each phase into `timer`."""
+    if timer is None:
+        timer = PhaseTimer()
+    phase = timer.phase
+    move_count = 0 if checkpoint is None else checkpoint.move_count
     while True:
         print(f'Total moves committed: {move_count}', end='\r')
-        candidates = enumerate_candidates(state)
+        # One order book per iteration, shared by enumeration, the scoring
+        # context and (through it) the cost layer. Advancing the window
+        # moves only `window_end`, which the book does not read.
+        with phase('enumerate'):
+            book = build_order_book(state)
+            candidates = enumerate_moves(state, book)
         # Advance the window as needed: when below threshold AND the
-        # window hasn't reached the horizon, ask for more decisions.
+        # window hasn't reached the horizon, ask for more decisions —
+        # jumping straight to the step that admits the next one.
         while (
             len(candidates) < state.candidate_threshold
             and state.window_end < horizon
         ):
-            state.advance_window()
-            candidates = enumerate_candidates(state)
+            with phase('advance_window'):
+                state.advance_window(_window_steps(state, horizon))
+            with phase('enumerate'):
+                candidates = enumerate_moves(state, book)
 
         # Terminate when nothing more is eligible — even after the
         # window has been pushed to the horizon.
@@ -100,38 +191,102 @@ def plan(
             break
 
         # Build the per-iteration scoring context (priorities, earliest
-        # DP time, new-machine availability) once before scoring.
-        ctx = build_context(state, candidates)
-
-        if debuglog is None:
-            # Hot path: scalar score only, pick the min.
-            _, best_move = min(
-                ((costing.score_after_move(state, m, ctx), m)
-                 for m in candidates),
-                key=lambda pair: pair[0],
-            )
-        else:
-            # Debug path: record this iteration's window/reference-week state
-            # (parent of the iteration_log rows), then score and rank the full
-            # candidate list, writing each to `iteration_log` (and, via
-            # score_after_move, `cost_summary`).
-            debuglog.add_row(
-                'iteration_states', iteration_idx=move_count,
-                window_end=state.window_end,
-                reference_week=state.reference_week_idx,
-            )
-            best_move = _log_iteration(
-                debuglog, state, costing, ctx, candidates, move_count,
-            )
-        state.commit_move(best_move)
+        # DP time, new-machine availability) once before scoring, on the
+        # iteration's order book.
+        with phase('context'):
+            ctx = build_context(state, candidates, book)
+
+        with phase('score'):
+            if pool is not None:
+                # Hot path, parallel: same argmin (and tie-break) as below.
+                best_move = pool.best(candidates, ctx)
+            elif debuglog is None:
+                # Hot path: scalar score only, pick the min. Branch and
+                # bound skips the demand simulation for candidates that
+                # can't win.
+                best_idx, _ = costing.argmin_after_move(state, candidates, ctx)
+                best_move = candidates[best_idx]
+            else:
+                # Debug path: record this iteration's window/reference-week
+                # state (parent of the iteration_log rows), then score and
+                # rank the full candidate list, writing each to
+                # `iteration_log` (and, via score_after_move, `cost_summary`).
+                debuglog.add_row(
+                    'iteration_states', iteration_idx=move_count,
+                    window_end=state.window_end,
+                    reference_week=state.reference_week_idx,
+                )
+                best_move = _log_iteration(
+                    debuglog, state, costing, ctx, candidates, move_count,
+                )
+        with phase('commit'):
+            state.commit_move(best_move, timer=timer)
+            if pool is not None:
+                pool.commit(best_move)
+        if checkpoint is not None:
+            with phase('checkpoint'):
+                checkpoint.record(state, best_move)
 
         move_count += 1
 
-    print()
-    report = _build_report(state, costing)
-    if debuglog is not None:
-        _emit_demand_tables(debuglog, report)
-    return report
+
+def _run_pool_loop(
+    state: State, horizon: datetime, pool: ScoringPool,
+    checkpoint: Checkpoint | None, timer: PhaseTimer,
+) -> None:
+    """`_run_loop` with enumeration and scoring on the `ScoringPool`
+    workers: the main process only advances the window, commits, and
+    checkpoints. Same moves, in the same order, as `_run_loop`. The
+    enumeration and scoring context are built on the workers, so their
+    time is spent under `enumerate` and `score`."""
+    phase = timer.phase
+    move_count = 0 if checkpoint is None else checkpoint.move_count
+    while True:
+        print(f'Total moves committed: {move_count}', end='\r')
+        with phase('enumerate'):
+            n_candidates = pool.refresh()
+        while (
+            n_candidates < state.candidate_threshold
+            and state.window_end < horizon
+        ):
+            with phase('advance_window'):
+                state.advance_window(_window_steps(state, horizon))
+            with phase('enumerate'):
+                n_candidates = pool.refresh()
+        if not n_candidates:
+            break
+
+        with phase('score'):
+            best_move = pool.best()
+        with phase('commit'):
+            # Workers replay and re-enumerate while this commits.
+            pool.commit(best_move)
+            state.commit_move(best_move, timer=timer)
+        if checkpoint is not None:
+            with phase('checkpoint'):
+                checkpoint.record(state, best_move)
+
+        move_count += 1
+
+
+def _window_steps(state: State, horizon: datetime) -> int:
+    """How many `window_advance_amount` steps to advance the window by:
+    the fewest that bring the next out-of-window decision point in (see
+    `next_decision_time`), but never more than it takes to reach `horizon`.
+
+    The candidate pool depends on `window_end` only through which decision
+    points it admits, so every step short of that one would re-enumerate
+    the same pool. Jumping lands on exactly the `window_end` that
+    single-stepping would have stopped at."""
+    amount = state.window_advance_amount
+    if amount <= timedelta(0):
+        return 1
+    to_horizon = -(-(horizon - state.window_end) // amount)
+    target = next_decision_time(state)
+    if target is None:
+        return max(1, to_horizon)
+    to_target = -(-(target - state.window_end) // amount)
+    return max(1, min(to_target, to_horizon))
 
 
 def _targeted_order_id(move: 'Move') -> str | None:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+
+@dataclass
+class PhaseStats:
+    """Wall-clock totals for one loop phase: how many times it ran, the
+    total / fastest / slowest duration (nanoseconds), and a latency
+    histogram. `histogram[k]` counts the runs that took `[2**(k-1),
+    2**k)` microseconds (`histogram[0]`: under 1 µs) — power-of-two
+    buckets, so the shape of the distribution survives without keeping
+    every sample."""
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int | None = None
+    max_ns: int = 0
+    histogram: dict[int, int] = field(default_factory=dict)
+
+    def add(self, ns: int) -> None:
+        """Record one run that took `ns` nanoseconds."""
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        bucket = (ns // 1000).bit_length()
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+
+class PhaseTimer:
+    """Per-phase timing for the planner loop. The loop wraps each phase —
+    candidate enumeration, window advances, the scoring context, scoring,
+    the commit, and inside it the `RlsItem.register_jobs` recomputes — in
+    `phase(name)`, which costs two clock reads; phases nest, and a nested
+    phase's time also counts toward its parent's.
+
+    `summary()` renders the totals as a text table (slowest phase first)
+    and `to_dict()` as plain JSON-ready data."""
+
+    def __init__(self) -> None:
+        self._stats: dict[str, PhaseStats] = {}
+        self._started = time.perf_counter_ns()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the `with` block as one run of phase `name`."""
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - t0)
+
+    def add(self, name: str, ns: int) -> None:
+        """Record one run of phase `name` that took `ns` nanoseconds."""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = PhaseStats()
+        stats.add(ns)
+
+    @property
+    def stats(self) -> dict[str, PhaseStats]:
+        """The per-phase totals, in first-seen order."""
+        return dict(self._stats)
+
+    @property
+    def elapsed_s(self) -> float:
+        """Wall-clock seconds since the timer was created."""
+        return (time.perf_counter_ns() - self._started) / 1e9
+
+    def to_dict(self) -> dict:
+        """The totals as JSON-ready data: wall-clock `elapsed_s` and, per
+        phase, `count`, `total_s`, `mean_s`, `min_s`, `max_s` and the
+        histogram as `[{'lt_us': upper_bound, 'count': n}, ...]` in
+        increasing bucket order."""
+        return {
+            'elapsed_s': self.elapsed_s,
+            'phases': {
+                name: {
+                    'count': s.count,
+                    'total_s': s.total_ns / 1e9,
+                    'mean_s': s.mean_ns / 1e9,
+                    'min_s': (s.min_ns or 0) / 1e9,
+                    'max_s': s.max_ns / 1e9,
+                    'histogram': [
+                        {'lt_us': 1 << k, 'count': s.histogram[k]}
+                        for k in sorted(s.histogram)
+                    ],
+                }
+                for name, s in self._stats.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """A text table of the per-phase totals, slowest phase first."""
+        rows = sorted(
+            self._stats.items(), key=lambda kv: kv[1].total_ns, reverse=True,
+        )
+        width = max((len(name) for name, _ in rows), default=5)
+        lines = [
+            f'{"phase":<{width}}  {"count":>8}  {"total s":>10}  '
+            f'{"mean ms":>10}  {"max ms":>10}'
+        ]
+        for name, s in rows:
+            lines.append(
+                f'{name:<{width}}  {s.count:>8}  {s.total_ns / 1e9:>10.3f}  '
+                f'{s.mean_ns / 1e6:>10.3f}  {s.max_ns / 1e6:>10.3f}'
+            )
+        return '\n'.join(lines)
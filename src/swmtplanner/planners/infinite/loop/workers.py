@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+
+import multiprocessing
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from swmtplanner.planners.infinite.coordination import (
+    CandidateSummary, build_context_from_summary, build_order_book,
+    merge_summaries, summarize_candidates,
+)
+from swmtplanner.planners.infinite.costing import Costing
+
+from .candidates import CandidatePool
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from swmtplanner.planners.infinite.coordination import ScoringContext
+    from swmtplanner.planners.infinite.state import Move, State
+
+
+class ScoringPool:
+    """Persistent worker processes that enumerate and score candidate moves
+    in parallel.
+
+    Each worker is started with a pickled replica of the `State`, its own
+    `Costing` (same weights) and one contiguous block of the machines (in
+    `state.machines` order), and keeps the replica in step with the primary
+    state. A worker only ever enumerates and scores its own block's
+    candidates, on its replica, with a `CandidatePool` restricted to the
+    block — so the blocks, in order, are the serial candidate list cut into
+    consecutive slices. Moves never cross the pipe except the winners.
+
+    Per iteration:
+
+    - `refresh` sends the primary's `window_end` and `reference_week_idx`;
+      each worker (re-)enumerates its block and answers with its
+      `CandidateSummary`. Returns the total candidate count.
+    - `best` merges the summaries and sends the merge back; each worker
+      builds the iteration's `ScoringContext` from it
+      (`build_context_from_summary`, the same context `build_context`
+      gives over the whole list) and answers with the first
+      lowest-scoring move of its block (`Costing.argmin_after_move`).
+      The blocks are combined in order with a strict `<`, so the result
+      is the same move — same first-encountered tie-break — as the
+      serial `min(..., key=score)` over the whole list. Scores are
+      bit-identical to the serial path: the replicas hold the same
+      values and run the same code. The winner's activities, rolls and
+      jobs were built in a worker, with that worker's id counters, so
+      `best` rebuilds them here (`ProductionPlan.with_fresh_ids`) before
+      returning the move: the ids on the primary schedule come from the
+      primary's counters, are unique, and are what `id_counters` saves.
+    - `commit` sends the committed move to every worker right away, and
+      each replays it through `State.commit_move` and re-enumerates,
+      ahead of the next `refresh`. The replicas so hold the same ids as
+      the primary.
+
+    Use as a context manager (or call `close`) so the workers are shut
+    down."""
+
+    def __init__(
+        self, state: 'State', costing: Costing, n_workers: int,
+    ) -> None:
+        if n_workers < 1:
+            raise ValueError(f'n_workers must be >= 1, got {n_workers}')
+        mp = multiprocessing.get_context()
+        self._state = state
+        self._conns: list['Connection'] = []
+        self._procs = []
+        self._summaries: list[CandidateSummary] = []
+        machine_ids = list(state.machines)
+        size, extra = divmod(len(machine_ids), n_workers)
+        lo = 0
+        for i in range(n_workers):
+            hi = lo + size + (i < extra)
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker_main, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+            parent.send((state, costing.weights, machine_ids[lo:hi]))
+            self._conns.append(parent)
+            self._procs.append(proc)
+            lo = hi
+
+    @property
+    def n_workers(self) -> int:
+        return len(self._conns)
+
+    def refresh(self) -> int:
+        """Enumerate the candidates of the primary state's current window
+        on the workers; return how many there are."""
+        window = (self._state.window_end, self._state.reference_week_idx)
+        for conn in self._conns:
+            conn.send(('refresh', window))
+        self._summaries = self._gather()
+        return sum(s.n_candidates for s in self._summaries)
+
+    def best(self) -> 'Move':
+        """The lowest-scoring move of the last `refresh`'s candidates (the
+        first one on a tie), with ids minted in this process."""
+        summary = merge_summaries(self._summaries)
+        if not summary.n_candidates:
+            raise ValueError('best() needs at least one candidate')
+        for conn in self._conns:
+            conn.send(('best', summary))
+        # The first strict minimum over the blocks in order, as `_combine`.
+        best = None
+        for idx, score, move in self._gather():
+            if idx is not None and (best is None or score < best[0]):
+                best = (score, move)
+        move = best[1]
+        return replace(move, plan=move.plan.with_fresh_ids())
+
+    def commit(self, move: 'Move') -> None:
+        """Replay `move` on every replica. Call when committing it to the
+        primary state — before or after: the pool does not read it."""
+        for conn in self._conns:
+            conn.send(('commit', move))
+
+    def _gather(self) -> list:
+        """Every worker's answer to the last request, in worker order."""
+        out = []
+        for conn in self._conns:
+            status, payload = conn.recv()
+            if status == 'error':
+                raise RuntimeError(f'scoring worker failed:\n{payload}')
+            out.append(payload)
+        return out
+
+    def close(self) -> None:
+        """Stop the workers."""
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        self._conns = []
+        self._procs = []
+
+    def __enter__(self) -> 'ScoringPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ThreadScoringPool:
+    """Threads that score candidate moves in parallel, against the primary
+    `State` itself.
+
+    Scoring only reads the state — `RlsItem.cost_if` simulates on scratch
+    state — so the threads share it and `commit` has nothing to ship. Each
+    thread's chunk is scored by its own `Costing` (same weights), since a
+    `Costing`'s cached baseline is rebuilt as it scores.
+
+    `best` splits the candidates into contiguous chunks, one per thread,
+    and keeps the first strict minimum across the chunks in order, so it
+    picks the same move as the serial scan. Under the GIL the threads take
+    turns on the Python parts; this pays off on free-threaded builds, or
+    once the simulation itself releases the GIL.
+
+    Use as a context manager (or call `close`) so the threads are shut
+    down."""
+
+    def __init__(
+        self, state: 'State', costing: Costing, n_workers: int,
+    ) -> None:
+        if n_workers < 1:
+            raise ValueError(f'n_workers must be >= 1, got {n_workers}')
+        self._state = state
+        self._costings = [Costing(costing.weights) for _ in range(n_workers)]
+        self._executor = ThreadPoolExecutor(
+            max_workers=n_workers, thread_name_prefix='scoring',
+        )
+
+    @property
+    def n_workers(self) -> int:
+        return len(self._costings)
+
+    def commit(self, move: 'Move') -> None:
+        """No-op: the threads score the primary state, which already holds
+        the move. Kept so the loop drives both pools alike."""
+
+    def best(
+        self, candidates: list['Move'], ctx: 'ScoringContext',
+    ) -> 'Move':
+        """The lowest-scoring move of `candidates` (the first one on a
+        tie), scored against the state and `ctx`."""
+        if not candidates:
+            raise ValueError('best() needs at least one candidate')
+        n = len(candidates)
+        size = -(-n // self.n_workers)
+        futures = []
+        for i, costing in enumerate(self._costings):
+            lo = i * size
+            if lo >= n:
+                break
+            futures.append((lo, self._executor.submit(
+                costing.argmin_after_move,
+                self._state, candidates[lo:lo + size], ctx,
+            )))
+        return candidates[_combine(
+            [(lo, *future.result()) for lo, future in futures]
+        )]
+
+    def close(self) -> None:
+        """Stop the threads."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ThreadScoringPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _combine(results: list[tuple[int, int | None, float | None]]) -> int:
+    """The overall best index from per-chunk `(chunk start, index in chunk,
+    score)` results, in chunk order (index `None` for an empty chunk). A
+    strict `<` keeps the earliest chunk's move on a tie, as the serial scan
+    would."""
+    best_idx = best_score = None
+    for lo, idx, score in results:
+        if idx is None:
+            continue
+        if best_score is None or score < best_score:
+            best_idx, best_score = lo + idx, score
+    return best_idx
+
+
+def _worker_main(conn: 'Connection') -> None:
+    """Worker loop: receive the replica and the block of machines, then
+    serve requests in order.
+
+    - `('commit', move)` replays the move and re-enumerates. It sends no
+      answer; a failure is answered at the next request.
+    - `('refresh', (window_end, reference_week_idx))` brings the replica's
+      window in line, re-enumerating if it moved, and answers
+      `('ok', CandidateSummary)`.
+    - `('best', merged summary)` builds the context and answers
+      `('ok', (index, score, move))` for the block's best move (all
+      `None` for an empty block).
+
+    Any failure is answered `('error', traceback)`."""
+    state, weights, machine_ids = conn.recv()
+    costing = Costing(weights)
+    pool = CandidatePool(machine_ids)
+    book = None
+    moves: list['Move'] = []
+    summary = None
+    # The (window_end, reference_week_idx) `moves` were enumerated at.
+    basis = None
+    error = None
+
+    def enumerate_moves(rebuild_book: bool) -> None:
+        nonlocal book, moves, summary, basis
+        if rebuild_book or book is None:
+            book = build_order_book(state)
+        moves = pool.refresh(state, book)
+        summary = summarize_candidates(state, moves, book)
+        basis = (state.window_end, state.reference_week_idx)
+
+    # Enumerate up front, ahead of the first `refresh`.
+    try:
+        enumerate_moves(True)
+    except Exception:
+        error = traceback.format_exc()
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+        kind, payload = msg
+        if kind == 'commit':
+            if error is None:
+                try:
+                    state.commit_move(payload)
+                    enumerate_moves(True)
+                except Exception:
+                    error = traceback.format_exc()
+            continue
+        if error is not None:
+            conn.send(('error', error))
+            continue
+        try:
+            if kind == 'refresh':
+                if basis != payload:
+                    state.window_end, ref = payload
+                    rebuild = ref != state.reference_week_idx
+                    state.reference_week_idx = ref
+                    enumerate_moves(rebuild)
+                conn.send(('ok', summary))
+            elif moves:
+                ctx = build_context_from_summary(state, payload, book)
+                idx, score = costing.argmin_after_move(state, moves, ctx)
+                conn.send(('ok', (idx, score, moves[idx])))
+            else:
+                conn.send(('ok', (None, None, None)))
+        except Exception:
+            conn.send(('error', traceback.format_exc()))
+    conn.close()
@@ -142,9 +142,7 @@ def production_dataframe(report: 'PlanReport') -> pd.DataFrame:
     rows = []
     for item_id, jobs in report.jobs_by_item.items():
         for job in jobs:
-            completion = (
-                job.rolls[-1].completion_time if job.rolls else pd.NaT
-            )
+            completion = job.completion_time or pd.NaT
             rows.append({
                 'item': item_id,
                 'job_id': job.id,
@@ -31,7 +31,7 @@ from .costing import (
 )
 from swmtplanner.dashboard import DatabaseConfigError, resolve_conn_config
 from .sqldump import PersistenceError, persist_run
-from .loop import plan
+from .loop import Checkpoint, PhaseTimer, plan
 from .report import write_plan_report_xlsx
 from .state import State
 
@@ -209,6 +209,48 @@ _Verbose = Annotated[bool, typer.Option(
          'database (a run-tagged row-set for the knit-debug investigation '
          'app). Requires --label and prompts for run notes in vi.',
 )]
+_Workers = Annotated[int, typer.Option(
+    '--workers', '-j',
+    min=0,
+    help='Enumerate and score candidates on this many worker processes. '
+         '0 (the default) runs in-process; the plan is the same either '
+         'way. Ignored with --verbose.',
+)]
+_Threads = Annotated[bool, typer.Option(
+    '--threads',
+    help='Score on --workers threads sharing the planner state instead of '
+         'worker processes. Same plan; pays off on free-threaded Python '
+         'builds.',
+)]
+_Checkpoint = Annotated[Path | None, typer.Option(
+    '--checkpoint',
+    dir_okay=False,
+    help='Write a checkpoint log of the run to this (new) file, so an '
+         'interrupted run can be continued with --resume.',
+)]
+_CheckpointEvery = Annotated[int, typer.Option(
+    '--checkpoint-every',
+    min=1,
+    help='Append to the checkpoint log after this many committed moves.',
+)]
+_CheckpointMinutes = Annotated[float, typer.Option(
+    '--checkpoint-minutes',
+    help='Append to the checkpoint log at least this often (minutes), '
+         'whatever the move count.',
+)]
+_Profile = Annotated[Path | None, typer.Option(
+    '--profile',
+    dir_okay=False,
+    help='Write the per-phase loop timings (totals and latency '
+         'histograms) to this JSON file.',
+)]
+_Resume = Annotated[Path | None, typer.Option(
+    '--resume',
+    exists=True, dir_okay=False,
+    help='Restore the run logged in this checkpoint file (written with '
+         '--checkpoint over the same inputs) and continue it, appending '
+         'to the same file. Not allowed with --verbose.',
+)]
 
 
 def run(
@@ -224,6 +266,13 @@ def run(
     label: _Label = None,
     output_dir: _OutDir = None,
     verbose: _Verbose = False,
+    workers: _Workers = 0,
+    threads: _Threads = False,
+    checkpoint: _Checkpoint = None,
+    checkpoint_every: _CheckpointEvery = 100,
+    checkpoint_minutes: _CheckpointMinutes = 5.0,
+    resume: _Resume = None,
+    profile: _Profile = None,
 ) -> None:
     """Run the Infinite Knitting greedy planner end-to-end. The
     required `config` arg is a JSON file that holds every input either
@@ -246,6 +295,9 @@ def run(
     # a --label and (interactively-entered) notes are required before the work
     # begins — fail fast, and collect the notes immediately via the editor.
     db_block = _resolve_db_block(dbconn, cfg.get('database'))
+    _validate_checkpoint_flags(
+        checkpoint, resume, verbose, checkpoint_minutes,
+    )
     notes = None
     if verbose:
         if not label:
@@ -334,8 +386,42 @@ def run(
 
     debuglog = _build_debug_log() if verbose else None
 
+    ckpt = None
+    if resume is not None:
+        typer.echo(f'Resuming from checkpoint {resume}')
+        try:
+            ckpt = Checkpoint.resume(
+                resume, state, greige_by_id,
+                every_moves=checkpoint_every,
+                every_minutes=checkpoint_minutes,
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint='--resume')
+        typer.echo(f'  restored {ckpt.move_count} committed move(s)')
+    elif checkpoint is not None:
+        ckpt = Checkpoint.create(
+            checkpoint, state,
+            every_moves=checkpoint_every, every_minutes=checkpoint_minutes,
+        )
+
     typer.echo('Running planner...')
-    report = plan(state, costing, debuglog=debuglog)
+    timer = PhaseTimer()
+    try:
+        report = plan(
+            state, costing, debuglog=debuglog, workers=workers,
+            worker_mode='thread' if threads else 'process',
+            checkpoint=ckpt, timer=timer,
+        )
+    finally:
+        if ckpt is not None:
+            ckpt.close()
+    typer.echo(f'  planner time by phase ({timer.elapsed_s:.1f}s total):')
+    for line in timer.summary().splitlines():
+        typer.echo(f'    {line}')
+    if profile is not None:
+        profile.parent.mkdir(parents=True, exist_ok=True)
+        profile.write_text(json.dumps(timer.to_dict(), indent=2))
+        typer.echo(f'  wrote phase timings to {profile}')
     typer.echo(f'  total_score: {report.total_score:.2f}')
     typer.echo(
         f'  unmet (item, week) pairs: '
@@ -359,6 +445,37 @@ def run(
     typer.echo('Done.')
 
 
+def _validate_checkpoint_flags(
+    checkpoint: Path | None, resume: Path | None, verbose: bool,
+    minutes: float,
+) -> None:
+    """Fail fast on checkpoint flags that can't be honored: `--resume`
+    keeps appending to the file it resumes from, so it takes no
+    `--checkpoint` of its own; a resumed run's debug log would miss the
+    restored iterations, so it can't be `--verbose`; `--checkpoint`
+    never overwrites an existing file; and the time trigger must be
+    positive."""
+    if minutes <= 0:
+        raise typer.BadParameter(
+            f'must be > 0, got {minutes}', param_hint='--checkpoint-minutes',
+        )
+    if resume is not None and checkpoint is not None:
+        raise typer.BadParameter(
+            '--resume appends to the checkpoint it resumes from; '
+            'drop --checkpoint',
+            param_hint='--checkpoint',
+        )
+    if resume is not None and verbose:
+        raise typer.BadParameter(
+            '--resume cannot be combined with --verbose',
+            param_hint='--resume',
+        )
+    if checkpoint is not None and checkpoint.exists():
+        raise typer.BadParameter(
+            f'{checkpoint} already exists', param_hint='--checkpoint',
+        )
+
+
 def _persist_debuglog(
     db_block, debuglog, report, start_date, label, notes,
 ) -> int | None:
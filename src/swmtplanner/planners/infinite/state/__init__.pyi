@@ -5,6 +5,7 @@ from typing import Literal
 from swmtplanner.products import Greige
 from swmtplanner.schedule import Machine, ProductionPlan
 from swmtplanner.demand.rlsitem import RlsItem
+from swmtplanner.planners.infinite.loop import PhaseTimer
 
 __all__ = ['Move', 'State']
 
@@ -34,6 +35,9 @@ class State:
     reference_week_idx: int = ...
     reference_advance_amount: int = ...
     reference_threshold: int = ...
-    def commit_move(self, move: Move) -> None: ...
-    def advance_window(self) -> None: ...
+    eligible_cache: dict[str, tuple]
+    def commit_move(
+        self, move: Move, *, timer: PhaseTimer | None = ...,
+    ) -> None: ...
+    def advance_window(self, steps: int = ...) -> None: ...
     def advance_reference_week(self) -> None: ...
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Literal, TYPE_CHECKING
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
     from swmtplanner.products import Greige
     from swmtplanner.schedule import Machine
     from swmtplanner.demand.rlsitem import RlsItem
+    from swmtplanner.planners.infinite.loop import PhaseTimer
 
 
 @dataclass
@@ -55,9 +57,9 @@ class State:
     - `commit_move` applies a chosen `Move` by updating the underlying
       `Machine` (via `add_activities`) and the relevant `RlsItem`(s)
       (via `register_jobs`) in lockstep.
-    - `advance_window` extends `window_end` forward by
-      `window_advance_amount`, admitting additional decisions into the
-      candidate pool.
+    - `advance_window` extends `window_end` forward by a whole number of
+      `window_advance_amount` steps, admitting additional decisions into
+      the candidate pool.
 
     Both keep the main loop free of the mechanics of state updates."""
     machines: dict[str, 'Machine']
@@ -105,15 +107,32 @@ class State:
     # main loop calls `advance_reference_week()` until met or until the
     # reference week exceeds the latest order's week_idx.
     reference_threshold: int = 5
+    # --- Per-run caches ---
+    # Derived data kept alongside the state for the length of a run, owned
+    # by the module that fills it. Not configuration: never passed in, and
+    # left out of `repr` and equality.
+    #
+    # `coordination.eligible_orders`' per-item picks from its last call:
+    # item id -> (RlsItem, its version, reference_week_idx, order or None).
+    # An item whose version or the reference week has moved on since is
+    # dirty and re-examined.
+    eligible_cache: dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
 
-    def commit_move(self, move: Move) -> None:
+    def commit_move(
+        self, move: Move, *, timer: 'PhaseTimer | None' = None,
+    ) -> None:
         """Apply `move` to the appropriate machine and rls_items. The
         plan's activities are appended to the machine's activity schedule
         and its `Job` records to the machine's production schedule; the
         same `Job` records are grouped by `job.item.id` and submitted to
         each `RlsItem` as a batch via `register_jobs` — matching the
         contract documented in `demand/DESIGN.md` and
-        `schedule/DESIGN.md`."""
+        `schedule/DESIGN.md`.
+
+        With a `timer`, the `register_jobs` calls (where the demand views
+        recompute) are timed as its `'register_jobs'` phase."""
         machine = self.machines[move.machine_id]
         machine.add_activities(move.plan.activities)
         machine.add_jobs(move.plan.jobs)
@@ -122,14 +141,20 @@ class State:
         for job in move.plan.jobs:
             jobs_by_item.setdefault(job.item.id, []).append(job)
 
-        for item_id, jobs in jobs_by_item.items():
-            self.rls_items[item_id].register_jobs(jobs)
-
-    def advance_window(self) -> None:
-        """Extend `window_end` forward by `window_advance_amount`. Called
-        by the main loop when in-window candidate count falls below the
-        configured threshold (or when the pool is fully drained)."""
-        self.window_end += self.window_advance_amount
+        timed = nullcontext() if timer is None else timer.phase('register_jobs')
+        with timed:
+            for item_id, jobs in jobs_by_item.items():
+                self.rls_items[item_id].register_jobs(jobs)
+
+    def advance_window(self, steps: int = 1) -> None:
+        """Extend `window_end` forward by `steps` × `window_advance_amount`.
+        Called by the main loop when in-window candidate count falls below
+        the configured threshold (or when the pool is fully drained); the
+        loop passes the number of steps that reaches the next decision
+        point in one call."""
+        if steps < 1:
+            raise ValueError(f'steps must be >= 1, got {steps}')
+        self.window_end += self.window_advance_amount * steps
 
     def advance_reference_week(self) -> None:
         """Extend `reference_week_idx` forward by
@@ -10,18 +10,22 @@ from .activity import (
     STYLE_CHANGE_DURATION, RUNNER_CHANGE_DURATION, PATTERN_CHANGE_DURATION,
 )
 from .job import Roll, Job
-from .machine import Status, Machine, ProductionPlan, fresh_beam_lbs
+from .ids import id_counters, restore_id_counters
+from .machine import (
+    Status, ScheduleSummary, Machine, ProductionPlan, fresh_beam_lbs,
+)
 from .io import read_machines, machines_from_list
 
 __all__ = [
     'Activity', 'Knit', 'Waste', 'Doff', 'TapeOut', 'Hanging', 'Threading',
     'StyleChange', 'RunnerChange', 'PatternChange', 'Idle',
-    'Roll', 'Job',
+    'Roll', 'Job', 'id_counters', 'restore_id_counters',
     'TAPE_OUT_SINGLE_DURATION', 'TAPE_OUT_BOTH_DURATION',
     'HANGING_SINGLE_DURATION', 'HANGING_BOTH_DURATION',
     'THREADING_SINGLE_DURATION', 'THREADING_BOTH_DURATION',
     'DOFF_DURATION',
     'STYLE_CHANGE_DURATION', 'RUNNER_CHANGE_DURATION', 'PATTERN_CHANGE_DURATION',
-    'Status', 'Machine', 'ProductionPlan', 'fresh_beam_lbs',
+    'Status', 'ScheduleSummary', 'Machine', 'ProductionPlan',
+    'fresh_beam_lbs',
     'read_machines', 'machines_from_list',
 ]
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from swmtplanner.products import Greige
 from swmtplanner.support import WorkCal
@@ -14,18 +14,21 @@ from .activity import (
     STYLE_CHANGE_DURATION, RUNNER_CHANGE_DURATION, PATTERN_CHANGE_DURATION,
 )
 from .job import Roll, Job
-from .machine import Status, Machine, ProductionPlan, fresh_beam_lbs
+from .machine import (
+    Status, ScheduleSummary, Machine, ProductionPlan, fresh_beam_lbs,
+)
 
 __all__ = [
     'Activity', 'Knit', 'Waste', 'Doff', 'TapeOut', 'Hanging', 'Threading',
     'StyleChange', 'RunnerChange', 'PatternChange', 'Idle',
-    'Roll', 'Job',
+    'Roll', 'Job', 'id_counters', 'restore_id_counters',
     'TAPE_OUT_SINGLE_DURATION', 'TAPE_OUT_BOTH_DURATION',
     'HANGING_SINGLE_DURATION', 'HANGING_BOTH_DURATION',
     'THREADING_SINGLE_DURATION', 'THREADING_BOTH_DURATION',
     'DOFF_DURATION',
     'STYLE_CHANGE_DURATION', 'RUNNER_CHANGE_DURATION', 'PATTERN_CHANGE_DURATION',
-    'Status', 'Machine', 'ProductionPlan', 'fresh_beam_lbs',
+    'Status', 'ScheduleSummary', 'Machine', 'ProductionPlan',
+    'fresh_beam_lbs',
     'read_machines', 'machines_from_list',
 ]
 
@@ -43,3 +46,7 @@ def machines_from_list(
     greige_by_id: dict[str, Greige],
     source: str = ...,
 ) -> dict[str, Machine]: ...
+
+
+def id_counters() -> dict[str, int]: ...
+def restore_id_counters(values: Mapping[str, int]) -> None: ...
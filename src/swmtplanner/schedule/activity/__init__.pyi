@@ -31,38 +31,38 @@ BEAM_FLOOR_LBS: float
 MAX_BEAM_WASTE_LBS: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Activity(HasID[str]):
     start: datetime
     end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Knit(Activity):
     item: Greige
     lbs: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Waste(Activity):
     beam: BeamSet
     bar: Literal['top', 'btm']
     lbs: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Doff(Activity):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TapeOut(Activity):
     bars: Literal['top', 'btm', 'both']
     top_beam: BeamSet | None = ...
     btm_beam: BeamSet | None = ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hanging(Activity):
     bars: Literal['top', 'btm', 'both']
     top_beam: BeamSet | None = ...
@@ -71,29 +71,29 @@ class Hanging(Activity):
     btm_lbs: float = ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Threading(Activity):
     bars: Literal['top', 'btm', 'both']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleChange(Activity):
     from_item: Greige
     to_item: Greige
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunnerChange(Activity):
     from_item: Greige
     to_item: Greige
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternChange(Activity):
     from_item: Greige
     to_item: Greige
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Idle(Activity):
     pass
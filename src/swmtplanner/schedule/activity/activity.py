@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Literal, TYPE_CHECKING
 
 from swmtplanner.support import HasID
+from swmtplanner.schedule.ids import new_id_counter
 
 if TYPE_CHECKING:
     from swmtplanner.products import Greige, BeamSet
@@ -42,28 +43,19 @@ BEAM_FLOOR_LBS: float = 5.0
 MAX_BEAM_WASTE_LBS: float = 100.0
 
 
-def _make_id_counter():
-    ctr = 0
-    def _next():
-        nonlocal ctr
-        ctr += 1
-        return ctr
-    return _next
+_KNIT_ID = new_id_counter('KNIT')
+_WASTE_ID = new_id_counter('WASTE')
+_DOFF_ID = new_id_counter('DOFF')
+_TAPE_OUT_ID = new_id_counter('TAPEOUT')
+_HANGING_ID = new_id_counter('HANGING')
+_THREADING_ID = new_id_counter('THREADING')
+_STYLE_CHANGE_ID = new_id_counter('STYLECHANGE')
+_RUNNER_CHANGE_ID = new_id_counter('RUNNERCHANGE')
+_PATTERN_CHANGE_ID = new_id_counter('PATTERNCHANGE')
+_IDLE_ID = new_id_counter('IDLE')
 
 
-_KNIT_ID = _make_id_counter()
-_WASTE_ID = _make_id_counter()
-_DOFF_ID = _make_id_counter()
-_TAPE_OUT_ID = _make_id_counter()
-_HANGING_ID = _make_id_counter()
-_THREADING_ID = _make_id_counter()
-_STYLE_CHANGE_ID = _make_id_counter()
-_RUNNER_CHANGE_ID = _make_id_counter()
-_PATTERN_CHANGE_ID = _make_id_counter()
-_IDLE_ID = _make_id_counter()
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Activity(HasID[str]):
     """Abstract base for anything that occupies machine time. Each concrete
     activity has a deterministic start and end and a stable id used for
@@ -72,7 +64,7 @@ class Activity(HasID[str]):
     end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Knit(Activity):
     """One uninterrupted run of knitting — the fabric wound between two
     consecutive interruptions (a doff, a beam swap, or the start/end of the
@@ -92,7 +84,7 @@ class Knit(Activity):
         return f'KNIT{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Waste(Activity):
     """Usable yarn discarded from a beam the planner swaps early — removed
     unknit, not fabric the machine ran, so its duration is zero
@@ -117,7 +109,7 @@ class Waste(Activity):
         return f'WASTE{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Doff(Activity):
     """Taking one completed roll off the machine. Fieldless beyond
     `start`/`end` (mirrors `Idle`'s shape; a distinct class for readability).
@@ -130,7 +122,7 @@ class Doff(Activity):
         return f'DOFF{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TapeOut(Activity):
     """Forced removal of yarn from one or both bars before natural exhaustion.
     'both' is cheaper than two separate singles (shared setup) but more than
@@ -151,7 +143,7 @@ class TapeOut(Activity):
         return f'TAPEOUT{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hanging(Activity):
     """Mounting a fresh beam set on the named bar(s) — this is what loads the
     physical set, so applying it sets each bar's `beam` and lbs (from the
@@ -171,7 +163,7 @@ class Hanging(Activity):
         return f'HANGING{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Threading(Activity):
     """Routing the loaded yarn into the machine. Applying it flips the named
     bar(s) to threaded (`<bar>_threaded = True`) and changes nothing else —
@@ -185,7 +177,7 @@ class Threading(Activity):
         return f'THREADING{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleChange(Activity):
     """Changeover on a **new** machine (`is_new`): one uniform reconfigure
     regardless of pattern family. The class carries the semantic — which
@@ -200,7 +192,7 @@ class StyleChange(Activity):
         return f'STYLECHANGE{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunnerChange(Activity):
     """Changeover on a **legacy** machine within the same pattern family —
     the lighter runner reconfigure."""
@@ -213,7 +205,7 @@ class RunnerChange(Activity):
         return f'RUNNERCHANGE{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PatternChange(Activity):
     """Changeover on a **legacy** machine across pattern families — the
     heavier pattern-wheel rework."""
@@ -226,7 +218,7 @@ class PatternChange(Activity):
         return f'PATTERNCHANGE{self._count:08}'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Idle(Activity):
     """Deliberate gap where the machine is committed to not running, used
     when staffing limits prevent continuous operation. Beam state and
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+from typing import Mapping
+
+
+class _IdCounter:
+    """Monotonic counter behind one object type's ids. Calling it returns
+    the next value; `value` is the last one handed out."""
+
+    __slots__ = ('value',)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def __call__(self) -> int:
+        self.value += 1
+        return self.value
+
+
+_COUNTERS: dict[str, _IdCounter] = {}
+
+
+def new_id_counter(name: str) -> _IdCounter:
+    """Register and return the id counter for `name` (the prefix of the ids
+    it mints, e.g. `'KNIT'`). Called once per id'd type at import time."""
+    if name in _COUNTERS:
+        raise KeyError(f'id counter {name!r} already exists')
+    ctr = _COUNTERS[name] = _IdCounter()
+    return ctr
+
+
+def id_counters() -> dict[str, int]:
+    """The last value handed out by every registered id counter, by name."""
+    return {name: ctr.value for name, ctr in _COUNTERS.items()}
+
+
+def restore_id_counters(values: Mapping[str, int]) -> None:
+    """Move each named counter forward to at least `values[name]`, so ids
+    minted afterwards never repeat one already handed out (e.g. by the run
+    a checkpoint was written from). Counters never move backwards; unknown
+    names raise `KeyError`."""
+    for name, value in values.items():
+        if name not in _COUNTERS:
+            raise KeyError(f'no id counter named {name!r}')
+        ctr = _COUNTERS[name]
+        ctr.value = max(ctr.value, int(value))
@@ -8,14 +8,14 @@ from swmtplanner.schedule.activity import Knit
 __all__ = ['Roll', 'Job']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Roll:
     lbs: float
     completion_time: datetime
     knits: tuple[Knit, ...] = ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Job(HasID[str]):
     item: Greige
     rolls: tuple[Roll, ...] = ...
@@ -27,3 +27,5 @@ class Job(HasID[str]):
     def total_rolls(self) -> int: ...
     @property
     def total_lbs(self) -> float: ...
+    @property
+    def completion_time(self) -> datetime | None: ...
@@ -5,25 +5,17 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from swmtplanner.support import HasID
+from swmtplanner.schedule.ids import new_id_counter
 
 if TYPE_CHECKING:
     from swmtplanner.products import Greige
     from swmtplanner.schedule.activity import Knit
 
 
-def _make_id_counter():
-    ctr = 0
-    def _next():
-        nonlocal ctr
-        ctr += 1
-        return ctr
-    return _next
+_JOB_ID = new_id_counter('JOB')
 
 
-_JOB_ID = _make_id_counter()
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Roll:
     """One completed roll coming off the machine. Pure data — no
     machine-state effect and no id of its own. The demand layer reads a
@@ -37,7 +29,7 @@ class Roll:
     knits: tuple['Knit', ...] = ()  # the Knit(s) that wound this roll
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Job(HasID[str]):
     """An "order" for some number of rolls of an item on a machine,
     fulfilled by one call to `plan_production`. Records the rolls the
@@ -55,11 +47,27 @@ class Job(HasID[str]):
     `Job` not raised against any particular order (e.g. a `'next_runout'`
     run-up `Job`). It is the caller's intent at planning time, *not* the
     order the `Job` actually fills — that is resolved by priority in the
-    demand layer's `SafetyAwareView`, never stored here."""
+    demand layer's `SafetyAwareView`, never stored here.
+
+    `total_lbs` and `completion_time` are worked out once, at
+    construction — a `Job` never changes."""
     item: 'Greige'
     rolls: tuple[Roll, ...] = ()
     tgt_order: str | None = None
     _count: int = field(default_factory=_JOB_ID, init=False)
+    _total_lbs: float = field(init=False, repr=False, compare=False)
+    _completion_time: datetime | None = field(
+        init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, '_total_lbs', sum(roll.lbs for roll in self.rolls),
+        )
+        object.__setattr__(
+            self, '_completion_time',
+            self.rolls[-1].completion_time if self.rolls else None,
+        )
 
     @property
     def id(self) -> str:
@@ -71,4 +79,10 @@ class Job(HasID[str]):
 
     @property
     def total_lbs(self) -> float:
-        return sum(roll.lbs for roll in self.rolls)
+        return self._total_lbs
+
+    @property
+    def completion_time(self) -> datetime | None:
+        """The final roll's `completion_time` (the job's effective end), or
+        `None` for a job with no rolls."""
+        return self._completion_time
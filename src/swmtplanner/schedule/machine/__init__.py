@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
 from .status import Status
+from .summary import ScheduleSummary
 from .machine import Machine, ProductionPlan, fresh_beam_lbs
 
-__all__ = ['Status', 'Machine', 'ProductionPlan', 'fresh_beam_lbs']
+__all__ = [
+    'Status', 'ScheduleSummary', 'Machine', 'ProductionPlan', 'fresh_beam_lbs',
+]
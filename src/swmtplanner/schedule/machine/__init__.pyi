@@ -7,13 +7,41 @@ from swmtplanner.products import Greige, BeamSet
 from swmtplanner.schedule.activity import Activity
 from swmtplanner.schedule.job import Job
 
-__all__ = ['Status', 'Machine', 'ProductionPlan', 'fresh_beam_lbs']
+__all__ = [
+    'Status', 'ScheduleSummary', 'Machine', 'ProductionPlan', 'fresh_beam_lbs',
+]
 
 
 @dataclass(frozen=True)
+class ScheduleSummary:
+    tape_out_single: int = ...
+    tape_out_both: int = ...
+    style_change: int = ...
+    runner_change: int = ...
+    pattern_change: int = ...
+    idle_hours: float = ...
+    waste_lbs: float = ...
+    @classmethod
+    def of(
+        cls, activities: Iterable[Activity], workcal: WorkCal,
+    ) -> ScheduleSummary: ...
+    def merge(self, other: ScheduleSummary) -> ScheduleSummary: ...
+
+
 class ProductionPlan:
-    activities: tuple[Activity, ...]
-    jobs: tuple[Job, ...]
+    def __init__(
+        self, activities: tuple[Activity, ...], jobs: tuple[Job, ...],
+        summary: ScheduleSummary | None = ...,
+    ) -> None: ...
+    @property
+    def activities(self) -> tuple[Activity, ...]: ...
+    @property
+    def jobs(self) -> tuple[Job, ...]: ...
+    @property
+    def summary(self) -> ScheduleSummary | None: ...
+    @property
+    def materialized(self) -> bool: ...
+    def with_fresh_ids(self) -> ProductionPlan: ...
 
 
 @dataclass(frozen=True)
@@ -68,6 +96,10 @@ class Machine(HasID[str]):
     @property
     def current_status(self) -> Status: ...
     @property
+    def version(self) -> int: ...
+    @property
+    def schedule_summary(self) -> ScheduleSummary: ...
+    @property
     def activities(self) -> tuple[Activity, ...]: ...
     @property
     def jobs(self) -> tuple[Job, ...]: ...
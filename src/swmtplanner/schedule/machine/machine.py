@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 
 import math
-from dataclasses import dataclass, replace
+import threading
+from bisect import bisect_right
+from dataclasses import replace
 from datetime import date, datetime, timedelta
 from typing import Iterable, Literal, TYPE_CHECKING
 
@@ -19,6 +21,7 @@ from swmtplanner.schedule.activity import (
 )
 from swmtplanner.schedule.job import Job, Roll
 from .status import Status
+from .summary import ScheduleSummary
 
 if TYPE_CHECKING:
     from swmtplanner.support import WorkCal
@@ -53,15 +56,132 @@ def fresh_beam_lbs(beam: BeamSet) -> float:
 _FLOAT_EPS = 1e-6
 _ROLL_TOLERANCE = 1e-2
 
+# `status_at` keeps the `Status` after every this-many activities, so a
+# lookup replays at most this many.
+_STATUS_CHECKPOINT_EVERY = 32
+
+# Most entries a machine's derived-value cache holds. The per-version keys
+# (capacity windows, walks) grow with every window the planner asks about,
+# and a machine nothing is committed to never bumps its version, so the
+# cache is dropped whole when it fills. A planning iteration uses far
+# fewer entries than this.
+_DERIVED_CACHE_SIZE = 1024
+
+
+# Guards `ProductionPlan` materialization. Only the chosen (and the logged)
+# plan of an iteration is ever materialized, so one lock for all of them
+# costs nothing and keeps plans picklable.
+_MATERIALIZE_LOCK = threading.Lock()
+
 
-@dataclass(frozen=True)
 class ProductionPlan:
     """Return value of `plan_production`: the activity-schedule and
     production-schedule additions for one planning call. Committed
     together via `add_activities(plan.activities)` +
-    `add_jobs(plan.jobs)`. A basic data record — no behavior."""
-    activities: tuple[Activity, ...]
-    jobs: tuple[Job, ...]
+    `add_jobs(plan.jobs)`. A data record — read-only once built.
+
+    `summary` is the `ScheduleSummary` of `activities`, filled in by
+    `plan_production`; a hand-built plan may leave it `None`.
+
+    A plan from `plan_production` is lazy: the walk records each non-`Knit`
+    step as its activity class and fields, and `activities` builds the
+    objects on first read (in practice when the plan is committed or
+    logged). `jobs` and `summary` are built eagerly — they are all that
+    scoring reads — so a candidate that is never chosen never builds its
+    activities. Materialization happens once, under a lock, so threads
+    sharing a plan see the same objects.
+
+    Plans compare and hash by value, on `(activities, jobs, summary)`, as
+    a frozen dataclass would. Comparing or hashing a lazy plan builds its
+    activities."""
+    __slots__ = ('_activities', '_steps', '_jobs', '_summary')
+
+    def __init__(
+        self, activities: tuple[Activity, ...], jobs: tuple[Job, ...],
+        summary: ScheduleSummary | None = None,
+    ) -> None:
+        self._activities: tuple[Activity, ...] | None = activities
+        self._steps: list | None = None
+        self._jobs = jobs
+        self._summary = summary
+
+    @classmethod
+    def _deferred(
+        cls, steps: list, jobs: tuple[Job, ...], summary: ScheduleSummary,
+    ) -> 'ProductionPlan':
+        """A plan whose activities are still the walk's `steps` (see
+        `_materialize`)."""
+        plan = cls.__new__(cls)
+        plan._activities = None
+        plan._steps = steps
+        plan._jobs = jobs
+        plan._summary = summary
+        return plan
+
+    @property
+    def activities(self) -> tuple[Activity, ...]:
+        activities = self._activities
+        if activities is None:
+            with _MATERIALIZE_LOCK:
+                if self._activities is None:
+                    self._activities = _materialize(self._steps)
+                    self._steps = None
+                activities = self._activities
+        return activities
+
+    @property
+    def jobs(self) -> tuple[Job, ...]:
+        return self._jobs
+
+    @property
+    def summary(self) -> ScheduleSummary | None:
+        return self._summary
+
+    @property
+    def materialized(self) -> bool:
+        """Whether `activities` has been built yet."""
+        return self._activities is not None
+
+    def with_fresh_ids(self) -> 'ProductionPlan':
+        """A copy of this plan whose activities, rolls and jobs are built
+        anew, so they carry ids from this process's counters. For a plan
+        built in another process (its ids came from that process's
+        counters), before it is committed here. Each roll keeps the new
+        copies of its `Knit`s."""
+        knits: dict[int, Knit] = {}
+        activities = []
+        for a in self.activities:
+            fresh = replace(a)
+            if type(a) is Knit:
+                knits[id(a)] = fresh
+            activities.append(fresh)
+        jobs = tuple(
+            replace(job, rolls=tuple(
+                replace(roll, knits=tuple(
+                    knits.get(id(k), k) for k in roll.knits
+                ))
+                for roll in job.rolls
+            ))
+            for job in self._jobs
+        )
+        return ProductionPlan(tuple(activities), jobs, self._summary)
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.activities, self._jobs, self._summary)
+                == (other.activities, other._jobs, other._summary))
+
+    def __hash__(self) -> int:
+        return hash((self.activities, self._jobs, self._summary))
+
+    def __repr__(self) -> str:
+        activities = ('<deferred>' if self._activities is None
+                      else repr(self._activities))
+        return (f'ProductionPlan(activities={activities}, '
+                f'jobs={self._jobs!r}, summary={self._summary!r})')
 
 
 class Machine(HasID[str]):
@@ -103,6 +223,18 @@ class Machine(HasID[str]):
         self._activities: list[Activity] = []
         self._jobs: list[Job] = []
         self._current_status: Status = self._initial_status
+        # `status_at` index: each activity's end, and the status after
+        # every `_STATUS_CHECKPOINT_EVERY`th activity (index 0: none yet).
+        # `_ends_sorted` drops to False if an activity ever ends before its
+        # predecessor, which `status_at` can't bisect.
+        self._ends: list[datetime] = []
+        self._checkpoints: list[Status] = [self._initial_status]
+        self._ends_sorted = True
+        self._summary = ScheduleSummary()
+        self._version = 0
+        # Quantities derived from the schedule, valid for the current
+        # `version` only (see `_derived`).
+        self._cache: dict[tuple, object] = {}
 
     @property
     def id(self) -> str:
@@ -130,16 +262,30 @@ class Machine(HasID[str]):
     def current_status(self) -> Status:
         return self._current_status
 
+    @property
+    def version(self) -> int:
+        """Mutation counter — bumped by every `add_activities` /
+        `add_jobs` call, so callers can cache quantities derived from the
+        schedule and revalidate them with an int comparison. The machine
+        does the same for its own views and queries (`_derived`)."""
+        return self._version
+
+    @property
+    def schedule_summary(self) -> ScheduleSummary:
+        """Running `ScheduleSummary` of the committed activity schedule,
+        rolled forward by `add_activities`."""
+        return self._summary
+
     @property
     def activities(self) -> tuple[Activity, ...]:
-        return tuple(self._activities)
+        return self._derived(('activities',), lambda: tuple(self._activities))
 
     @property
     def jobs(self) -> tuple[Job, ...]:
         """The committed production schedule — `Job` records appended via
         `add_jobs`. Parallel to `activities`; `Job`s have no machine-state
         effect (they record the rolls produced, not machine time)."""
-        return tuple(self._jobs)
+        return self._derived(('jobs',), lambda: tuple(self._jobs))
 
     @property
     def schedule_tail(self) -> datetime:
@@ -161,6 +307,9 @@ class Machine(HasID[str]):
         above the floor (including a bar already at or below it),
         `next_runout == current_status.as_of` — the changeover is
         immediately due."""
+        return self._derived(('next_runout',), self._next_runout)
+
+    def _next_runout(self) -> datetime:
         s = self._current_status
         cfg = s.current_item.configuration
         item = s.current_item
@@ -196,10 +345,14 @@ class Machine(HasID[str]):
         exceeds the window, or if the remaining time can't accommodate
         a full roll.
 
-        Pure: does not mutate any machine state. Implementation
-        re-uses `plan_production` by asking for a generous upper bound
-        and tallying the lbs of `Knit` activities whose execution
-        overlaps `[start, end)`."""
+        Pure: does not mutate any machine state. Computed by
+        `_producible_lbs_by_arithmetic`: the `plan_production` walk
+        replayed as work-hour arithmetic on the bar lbs, without building
+        activities or `Status` objects, and stopped at `end`. A workcal
+        with a non-zero `cal_shift` (whose datetime offsets don't line up
+        with its work-hour counts) falls back to
+        `_producible_lbs_by_walk`, the activity-walk reference the
+        arithmetic is validated against."""
         as_of = self._current_status.as_of
         if start is not None and start < as_of:
             raise ValueError(
@@ -209,18 +362,70 @@ class Machine(HasID[str]):
         effective_start = start if start is not None else as_of
         if effective_start >= end:
             return 0.0
+        if self._workcal.cal_shift:
+            engine = self._producible_lbs_by_walk
+        else:
+            engine = self._producible_lbs_by_arithmetic
+        return self._derived(
+            ('producible', item, end, effective_start),
+            lambda: engine(item, end, effective_start),
+        )
+
+    def producible_lbs_in_week(
+        self, item: 'Greige', year: int, week: int,
+        start: datetime | None = None,
+    ) -> float:
+        """Returns the lbs of `item` the machine could produce within
+        the given ISO week (Monday 00:00 to next Monday 00:00).
 
+        Thin wrapper over `producible_lbs_through`: snaps `start` up to
+        `week_start` if it falls before the week begins (so the bridge
+        idle covers the gap to the week's beginning), then asks for
+        the cap through `week_end`.
+
+        `start` defaults to `current_status.as_of` and may not be
+        earlier than it — raises `ValueError` otherwise."""
+        monday = date.fromisocalendar(year, week, 1)
+        week_start = datetime(monday.year, monday.month, monday.day)
+        week_end = week_start + timedelta(days=7)
+
+        as_of = self._current_status.as_of
+        if start is not None and start < as_of:
+            raise ValueError(
+                f'start={start!r} is before machine\'s '
+                f'current_status.as_of ({as_of!r})'
+            )
+        effective_start = start if start is not None else as_of
+        # Snap to week_start if effective_start falls before the week.
+        effective_start = max(effective_start, week_start)
+        return self.producible_lbs_through(
+            item, end=week_end, start=effective_start,
+        )
+
+    # ----- producible capacity -----
+
+    def _capacity_upper_rolls(self, item: 'Greige', end: datetime) -> int:
+        """Rolls of `item` the capacity probe plans at most: as many as the
+        whole `[as_of, end]` span would hold at full rate, plus one."""
+        rate = item.get_rate_on_mchn(self._id)
+        span_hours = (end - self._current_status.as_of).total_seconds() / 3600
+        return math.ceil(span_hours * rate / item.tgt_wt) + 1
+
+    def _producible_lbs_by_walk(
+        self, item: 'Greige', end: datetime, effective_start: datetime,
+    ) -> float:
+        """Reference implementation of `producible_lbs_through` (arguments
+        already validated): run the `plan_production` walk for a generous
+        upper bound and tally the lbs of the `Knit` activities overlapping
+        `[effective_start, end)`."""
+        as_of = self._current_status.as_of
         rate = item.get_rate_on_mchn(self._id)
         # Upper bound on plan_production's lbs argument: max producible
         # if the entire `[as_of, end]` span were work hours at full
         # rate, plus one roll of headroom. plan_production will simply
         # produce more activities than we need; we truncate via the
         # window check below.
-        span_hours = (end - as_of).total_seconds() / 3600
-        upper_lbs_bound = (
-            math.ceil(span_hours * rate / item.tgt_wt) * item.tgt_wt
-            + item.tgt_wt
-        )
+        upper_lbs_bound = self._capacity_upper_rolls(item, end) * item.tgt_wt
 
         # Bridge: idle from the machine's actual schedule tail (as_of)
         # to the production-begin moment, `effective_start`. The bridge
@@ -231,10 +436,9 @@ class Machine(HasID[str]):
             as_of, effective_start,
         )
         idle_for = timedelta(hours=bridge_hours)
-        plan = self.plan_production(
-            item, upper_lbs_bound, start_at='schedule_tail',
-            idle_for=idle_for,
-        )
+        activities = self._plan_walk(
+            item, upper_lbs_bound, 'schedule_tail',
+        ).anchor(self._workcal, as_of, idle_for, None).activities
 
         # Tally lbs of `Knit`s for `item` that overlap
         # [effective_start, end). Activities other than Knit (Doff, TapeOut,
@@ -242,7 +446,7 @@ class Machine(HasID[str]):
         # produce nothing; their effect on production capacity is already
         # reflected in subsequent Knits' start times.
         total_lbs = 0.0
-        for a in plan.activities:
+        for a in activities:
             if a.start >= end:
                 break
             if not isinstance(a, Knit):
@@ -257,60 +461,146 @@ class Machine(HasID[str]):
                 win_start, win_end,
             )
             total_lbs += hours_in_window * rate
+        return _whole_rolls_lbs(total_lbs, item.tgt_wt)
 
-        # Round down to whole rolls, snapping near-integer rolls (float
-        # drift from `min(top_lbs/top_pct, btm_lbs/btm_pct) * rate`
-        # chains).
-        n_rolls_exact = total_lbs / item.tgt_wt
-        n_rolls_rounded = round(n_rolls_exact)
-        if abs(n_rolls_rounded - n_rolls_exact) < _ROLL_TOLERANCE:
-            n_rolls = n_rolls_rounded
-        else:
-            n_rolls = math.floor(n_rolls_exact)
-        return max(0, n_rolls) * item.tgt_wt
-
-    def producible_lbs_in_week(
-        self, item: 'Greige', year: int, week: int,
-        start: datetime | None = None,
+    def _producible_lbs_by_arithmetic(
+        self, item: 'Greige', end: datetime, effective_start: datetime,
     ) -> float:
-        """Returns the lbs of `item` the machine could produce within
-        the given ISO week (Monday 00:00 to next Monday 00:00).
+        """`_producible_lbs_by_walk` without the activities. Time is measured
+        in work hours from `as_of`, where every activity is just its
+        duration added to a running clock (`offset_work_hours` and
+        `get_work_hours_between` agree on that coordinate), so the window is
+        `[h_start, h_end)` after two `get_work_hours_between` calls. The
+        walk's preamble and production loop are replayed on the bar lbs —
+        same decisions, same order, same floats — and stop as soon as the
+        clock passes `h_end` instead of planning the full upper bound. The
+        decisions themselves (`_bar_action`, `_bars_to_swap`, `_changeover`)
+        are the helpers the walk calls, so only the bookkeeping is
+        repeated here."""
+        s = self._current_status
+        wc = self._workcal
+        cfg = item.configuration
+        tgt = item.tgt_wt
+        rate = item.get_rate_on_mchn(self._id)
+        top_pct, btm_pct = cfg.top_pct, cfg.btm_pct
+
+        h_start = wc.get_work_hours_between(s.as_of, effective_start)
+        h_end = wc.get_work_hours_between(s.as_of, end)
+
+        # 0. The bridge idle, rounded through timedelta as the walk's is.
+        h = 0.0
+        bridge = timedelta(hours=h_start)
+        if bridge > timedelta(0):
+            h += bridge.total_seconds() / 3600
+
+        # 2. Changeover preamble (see `_emit_preamble`).
+        top_lbs = s.lbs_remaining('top')
+        btm_lbs = s.lbs_remaining('btm')
+        top_action = _bar_action(top_lbs, s.beam('top'), cfg.top_beam)
+        btm_action = _bar_action(btm_lbs, s.beam('btm'), cfg.btm_beam)
+        tape_bars = _bars(top_action == 'tape', btm_action == 'tape')
+        if tape_bars is not None:
+            h += (TAPE_OUT_BOTH_DURATION if tape_bars == 'both'
+                  else TAPE_OUT_SINGLE_DURATION)
+
+        fresh_top = fresh_beam_lbs(BeamSet(cfg.top_beam))
+        fresh_btm = fresh_beam_lbs(BeamSet(cfg.btm_beam))
+
+        def rethread(top: bool, btm: bool) -> None:
+            nonlocal h, top_lbs, btm_lbs
+            if _bars(top, btm) == 'both':
+                h += HANGING_BOTH_DURATION
+                h += THREADING_BOTH_DURATION
+            else:
+                h += HANGING_SINGLE_DURATION
+                h += THREADING_SINGLE_DURATION
+            if top:
+                top_lbs = fresh_top
+            if btm:
+                btm_lbs = fresh_btm
+
+        if top_action != 'keep' or btm_action != 'keep':
+            rethread(top_action != 'keep', btm_action != 'keep')
+        if item != s.current_item:
+            h += _changeover(self._is_new, s.current_item, item)[1]
+
+        # 3. Production loop (see `_emit_production_loop`).
+        total_lbs = 0.0
+        rolls_left = self._capacity_upper_rolls(item, end)
+        roll_filled = 0.0
+        knit = 0.0
 
-        Thin wrapper over `producible_lbs_through`: snaps `start` up to
-        `week_start` if it falls before the week begins (so the bridge
-        idle covers the gap to the week's beginning), then asks for
-        the cap through `week_end`.
+        def flush() -> None:
+            nonlocal h, knit, total_lbs, top_lbs, btm_lbs
+            if knit > _FLOAT_EPS:
+                k_end = h + knit / rate
+                overlap = min(k_end, h_end) - max(h, h_start)
+                if overlap > 0:
+                    total_lbs += overlap * rate
+                h = k_end
+                top_lbs -= knit * top_pct
+                btm_lbs -= knit * btm_pct
+                knit = 0.0
 
-        `start` defaults to `current_status.as_of` and may not be
-        earlier than it — raises `ValueError` otherwise."""
-        monday = date.fromisocalendar(year, week, 1)
-        week_start = datetime(monday.year, monday.month, monday.day)
-        week_end = week_start + timedelta(days=7)
+        def resolve() -> None:
+            swap_top, swap_btm = _bars_to_swap(
+                top_lbs - knit * top_pct - BEAM_FLOOR_LBS,
+                btm_lbs - knit * btm_pct - BEAM_FLOOR_LBS,
+            )
+            if swap_top or swap_btm:
+                flush()
+                rethread(swap_top, swap_btm)
 
-        as_of = self._current_status.as_of
-        if start is not None and start < as_of:
-            raise ValueError(
-                f'start={start!r} is before machine\'s '
-                f'current_status.as_of ({as_of!r})'
+        # Nothing that starts at or after `h_end` can land in the window.
+        while rolls_left > 0 and h < h_end:
+            if roll_filled == 0.0:
+                resolve()
+            producible = min(
+                (top_lbs - knit * top_pct - BEAM_FLOOR_LBS) / top_pct,
+                (btm_lbs - knit * btm_pct - BEAM_FLOOR_LBS) / btm_pct,
             )
-        effective_start = start if start is not None else as_of
-        # Snap to week_start if effective_start falls before the week.
-        effective_start = max(effective_start, week_start)
-        return self.producible_lbs_through(
-            item, end=week_end, start=effective_start,
-        )
+            step = min(tgt - roll_filled, producible)
+            knit += step
+            roll_filled += step
+            if roll_filled >= tgt - _FLOAT_EPS:
+                flush()
+                h += DOFF_DURATION
+                roll_filled = 0.0
+                rolls_left -= 1
+            else:
+                resolve()
+        flush()
+        return _whole_rolls_lbs(total_lbs, tgt)
 
     def status_at(self, t: datetime) -> Status:
         """Status at time `t`. Walks activities whose `end <= t`, then sets
         `as_of=t` on the result. If `t` falls strictly inside an activity
         (`start <= t < end`), `is_idle` is False; otherwise True. Raises if
-        `t` is before `initial_status.as_of`."""
+        `t` is before `initial_status.as_of`.
+
+        The walk starts from the nearest checkpoint at or before the first
+        activity ending after `t` (found by bisecting the end times), so it
+        replays fewer than `_STATUS_CHECKPOINT_EVERY` activities."""
         if t < self._initial_status.as_of:
             raise ValueError(
                 f't={t!r} is before this machine\'s initial status '
                 f'({self._initial_status.as_of!r})'
             )
 
+        if not self._ends_sorted:
+            return self._status_at_by_walk(t)
+        n = bisect_right(self._ends, t)   # activities with end <= t
+        k = n // _STATUS_CHECKPOINT_EVERY
+        status = self._checkpoints[k]
+        for activity in self._activities[k * _STATUS_CHECKPOINT_EVERY:n]:
+            status = status.apply_activity(activity)
+        in_progress = (n < len(self._activities)
+                       and self._activities[n].start <= t)
+        return replace(status, as_of=t, is_idle=not in_progress)
+
+    def _status_at_by_walk(self, t: datetime) -> Status:
+        """`status_at` from `initial_status`, for a schedule whose end times
+        are out of order (argument already validated)."""
         status = self._initial_status
         in_progress = False
         for activity in self._activities:
@@ -326,16 +616,51 @@ class Machine(HasID[str]):
     def add_activities(self, activities: Iterable[Activity]) -> None:
         """Append activities to the schedule and roll `current_status`
         forward. Activities are expected in execution order, each starting
-        at or after the previous one's end."""
+        at or after the previous one's end. The running `schedule_summary`
+        is extended by the batch."""
+        added: list[Activity] = []
         for a in activities:
+            if self._ends and a.end < self._ends[-1]:
+                self._ends_sorted = False
             self._activities.append(a)
+            self._ends.append(a.end)
             self._current_status = self._current_status.apply_activity(a)
+            if len(self._activities) % _STATUS_CHECKPOINT_EVERY == 0:
+                self._checkpoints.append(self._current_status)
+            added.append(a)
+        self._summary = self._summary.merge(
+            ScheduleSummary.of(added, self._workcal),
+        )
+        self._changed()
 
     def add_jobs(self, jobs: Iterable[Job]) -> None:
         """Append `Job` records to the production schedule. Jobs carry no
         machine-state effect, so (unlike `add_activities`) this does not
         touch `current_status` — it only records what was produced."""
         self._jobs.extend(jobs)
+        self._changed()
+
+    # ----- derived-quantity cache -----
+
+    def _changed(self) -> None:
+        """Bump `version` after a schedule change, dropping everything
+        cached against the old one."""
+        self._version += 1
+        self._cache.clear()
+
+    def _derived(self, key: tuple, compute):
+        """`compute()`, cached under `key` until the next `version` bump, or
+        until the cache fills (`_DERIVED_CACHE_SIZE` entries) and is dropped
+        whole. Cached values are shared, so they must be immutable (tuples,
+        datetimes, floats, or objects only ever read)."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = compute()
+            if len(self._cache) >= _DERIVED_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = value
+            return value
 
     # ----- plan_production --------------------------------------------
 
@@ -399,62 +724,69 @@ class Machine(HasID[str]):
                 f'{item.id!r} is already the machine\'s current item'
             )
 
-        emitted: list[Activity] = []
-        jobs: list[Job] = []
-        working = self._current_status
+        # The walk depends on the status but not on when the plan starts, so
+        # it is kept per version and only re-anchored for a new `idle_for`.
+        walk = self._derived(
+            ('walk', item, lbs, start_at),
+            lambda: self._plan_walk(item, lbs, start_at),
+        )
+        return walk.anchor(
+            self._workcal, self._current_status.as_of, idle_for, tgt_order,
+        )
 
-        # 0. Optional idle gap at the head of the plan.
-        if idle_for > timedelta(0):
-            working = self._emit_idle(emitted, working, idle_for)
+    # ----- private plan_production helpers -----
+
+    def _plan_walk(
+        self,
+        item: 'Greige',
+        lbs: float,
+        start_at: Literal['schedule_tail', 'next_runout'],
+    ) -> '_Walk':
+        """The `plan_production` walk proper (arguments already validated),
+        in work hours: returns the finished `_Walk`, ready to be anchored at
+        a start time (see `_Walk.anchor`). The optional idle gap (phase 0)
+        is added when anchoring. Shared with `producible_lbs_through`, which
+        needs only the activities."""
+        walk = _Walk(self._current_status)
 
         # 1. Run-up (only in 'next_runout' mode).
         if start_at == 'next_runout':
-            working = self._emit_run_up(emitted, working, jobs)
+            self._emit_run_up(walk)
 
         # 2. Changeover preamble.
-        working = self._emit_preamble(emitted, working, item)
+        self._emit_preamble(walk, item)
 
         # 3. Production loop for the new item.
-        self._emit_production_loop(emitted, working, item, lbs, jobs, tgt_order)
-        return ProductionPlan(activities=tuple(emitted), jobs=tuple(jobs))
-
-    # ----- private plan_production helpers -----
+        self._emit_production_loop(walk, item, lbs)
+        return walk
 
-    def _emit_run_up(
-        self, emitted: list[Activity], working: Status, jobs: list[Job],
-    ) -> Status:
-        """Produce `working.current_item` toward a beam runout in **whole
+    def _emit_run_up(self, walk: '_Walk') -> None:
+        """Produce `walk.current_item` toward a beam runout in **whole
         rolls only** — never starting a roll the current beams can't finish
         above `BEAM_FLOOR_LBS`, so the machine is never stranded mid-roll at
         the changeover. Each roll is a `Knit(tgt_wt)` followed by a `Doff`;
         the roll's `completion_time` is that `Doff`'s end. Emits no `Waste`
         and no beam work of its own (each bar keeps its leftover usable yarn
         for the preamble). Appends one run-up `Job` (omitted when no whole
-        roll fits) and returns the working status with `current_item`
-        unchanged."""
-        cur = working.current_item
+        roll fits) and leaves `current_item` unchanged."""
+        cur = walk.current_item
         cfg = cur.configuration
         # Whole rolls only — the same stopping point next_runout predicts.
         n_rolls = _whole_rolls_before_floor(
-            working.lbs_remaining('top'), cfg.top_pct,
-            working.lbs_remaining('btm'), cfg.btm_pct, cur.tgt_wt,
+            walk.lbs_remaining('top'), cfg.top_pct,
+            walk.lbs_remaining('btm'), cfg.btm_pct, cur.tgt_wt,
         )
         if n_rolls <= 0:
-            return working
+            return
 
-        rolls: list[Roll] = []
+        rolls: list[tuple] = []
         for _ in range(n_rolls):
-            working = self._emit_knit(emitted, working, cur, cur.tgt_wt)
-            knit = emitted[-1]                # the Knit just emitted
-            working = self._emit_doff(emitted, working)
-            rolls.append(Roll(lbs=cur.tgt_wt, completion_time=working.as_of,
-                              knits=(knit,)))
-        jobs.append(Job(item=cur, rolls=tuple(rolls)))
-        return working
-
-    def _emit_preamble(
-        self, emitted: list[Activity], working: Status, item: 'Greige',
-    ) -> Status:
+            knit = self._emit_knit(walk, cur, cur.tgt_wt)
+            doff = self._emit_doff(walk)
+            rolls.append((cur.tgt_wt, (knit,), doff))
+        walk.jobs.append((cur, tuple(rolls), False))
+
+    def _emit_preamble(self, walk: '_Walk', item: 'Greige') -> None:
         """Changeover preamble. Each bar arrives in one of four states,
         resolved against the new `item`'s yarn and the bar's
         `usable = lbs_remaining(bar) - BEAM_FLOOR_LBS`:
@@ -475,62 +807,41 @@ class Machine(HasID[str]):
         the changeover (`StyleChange` / `RunnerChange` / `PatternChange`) when
         `item != current_item`."""
         cfg = item.configuration
-
-        def bar_action(bar: Literal['top', 'btm'], want_beam: str) -> str:
-            """One of 'load' (empty), 'keep' (matching yarn), 'tape'
-            (mismatch worth preserving), or 'waste' (mismatch to discard)."""
-            usable = working.lbs_remaining(bar) - BEAM_FLOOR_LBS
-            if usable <= _FLOAT_EPS:
-                return 'load'
-            beam = working.beam(bar)
-            if beam is not None and beam.id == want_beam:
-                return 'keep'
-            return 'tape' if usable > MAX_BEAM_WASTE_LBS else 'waste'
-
-        top_action = bar_action('top', cfg.top_beam)
-        btm_action = bar_action('btm', cfg.btm_beam)
+        top_action = _bar_action(
+            walk.lbs_remaining('top'), walk.beam('top'), cfg.top_beam,
+        )
+        btm_action = _bar_action(
+            walk.lbs_remaining('btm'), walk.beam('btm'), cfg.btm_beam,
+        )
 
         # Tape-out phase — batch into one 'both' when both bars tape out.
-        if top_action == 'tape' and btm_action == 'tape':
-            working = self._emit_tape_out(emitted, working, 'both')
-        elif top_action == 'tape':
-            working = self._emit_tape_out(emitted, working, 'top')
-        elif btm_action == 'tape':
-            working = self._emit_tape_out(emitted, working, 'btm')
+        tape_bars = _bars(top_action == 'tape', btm_action == 'tape')
+        if tape_bars is not None:
+            self._emit_tape_out(walk, tape_bars)
 
         # Waste phase — discard near-empty mismatched residue (the beam
         # currently on the bar). Zero duration; empties the bar.
         if top_action == 'waste':
-            working = self._emit_waste(
-                emitted, working, 'top',
-                working.lbs_remaining('top') - BEAM_FLOOR_LBS,
+            self._emit_waste(
+                walk, 'top', walk.lbs_remaining('top') - BEAM_FLOOR_LBS,
             )
         if btm_action == 'waste':
-            working = self._emit_waste(
-                emitted, working, 'btm',
-                working.lbs_remaining('btm') - BEAM_FLOOR_LBS,
+            self._emit_waste(
+                walk, 'btm', walk.lbs_remaining('btm') - BEAM_FLOOR_LBS,
             )
 
         # Re-thread phase — every bar that wasn't kept gets a fresh set
         # (Hanging + Threading). Batch into 'both' when both are re-threaded.
-        rethread_top = top_action != 'keep'
-        rethread_btm = btm_action != 'keep'
-        if rethread_top and rethread_btm:
-            working = self._emit_rethread(emitted, working, 'both', item)
-        elif rethread_top:
-            working = self._emit_rethread(emitted, working, 'top', item)
-        elif rethread_btm:
-            working = self._emit_rethread(emitted, working, 'btm', item)
+        rethread_bars = _bars(top_action != 'keep', btm_action != 'keep')
+        if rethread_bars is not None:
+            self._emit_rethread(walk, rethread_bars, item)
 
         # Changeover phase — the right changeover type when the item changes.
-        if item != working.current_item:
-            working = self._emit_changeover(emitted, working, item)
-        return working
+        if item != walk.current_item:
+            self._emit_changeover(walk, item)
 
     def _emit_production_loop(
-        self, emitted: list[Activity], working: Status,
-        item: 'Greige', lbs: float, jobs: list[Job],
-        tgt_order: str | None = None,
+        self, walk: '_Walk', item: 'Greige', lbs: float,
     ) -> None:
         """Wind `lbs` of `item` (a whole multiple of `tgt_wt`) one roll at a
         time, recording each completed `Roll` on one straddle-aware `Job`.
@@ -538,31 +849,31 @@ class Machine(HasID[str]):
         end; a `Knit` is one uninterrupted run that ends at a doff or a beam
         swap, so `0 < Knit.lbs <= tgt_wt`. A roll that hits a beam floor
         mid-wind continues on the fresh beam (a `Hanging` + `Threading`), so
-        it can span two `Knit`s. See the production-loop walk in DESIGN.md."""
+        it can span two `Knit`s. See the production-loop walk in DESIGN.md.
+        The `Job` is the one `anchor` stamps with the call's `tgt_order`."""
         cfg = item.configuration
         tgt = item.tgt_wt
-        rolls: list[Roll] = []
+        rolls: list[tuple] = []
 
         rolls_left = round(lbs / tgt)   # whole rolls owed (lbs is a multiple)
         roll_filled = 0.0               # lbs wound on the in-progress roll
         knit = 0.0                      # lbs in the current (unflushed) Knit
-        roll_knits: list[Knit] = []     # Knits wound onto the in-progress roll
+        roll_knits: list[int] = []      # Knits wound onto the in-progress roll
 
         def usable(bar: Literal['top', 'btm'], pct: float) -> float:
             """Live usable yarn on a bar, net of the un-flushed Knit: a bar
             is exhausted at `usable <= 0`, near-empty below
             `MAX_BEAM_WASTE_LBS`."""
-            return working.lbs_remaining(bar) - knit * pct - BEAM_FLOOR_LBS
+            return walk.lbs_remaining(bar) - knit * pct - BEAM_FLOOR_LBS
 
         def flush() -> None:
             """Emit the open Knit (if any), record it on the in-progress
-            roll, and reset the accumulator. The Knit's start is the current
-            `working.as_of`, unchanged since the accumulator opened (nothing
-            else is emitted mid-segment)."""
-            nonlocal working, knit
+            roll, and reset the accumulator. The Knit starts where the last
+            step ended, unchanged since the accumulator opened (nothing else
+            is emitted mid-segment)."""
+            nonlocal knit
             if knit > _FLOAT_EPS:
-                working = self._emit_knit(emitted, working, item, knit)
-                roll_knits.append(emitted[-1])
+                roll_knits.append(self._emit_knit(walk, item, knit))
                 knit = 0.0
 
         def resolve() -> None:
@@ -570,20 +881,17 @@ class Machine(HasID[str]):
             near-empty (discard its residue as `Waste`, then re-thread).
             Flushes the open Knit once before any beam work; bars swapped
             together use the 'both' re-thread (the co-swap)."""
-            nonlocal working
             top_u = usable('top', cfg.top_pct)
             btm_u = usable('btm', cfg.btm_pct)
-            if top_u >= MAX_BEAM_WASTE_LBS and btm_u >= MAX_BEAM_WASTE_LBS:
+            swap_top, swap_btm = _bars_to_swap(top_u, btm_u)
+            if not (swap_top or swap_btm):
                 return                          # neither bar needs a swap
             flush()
-            swapped: list[str] = []
-            for bar, u in (('top', top_u), ('btm', btm_u)):
-                if u < MAX_BEAM_WASTE_LBS:
-                    if u > _FLOAT_EPS:          # near-empty — discard residue
-                        working = self._emit_waste(emitted, working, bar, u)
-                    swapped.append(bar)
-            bars = 'both' if len(swapped) == 2 else swapped[0]
-            working = self._emit_rethread(emitted, working, bars, item)
+            for bar, u, swap in (('top', top_u, swap_top),
+                                 ('btm', btm_u, swap_btm)):
+                if swap and u > _FLOAT_EPS:     # near-empty — discard residue
+                    self._emit_waste(walk, bar, u)
+            self._emit_rethread(walk, _bars(swap_top, swap_btm), item)
 
         while rolls_left > 0:
             if roll_filled == 0.0:
@@ -597,9 +905,8 @@ class Machine(HasID[str]):
             roll_filled += step
             if roll_filled >= tgt - _FLOAT_EPS:  # roll complete
                 flush()                          # emit the roll's final Knit
-                working = self._emit_doff(emitted, working)
-                rolls.append(Roll(lbs=tgt, completion_time=working.as_of,
-                                  knits=tuple(roll_knits)))
+                doff = self._emit_doff(walk)
+                rolls.append((tgt, tuple(roll_knits), doff))
                 roll_filled = 0.0
                 rolls_left -= 1
                 roll_knits.clear()
@@ -607,146 +914,294 @@ class Machine(HasID[str]):
                 resolve()                        # re-thread it; co-swap other
 
         if rolls:
-            jobs.append(Job(item=item, rolls=tuple(rolls), tgt_order=tgt_order))
+            walk.jobs.append((item, tuple(rolls), True))
 
     # ----- single-activity emission helpers -----
+    #
+    # Each records one step on the walk — its activity class, the fields
+    # other than `start`/`end`, and its duration in work hours (`None` for
+    # a step that takes no machine time) — and rolls the walk's bars forward
+    # exactly as `Status.apply_activity` would. Each returns the step's
+    # index, which is how rolls refer to their `Knit`s and `Doff`.
 
     def _emit_knit(
-        self, emitted: list[Activity], working: Status,
-        item: 'Greige', lbs: float,
-    ) -> Status:
+        self, walk: '_Walk', item: 'Greige', lbs: float,
+    ) -> int:
         """Emit one `Knit` activity for `lbs` of `item` — one uninterrupted
-        run (it ends at a doff or a beam swap). Roll tracking is the caller's
-        job: the run-up and production loop record each `Roll` after its
-        `Doff`. See DESIGN.md."""
+        run (it ends at a doff or a beam swap). Roll tracking is the
+        caller's job: the run-up and production loop record each roll
+        after its `Doff`. See DESIGN.md."""
         rate = item.get_rate_on_mchn(self._id)
-        start = working.as_of
-        end = self._workcal.offset_work_hours(start, lbs / rate)
-        emitted.append(Knit(start=start, end=end, item=item, lbs=lbs))
-        return working.apply_activity(emitted[-1])
-
-    def _emit_doff(
-        self, emitted: list[Activity], working: Status,
-    ) -> Status:
+        cfg = item.configuration
+        walk.lbs['top'] = walk.lbs['top'] - lbs * cfg.top_pct
+        walk.lbs['btm'] = walk.lbs['btm'] - lbs * cfg.btm_pct
+        walk.current_item = item
+        return walk.record(Knit, lbs / rate, item=item, lbs=lbs)
+
+    def _emit_doff(self, walk: '_Walk') -> int:
         """Emit a `Doff` taking one just-completed roll off the machine. The
-        roll's `completion_time` is this `Doff`'s end (the returned status's
-        `as_of`)."""
-        start = working.as_of
-        end = self._workcal.offset_work_hours(start, DOFF_DURATION)
-        emitted.append(Doff(start=start, end=end))
-        return working.apply_activity(emitted[-1])
+        roll's `completion_time` is this `Doff`'s end."""
+        return walk.record(Doff, DOFF_DURATION)
 
     def _emit_waste(
-        self, emitted: list[Activity], working: Status,
-        bar: Literal['top', 'btm'], lbs: float,
-    ) -> Status:
+        self, walk: '_Walk', bar: Literal['top', 'btm'], lbs: float,
+    ) -> int:
         """Emit a zero-duration `Waste` discarding `lbs` of usable residue
         from `bar`. The discarded yarn is the beam currently on that bar
-        (read from `working`). The yarn is removed unknit, so the activity
-        occupies no machine time (`start == end`); applying it empties the
-        named bar (beam -> None, lbs -> 0) so a paired re-thread can refill
-        it."""
-        start = working.as_of
-        beam = working.beam(bar)
-        emitted.append(Waste(start=start, end=start, beam=beam,
-                             bar=bar, lbs=lbs))
-        return working.apply_activity(emitted[-1])
+        (read from `walk`). The yarn is removed unknit, so the activity
+        occupies no machine time (`start == end`); it empties the named bar
+        (beam -> None, lbs -> 0) so a paired re-thread can refill it."""
+        step = walk.record(Waste, None, beam=walk.beam(bar), bar=bar, lbs=lbs)
+        walk.remove(bar)
+        walk.waste_lbs += lbs
+        return step
 
     def _emit_tape_out(
-        self, emitted: list[Activity], working: Status,
-        bars: Literal['top', 'btm', 'both'],
-    ) -> Status:
+        self, walk: '_Walk', bars: Literal['top', 'btm', 'both'],
+    ) -> int:
         """Emit a `TapeOut` of `bars`, recording the beam SKU(s) removed from
-        each affected bar (read from `working`) for inventory tracking."""
+        each affected bar (read from `walk`) for inventory tracking."""
         duration = (TAPE_OUT_BOTH_DURATION if bars == 'both'
                     else TAPE_OUT_SINGLE_DURATION)
-        start = working.as_of
-        end = self._workcal.offset_work_hours(start, duration)
-        top_beam = working.beam('top') if bars in ('top', 'both') else None
-        btm_beam = working.beam('btm') if bars in ('btm', 'both') else None
-        emitted.append(TapeOut(start=start, end=end, bars=bars,
-                               top_beam=top_beam, btm_beam=btm_beam))
-        return working.apply_activity(emitted[-1])
+        top_beam = walk.beam('top') if bars in ('top', 'both') else None
+        btm_beam = walk.beam('btm') if bars in ('btm', 'both') else None
+        step = walk.record(TapeOut, duration, bars=bars,
+                           top_beam=top_beam, btm_beam=btm_beam)
+        if bars in ('top', 'both'):
+            walk.remove('top')
+        if bars in ('btm', 'both'):
+            walk.remove('btm')
+        if bars == 'both':
+            walk.tape_out_both += 1
+        else:
+            walk.tape_out_single += 1
+        return step
 
     def _emit_hanging(
-        self, emitted: list[Activity], working: Status,
-        bars: Literal['top', 'btm', 'both'], item: 'Greige',
-    ) -> Status:
+        self, walk: '_Walk', bars: Literal['top', 'btm', 'both'],
+        item: 'Greige',
+    ) -> int:
         """Mount a fresh beam set on the named bar(s), loading each bar's beam
         (from `item`'s yarn) and lbs (`fresh_beam_lbs`) and leaving it
         un-threaded. Pairs with a `_emit_threading`."""
         cfg = item.configuration
-        start = working.as_of
         duration = (HANGING_BOTH_DURATION if bars == 'both'
                     else HANGING_SINGLE_DURATION)
-        end = self._workcal.offset_work_hours(start, duration)
         top_beam = BeamSet(cfg.top_beam) if bars in ('top', 'both') else None
         btm_beam = BeamSet(cfg.btm_beam) if bars in ('btm', 'both') else None
         top_lbs = fresh_beam_lbs(top_beam) if top_beam is not None else 0.0
         btm_lbs = fresh_beam_lbs(btm_beam) if btm_beam is not None else 0.0
-        emitted.append(Hanging(
-            start=start, end=end, bars=bars,
+        if top_beam is not None:
+            walk.beams['top'], walk.lbs['top'] = top_beam, top_lbs
+        if btm_beam is not None:
+            walk.beams['btm'], walk.lbs['btm'] = btm_beam, btm_lbs
+        return walk.record(
+            Hanging, duration, bars=bars,
             top_beam=top_beam, top_lbs=top_lbs,
             btm_beam=btm_beam, btm_lbs=btm_lbs,
-        ))
-        return working.apply_activity(emitted[-1])
+        )
 
     def _emit_threading(
-        self, emitted: list[Activity], working: Status,
-        bars: Literal['top', 'btm', 'both'],
-    ) -> Status:
-        """Route the loaded yarn on the named bar(s) — flips them to
-        threaded. The beam/lbs were already loaded by the preceding
-        `_emit_hanging`."""
-        start = working.as_of
+        self, walk: '_Walk', bars: Literal['top', 'btm', 'both'],
+    ) -> int:
+        """Route the loaded yarn on the named bar(s). The beam/lbs were
+        already loaded by the preceding `_emit_hanging`, and the walk does
+        not track threading (nothing in it reads the flag)."""
         duration = (THREADING_BOTH_DURATION if bars == 'both'
                     else THREADING_SINGLE_DURATION)
-        end = self._workcal.offset_work_hours(start, duration)
-        emitted.append(Threading(start=start, end=end, bars=bars))
-        return working.apply_activity(emitted[-1])
+        return walk.record(Threading, duration, bars=bars)
 
     def _emit_rethread(
-        self, emitted: list[Activity], working: Status,
-        bars: Literal['top', 'btm', 'both'], item: 'Greige',
-    ) -> Status:
+        self, walk: '_Walk', bars: Literal['top', 'btm', 'both'],
+        item: 'Greige',
+    ) -> None:
         """Re-thread the named bar(s): a `Hanging` (mount the fresh set) then
         a `Threading` (route the yarn). Together these replace the old single
         `BeamLoad`; the bar(s) must already be removed."""
-        working = self._emit_hanging(emitted, working, bars, item)
-        return self._emit_threading(emitted, working, bars)
-
-    def _emit_idle(
-        self, emitted: list[Activity], working: Status, duration: timedelta,
-    ) -> Status:
-        start = working.as_of
-        end = self._workcal.offset_work_hours(
-            start, duration.total_seconds() / 3600,
-        )
-        emitted.append(Idle(start=start, end=end))
-        return working.apply_activity(emitted[-1])
+        self._emit_hanging(walk, bars, item)
+        self._emit_threading(walk, bars)
 
-    def _emit_changeover(
-        self, emitted: list[Activity], working: Status, to_item: 'Greige',
-    ) -> Status:
+    def _emit_changeover(self, walk: '_Walk', to_item: 'Greige') -> int:
         """Emit the changeover activity for switching to `to_item`, selected
         from `is_new` and the pattern-family comparison (see "Beam-swap
         decision" in DESIGN.md): `StyleChange` on a new machine, else
         `RunnerChange` within the pattern family or `PatternChange` across
         it. The activity class carries the semantic — there is no
         `is_family_change` flag."""
-        from_item = working.current_item
-        if self._is_new:
-            cls, duration = StyleChange, STYLE_CHANGE_DURATION
-        elif from_item.family == to_item.family:
-            cls, duration = RunnerChange, RUNNER_CHANGE_DURATION
+        from_item = walk.current_item
+        cls, duration = _changeover(self._is_new, from_item, to_item)
+        if cls is StyleChange:
+            walk.style_change += 1
+        elif cls is RunnerChange:
+            walk.runner_change += 1
         else:
-            cls, duration = PatternChange, PATTERN_CHANGE_DURATION
-        start = working.as_of
-        end = self._workcal.offset_work_hours(start, duration)
-        emitted.append(cls(
-            start=start, end=end, from_item=from_item, to_item=to_item,
-        ))
-        return working.apply_activity(emitted[-1])
+            walk.pattern_change += 1
+        walk.current_item = to_item
+        return walk.record(cls, duration,
+                           from_item=from_item, to_item=to_item)
+
+
+class _Walk:
+    """One `plan_production` walk in work-hour coordinates: the machine's
+    bars and current item as the walk rolls them forward, the recorded
+    steps, the `Job`s, and the `ScheduleSummary` counts. Mutable while the
+    walk runs, then only read. It stands in for the chain of `Status`
+    snapshots the walk would otherwise build one activity at a time, and
+    skips their beam-swap guards (the walk emits swaps in order by
+    construction; `add_activities` still checks them on commit).
+
+    Nothing the walk decides depends on the clock, so a finished walk is a
+    plan that has not been placed in time yet: `steps` holds each step's
+    activity class, its fields other than `start`/`end`, and its duration
+    in work hours, and `jobs` holds each `Job` as `(item, rolls,
+    takes_order)` with each roll as `(lbs, knit step indices, doff step
+    index)`. `anchor` places it after an optional idle gap."""
+    __slots__ = (
+        'current_item', 'beams', 'lbs', 'steps', 'jobs',
+        'tape_out_single', 'tape_out_both', 'style_change',
+        'runner_change', 'pattern_change', 'waste_lbs',
+    )
+
+    def __init__(self, status: Status) -> None:
+        self.current_item = status.current_item
+        self.beams = {'top': status.beam('top'), 'btm': status.beam('btm')}
+        self.lbs = {'top': status.lbs_remaining('top'),
+                    'btm': status.lbs_remaining('btm')}
+        self.steps: list[tuple[type, dict, float | None]] = []
+        self.jobs: list[tuple] = []
+        self.tape_out_single = self.tape_out_both = 0
+        self.style_change = self.runner_change = self.pattern_change = 0
+        self.waste_lbs = 0.0
+
+    def beam(self, bar: Literal['top', 'btm']) -> BeamSet | None:
+        return self.beams[bar]
+
+    def lbs_remaining(self, bar: Literal['top', 'btm']) -> float:
+        return self.lbs[bar]
+
+    def record(self, cls: type, hours: float | None, **fields) -> int:
+        """Record a step of `hours` work hours (`None`: no machine time)
+        that will build `cls(**fields)`, and return its index."""
+        self.steps.append((cls, fields, hours))
+        return len(self.steps) - 1
+
+    def remove(self, bar: Literal['top', 'btm']) -> None:
+        """Empty `bar`, as a `TapeOut` or `Waste` does."""
+        self.beams[bar] = None
+        self.lbs[bar] = 0.0
+
+    def anchor(
+        self, workcal: 'WorkCal', start: datetime, idle_for: timedelta,
+        tgt_order: str | None,
+    ) -> ProductionPlan:
+        """The `ProductionPlan` of this walk starting at `start`, after an
+        `Idle` of `idle_for` work hours when that is positive. Every step's
+        end is its predecessor's end offset by the step's duration, mapped
+        to datetimes in one `WorkCal.chain_work_hours` batch. `Knit`s,
+        `Roll`s and `Job`s are built here, fresh for each plan (the
+        new-item `Job` carrying `tgt_order`); the other activities are left
+        for the plan to build on first read."""
+        hours = [h for _, _, h in self.steps if h is not None]
+        idle_hours = 0.0
+        if idle_for > timedelta(0):
+            hours.insert(0, idle_for.total_seconds() / 3600)
+        ends = iter(workcal.chain_work_hours(start, hours))
+
+        built: list = []
+        if idle_for > timedelta(0):
+            end = next(ends)
+            built.append((Idle, {'start': start, 'end': end}))
+            # Measured back off the workcal, as `ScheduleSummary.of` does.
+            idle_hours = workcal.get_work_hours_between(start, end)
+            start = end
+        head = len(built)
+        times: list[datetime] = []
+        for cls, fields, h in self.steps:
+            end = start if h is None else next(ends)
+            if cls is Knit:
+                built.append(Knit(start=start, end=end, **fields))
+            else:
+                built.append((cls, {'start': start, 'end': end, **fields}))
+            times.append(end)
+            start = end
+
+        jobs = tuple(
+            Job(
+                item=item,
+                rolls=tuple(
+                    Roll(lbs=lbs, completion_time=times[doff],
+                         knits=tuple(built[head + k] for k in knits))
+                    for lbs, knits, doff in rolls
+                ),
+                tgt_order=tgt_order if takes_order else None,
+            )
+            for item, rolls, takes_order in self.jobs
+        )
+        summary = ScheduleSummary(
+            self.tape_out_single, self.tape_out_both, self.style_change,
+            self.runner_change, self.pattern_change,
+            idle_hours, self.waste_lbs,
+        )
+        return ProductionPlan._deferred(built, jobs, summary)
+
+
+def _materialize(steps: list) -> tuple[Activity, ...]:
+    """The activities of an anchored walk's `steps`, in order: each `Knit`
+    as built, every other activity from its `(class, fields)` pair."""
+    activities: list[Activity] = []
+    for step in steps:
+        if type(step) is tuple:
+            cls, fields = step
+            step = cls(**fields)
+        activities.append(step)
+    return tuple(activities)
+
+
+def _bar_action(lbs: float, beam: BeamSet | None, want_beam: str) -> str:
+    """The changeover preamble's action for a bar holding `lbs` on `beam`
+    when the new item wants `want_beam`: 'load' (empty), 'keep' (matching
+    yarn), 'tape' (mismatch worth preserving), or 'waste' (mismatch to
+    discard). Shared by `_emit_preamble` and the capacity arithmetic."""
+    usable = lbs - BEAM_FLOOR_LBS
+    if usable <= _FLOAT_EPS:
+        return 'load'
+    if beam is not None and beam.id == want_beam:
+        return 'keep'
+    return 'tape' if usable > MAX_BEAM_WASTE_LBS else 'waste'
+
+
+def _bars_to_swap(top_usable: float, btm_usable: float) -> tuple[bool, bool]:
+    """Which bars the production loop swaps, given each bar's usable yarn
+    net of the open `Knit`: those at the floor or near-empty (below
+    `MAX_BEAM_WASTE_LBS`). Shared by `_emit_production_loop` and the
+    capacity arithmetic."""
+    return top_usable < MAX_BEAM_WASTE_LBS, btm_usable < MAX_BEAM_WASTE_LBS
+
+
+def _bars(top: bool, btm: bool) -> Literal['top', 'btm', 'both'] | None:
+    """The `bars` of one step on the flagged bars — 'both' batches the two
+    — or `None` when neither is flagged."""
+    if top and btm:
+        return 'both'
+    if top:
+        return 'top'
+    if btm:
+        return 'btm'
+    return None
+
+
+def _changeover(
+    is_new: bool, from_item: 'Greige', to_item: 'Greige',
+) -> tuple[type, float]:
+    """The changeover activity class and duration for switching from
+    `from_item` to `to_item`: `StyleChange` on a new machine, else
+    `RunnerChange` within the pattern family or `PatternChange` across it.
+    Shared by `_emit_changeover` and the capacity arithmetic."""
+    if is_new:
+        return StyleChange, STYLE_CHANGE_DURATION
+    if from_item.family == to_item.family:
+        return RunnerChange, RUNNER_CHANGE_DURATION
+    return PatternChange, PATTERN_CHANGE_DURATION
 
 
 def _whole_rolls_before_floor(
@@ -774,3 +1229,16 @@ def _whole_rolls_before_floor(
     else:
         n = math.floor(n_exact)
     return max(0, n)
+
+
+def _whole_rolls_lbs(total_lbs: float, tgt_wt: float) -> float:
+    """`total_lbs` rounded down to a whole multiple of `tgt_wt`, snapping
+    near-integer roll counts (float drift from the
+    `min(top_lbs/top_pct, btm_lbs/btm_pct) * rate` chains)."""
+    n_rolls_exact = total_lbs / tgt_wt
+    n_rolls_rounded = round(n_rolls_exact)
+    if abs(n_rolls_rounded - n_rolls_exact) < _ROLL_TOLERANCE:
+        n_rolls = n_rolls_rounded
+    else:
+        n_rolls = math.floor(n_rolls_exact)
+    return max(0, n_rolls) * tgt_wt
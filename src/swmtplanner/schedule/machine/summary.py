@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from typing import Iterable, TYPE_CHECKING
+
+from swmtplanner.schedule.activity import (
+    Activity, TapeOut, StyleChange, RunnerChange, PatternChange, Idle, Waste,
+)
+
+if TYPE_CHECKING:
+    from swmtplanner.support import WorkCal
+
+
+@dataclass(frozen=True)
+class ScheduleSummary:
+    """Running totals of the schedule quantities the planner penalizes:
+    tape-outs (single bar / both bars), changeovers by type, work hours
+    spent `Idle`, and lbs of discarded `Waste`. Every other activity type
+    contributes nothing.
+
+    `Machine` keeps one for its committed activity schedule (rolled forward
+    by `add_activities`) and `plan_production` attaches one to each
+    `ProductionPlan`, so "machine + plan" is `merge` of two summaries rather
+    than a walk of the schedule. Idle time is measured in work hours against
+    the owning machine's `workcal`, hence the `workcal` argument to `of`."""
+    tape_out_single: int = 0
+    tape_out_both: int = 0
+    style_change: int = 0
+    runner_change: int = 0
+    pattern_change: int = 0
+    idle_hours: float = 0.0
+    waste_lbs: float = 0.0
+
+    @classmethod
+    def of(
+        cls, activities: Iterable[Activity], workcal: 'WorkCal',
+    ) -> 'ScheduleSummary':
+        """Summarize `activities`, measuring `Idle` spans in `workcal`
+        work hours."""
+        tos = tob = sc = rc = pc = 0
+        idle_hours = waste_lbs = 0.0
+        # Dispatch on the exact class: the activity types are leaf classes,
+        # and `isinstance` against them goes through the (slow) protocol
+        # check `HasID` brings into the hierarchy.
+        for a in activities:
+            kind = type(a)
+            if kind is TapeOut:
+                if a.bars == 'both':
+                    tob += 1
+                else:
+                    tos += 1
+            elif kind is StyleChange:
+                sc += 1
+            elif kind is RunnerChange:
+                rc += 1
+            elif kind is PatternChange:
+                pc += 1
+            elif kind is Idle:
+                # Idle duration is in work hours (set via
+                # workcal.offset_work_hours when the activity was created);
+                # extracting that back is what get_work_hours_between does.
+                idle_hours += workcal.get_work_hours_between(a.start, a.end)
+            elif kind is Waste:
+                waste_lbs += a.lbs
+        return cls(tos, tob, sc, rc, pc, idle_hours, waste_lbs)
+
+    def merge(self, other: 'ScheduleSummary') -> 'ScheduleSummary':
+        """The summary of this schedule followed by `other`'s."""
+        return ScheduleSummary(
+            self.tape_out_single + other.tape_out_single,
+            self.tape_out_both + other.tape_out_both,
+            self.style_change + other.style_change,
+            self.runner_change + other.runner_change,
+            self.pattern_change + other.pattern_change,
+            self.idle_hours + other.idle_hours,
+            self.waste_lbs + other.waste_lbs,
+        )
@@ -4,6 +4,8 @@ from typing import Protocol
 from abc import abstractmethod
 
 class HasID[T](Protocol):
+    # No instance state of its own, so slotted subclasses stay dict-free.
+    __slots__ = ()
 
     def __eq__(self, value):
         if not (hasattr(value, 'prefix') and hasattr(value, 'id')):
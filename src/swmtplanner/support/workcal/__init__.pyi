@@ -3,7 +3,7 @@ from .holidays import (
 )
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 __all__ = [
     'FlexDate', 'FixedDate', 'holidays_from_list', 'load_holidays',
@@ -52,6 +52,10 @@ class WorkCal:
         ...
     @property
     def holidays(self) -> tuple[FlexDate | FixedDate]: ...
+    @property
+    def cal_shift(self) -> float:
+        """The day-boundary offset in hours (0 for an unshifted calendar)."""
+        ...
     def is_holiday(self, d: date) -> bool:
         """Reports whether the given date is a holiday in this calendar."""
         ...
@@ -69,6 +73,13 @@ class WorkCal:
         """Offset from start by the provided amount of hours. Same snapping behavior
         as offset_work_days."""
         ...
+    def chain_work_hours(
+        self, start: datetime, hours: Iterable[float],
+    ) -> list[datetime]:
+        """Offset from start by each of hours in turn, each step starting where
+        the previous one ended. Equal to chaining offset_work_hours calls, but
+        steps that stay inside one work day skip the calendar lookups."""
+        ...
     def get_work_hours_between(self, start: datetime, end: datetime) -> float:
         """Get the available work hours between the two datetimes, skipping
         weekends and holidays."""
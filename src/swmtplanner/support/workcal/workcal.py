@@ -3,9 +3,13 @@
 from datetime import date, datetime, timedelta
 from bisect import bisect_left, bisect_right
 import math
+import threading
 
 from .holidays import *
 
+# Serializes `WorkCal._grow_holiday_cache` across every calendar.
+_CACHE_LOCK = threading.Lock()
+
 def _get_date_in_year(holiday: FlexDate, year: int) -> date:
     if holiday.n == 0:
         raise ValueError('holiday.n cannot be 0')
@@ -56,6 +60,10 @@ class WorkCal:
     def holidays(self):
         return self._holidays
 
+    @property
+    def cal_shift(self):
+        return self._cal_shift.total_seconds() / 3600
+
     def _compute_holiday_ordinals(self, start: int, end: int) -> list[int]:
         ret = []
         year_lo = date.fromordinal(start).year
@@ -88,26 +96,36 @@ class WorkCal:
             hi = start + 1
             func = bisect_right
     
-        if self._hday_lo is None:
-            self._holiday_cache = self._compute_holiday_ordinals(lo, hi)
-            self._hday_lo = lo
-            self._hday_hi = hi
-        else:
-            if lo < self._hday_lo:
-                self._holiday_cache = self._compute_holiday_ordinals(lo, self._hday_lo) + self._holiday_cache
-                self._hday_lo = lo
-            if hi > self._hday_hi:
-                self._holiday_cache += self._compute_holiday_ordinals(self._hday_hi, hi)
-                self._hday_hi = hi
+        if self._hday_lo is None or lo < self._hday_lo or hi > self._hday_hi:
+            self._grow_holiday_cache(lo, hi)
+        holiday_cache = self._holiday_cache
         
-        start_idx = func(self._holiday_cache, start)
-        end_idx = func(self._holiday_cache, end)
+        start_idx = func(holiday_cache, start)
+        end_idx = func(holiday_cache, end)
         if direction == -1:
             start_idx -= 1
             end_idx -= 1
             if end_idx < 0:
-                return self._holiday_cache[start_idx::direction]
-        return self._holiday_cache[start_idx:end_idx:direction]
+                return holiday_cache[start_idx::direction]
+        return holiday_cache[start_idx:end_idx:direction]
+
+    def _grow_holiday_cache(self, lo, hi):
+        # Calendars are shared by threads scoring in parallel, so growing
+        # the cache is serialized, and the cache list is replaced rather than
+        # extended in place and always before the bound that admits it: a
+        # reader that sees a bound covering its range also sees its holidays.
+        with _CACHE_LOCK:
+            if self._hday_lo is None:
+                self._holiday_cache = self._compute_holiday_ordinals(lo, hi)
+                self._hday_hi = hi
+                self._hday_lo = lo
+                return
+            if lo < self._hday_lo:
+                self._holiday_cache = self._compute_holiday_ordinals(lo, self._hday_lo) + self._holiday_cache
+                self._hday_lo = lo
+            if hi > self._hday_hi:
+                self._holiday_cache = self._holiday_cache + self._compute_holiday_ordinals(self._hday_hi, hi)
+                self._hday_hi = hi
     
     def _work_days_in_week(self, year, week, bound = None, direction = 1):
         lo = date.fromisocalendar(year, week, 1).toordinal()
@@ -224,4 +242,32 @@ class WorkCal:
                 prev_d = self.snap_to_work_date(d - timedelta(days=1), direction=-1)
                 current = datetime(prev_d.year, prev_d.month, prev_d.day) \
                     + timedelta(hours=self._day_end)
-        return current + self._cal_shift
\ No newline at end of file
+        return current + self._cal_shift
+
+    def chain_work_hours(self, start: datetime, hours):
+        # Offsets from `start` by each of `hours` in turn, each step starting
+        # where the last one ended -- the same datetimes as chaining
+        # offset_work_hours calls. A step that starts inside a work day and
+        # ends within it is a plain addition, so the day is only looked up
+        # when the chain reaches it; anything else goes through
+        # offset_work_hours.
+        out = []
+        current = start
+        day = midnight = None
+        in_work_day = False
+        for step in hours:
+            if step > 0 and not self._cal_shift:
+                d = current.date()
+                if d != day:
+                    day = d
+                    midnight = datetime(d.year, d.month, d.day)
+                    in_work_day = self.is_work_day(d)
+                h = (current - midnight).total_seconds() / 3600
+                if in_work_day and self._day_start <= h \
+                        and step <= self._day_end - h:
+                    current = current + timedelta(hours=step)
+                    out.append(current)
+                    continue
+            current = self.offset_work_hours(current, step)
+            out.append(current)
+        return out
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""Coverage of the synthetic-plant benchmark package
+(`planners/infinite/bench/`). See `tests/spec-files/BENCH_TEST_SPEC.md`."""
+
+import json
+import unittest
+
+from swmtplanner.planners.infinite import State
+from swmtplanner.planners.infinite.bench import (
+    PlantSpec, run_suite, synthetic_config, synthetic_state,
+)
+
+
+_TINY = PlantSpec(n_machines=4, n_items=8, n_weeks=4, seed=3)
+
+
+class SyntheticInputTests(unittest.TestCase):
+
+    def test_config_is_deterministic_json_at_the_requested_scale(self):
+        cfg = synthetic_config(_TINY)
+        self.assertEqual(cfg, synthetic_config(_TINY))
+        self.assertNotEqual(
+            cfg, synthetic_config(PlantSpec(4, 8, 4, seed=4)),
+        )
+        self.assertEqual(json.loads(json.dumps(cfg)), cfg)
+
+        self.assertEqual(len(cfg['machines']), 4)
+        self.assertEqual(len(cfg['products']), 8)
+        self.assertEqual(len(cfg['demand']), 8)
+        self.assertTrue(
+            all(len(d['weekly_dmnd']) == 4 for d in cfg['demand'])
+        )
+        self.assertTrue(cfg['workcal']['holidays'])
+
+        # Quantities are whole rolls of the item.
+        wt = {p['id']: p['tgt_wt'] for p in cfg['products']}
+        for p in cfg['products']:
+            self.assertEqual(p['safety'] % p['tgt_wt'], 0)
+        for d in cfg['demand']:
+            with self.subTest(item=d['item_id']):
+                for lbs in [d['on_hand'], *d['weekly_dmnd']]:
+                    self.assertEqual(lbs % wt[d['item_id']], 0)
+
+    def test_state_is_built_through_the_loaders(self):
+        state = synthetic_state(_TINY, candidate_threshold=3)
+        self.assertIsInstance(state, State)
+        self.assertEqual(len(state.machines), 4)
+        self.assertEqual(len(state.rls_items), 8)
+        self.assertEqual(state.candidate_threshold, 3)
+        self.assertEqual(state.window_end, _TINY.start_date)
+
+    def test_spec_validation(self):
+        with self.assertRaises(ValueError):
+            PlantSpec(n_machines=0)
+        with self.assertRaises(ValueError):
+            PlantSpec(new_machine_share=1.5)
+        self.assertEqual(_TINY.label, '4x8x4')
+
+
+class RunSuiteTests(unittest.TestCase):
+
+    def test_hot_and_debug_paths_report_the_same_plan(self):
+        hot, debug = run_suite([_TINY], isolate=False)
+        self.assertEqual((hot.path, debug.path), ('hot', 'debug'))
+        self.assertGreater(hot.moves, 0)
+        self.assertEqual(hot.moves, debug.moves)
+        self.assertEqual(hot.n_records, debug.n_records)
+        for r in (hot, debug):
+            with self.subTest(path=r.path):
+                self.assertEqual(r.scale, '4x8x4')
+                self.assertGreater(r.runtime_s, 0)
+                self.assertAlmostEqual(
+                    r.moves_per_s, r.moves / r.runtime_s,
+                )
+                self.assertEqual(r.phases['commit']['count'], r.moves)
+                self.assertGreater(r.record_mb, 0)
+                json.dumps(r.to_dict())
+
+    def test_rejects_unknown_path(self):
+        with self.assertRaises(ValueError):
+            run_suite([_TINY], paths=['warm'], isolate=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
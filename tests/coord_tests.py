@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import dataclasses
 import unittest
 from datetime import datetime, timedelta
 from typing import Literal
@@ -10,8 +11,10 @@ from swmtplanner.support import WorkCal
 from swmtplanner.demand.rlsitem import RlsItem
 from swmtplanner.planners.infinite import State, Move
 from swmtplanner.planners.infinite.coordination import (
-    OrderKey, ScoringContext,
-    assign_priorities, build_new_machine_avail, build_context,
+    OrderKey, RegularOrder, ScoringContext,
+    eligible_orders, assign_priorities, build_order_book,
+    build_new_machine_avail, build_earliest_dp_excluding, build_context,
+    build_context_from_summary, merge_summaries, summarize_candidates,
 )
 
 
@@ -485,6 +488,60 @@ class BuildNewMachineAvailTests(unittest.TestCase):
 
 # --- 1.3 build_context --------------------------------------------------
 
+class BuildEarliestDpExcludingTests(unittest.TestCase):
+
+    def test_each_machine_sees_earliest_other_dp(self):
+        # 1.5.1: three machines with staggered tails. The earliest
+        # machine sees the runner-up; the others see the earliest. A
+        # machine's own later candidates don't count.
+        item_a = _greige('AU_A', safety=0.0)
+        rls_a = _rls(item=item_a, weekly=[100, 0, 0, 0])
+        t0 = _START
+        t1 = _START + timedelta(hours=1)
+        t2 = _START + timedelta(hours=2)
+        m0 = _machine('M0', is_new=False, init_item=item_a, start=t0)
+        m1 = _machine('M1', is_new=False, init_item=item_a, start=t1)
+        m2 = _machine('M2', is_new=False, init_item=item_a, start=t2)
+        state = _make_state(
+            rls_items={'AU_A': rls_a},
+            machines={'M2': m2, 'M0': m0, 'M1': m1},
+        )
+        candidates = [
+            _move('M2', item_a),
+            _move('M0', item_a, start_at='next_runout'),
+            _move('M1', item_a),
+            _move('M0', item_a),
+        ]
+        self.assertEqual(
+            build_earliest_dp_excluding(state, candidates),
+            {'M0': t1, 'M1': t0, 'M2': t0},
+        )
+
+    def test_tie_and_single_machine(self):
+        # 1.5.2: two machines tied for earliest see each other's time;
+        # a lone machine has no entry.
+        item_a = _greige('AU_A', safety=0.0)
+        rls_a = _rls(item=item_a, weekly=[100, 0, 0, 0])
+        m0 = _machine('M0', is_new=False, init_item=item_a)
+        m1 = _machine('M1', is_new=False, init_item=item_a)
+        m2 = _machine(
+            'M2', is_new=False, init_item=item_a,
+            start=_START + timedelta(hours=3),
+        )
+        state = _make_state(
+            rls_items={'AU_A': rls_a},
+            machines={'M0': m0, 'M1': m1, 'M2': m2},
+        )
+        candidates = [_move(m, item_a) for m in ('M0', 'M1', 'M2')]
+        self.assertEqual(
+            build_earliest_dp_excluding(state, candidates),
+            {'M0': _START, 'M1': _START, 'M2': _START},
+        )
+        self.assertEqual(
+            build_earliest_dp_excluding(state, [_move('M0', item_a)]), {},
+        )
+
+
 class BuildContextTests(unittest.TestCase):
 
     def test_standard_composition(self):
@@ -595,6 +652,120 @@ class BuildContextTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             build_context(state, [])
 
+    def test_given_order_book_is_shared_not_rebuilt(self):
+        # 1.3.6: with the iteration's OrderBook passed in, the context
+        # holds the book's own dicts, and leaves them as built.
+        item_a = _greige('AU_A', safety=0.0)
+        rls_a = _rls(item=item_a, weekly=[100, 0, 0, 0])
+        m = _machine('M1', is_new=False, init_item=item_a)
+        state = _make_state(
+            rls_items={'AU_A': rls_a}, machines={'M1': m},
+        )
+        book = build_order_book(state)
+
+        ctx = build_context(state, [_move('M1', item_a)], book)
+        self.assertIs(ctx.order_book, book)
+        self.assertIs(ctx.priorities, book.priorities)
+        self.assertIs(ctx.regular_orders_by_key, book.regular_orders_by_key)
+        self.assertEqual(ctx.priorities, assign_priorities(state))
+
+
+class BuildOrderBookTests(unittest.TestCase):
+
+    def test_book_matches_eligible_orders_and_priorities(self):
+        # 1.4.1: all three buckets. The book's orders, keys and ranks
+        # agree with eligible_orders / assign_priorities, and only the
+        # regular orders are indexed by key.
+        item_u = _greige('AU_U', safety=0.0)
+        rls_u = _rls(item=item_u, weekly=[100, 0, 0, 0])
+        item_s = _greige('AU_S', safety=100.0)
+        rls_s = _rls(item=item_s, weekly=[0, 0, 0, 0], on_hand=50.0)
+        item_f = _greige('AU_F', safety=0.0)
+        rls_f = _rls(item=item_f, weekly=[0, 0, 0, 100])
+        state = _make_state({
+            'AU_U': rls_u, 'AU_S': rls_s, 'AU_F': rls_f,
+        })
+
+        book = build_order_book(state)
+        self.assertEqual(list(book.orders), eligible_orders(state))
+        self.assertEqual(
+            book.keys,
+            (_reg_key('AU_U', 0), _safety_key('AU_S'), _reg_key('AU_F', 3)),
+        )
+        self.assertEqual(book.priorities, assign_priorities(state))
+        self.assertEqual(
+            set(book.regular_orders_by_key),
+            {_reg_key('AU_U', 0), _reg_key('AU_F', 3)},
+        )
+        for key, order in book.regular_orders_by_key.items():
+            self.assertIsInstance(order, RegularOrder)
+            self.assertEqual(key.item_id, order.item.id)
+        self.assertEqual(book.relative_safety['AU_S'], 0.5)
+        self.assertEqual(book.relative_safety['AU_U'], 0.0)
+        self.assertEqual(book.reference_week_idx, state.reference_week_idx)
+
+
+
+# --- 1.6 Candidate summaries ----------------------------------------------
+
+class CandidateSummaryTests(unittest.TestCase):
+
+    def test_slices_merge_to_the_whole_pool(self):
+        # 1.6.1: cut the pool into three consecutive slices at every pair
+        # of points. The merged slice summaries equal the whole pool's,
+        # dict order included, and give the same context.
+        item_a = _greige('AU_A', safety=0.0)
+        item_b = _greige('AU_B', safety=0.0)
+        rls_a = _rls(item=item_a, weekly=[100, 0, 0, 0])   # urgent reg
+        rls_b = _rls(item=item_b, weekly=[0, 0, 0, 100])   # future reg
+        t1 = _START + timedelta(hours=1)
+        t2 = _START + timedelta(hours=2)
+        state = _make_state(
+            rls_items={'AU_A': rls_a, 'AU_B': rls_b},
+            machines={
+                'M0': _machine('M0', is_new=True, init_item=item_a),
+                'M1': _machine('M1', is_new=False, init_item=item_b,
+                               start=t1),
+                'M2': _machine('M2', is_new=False, init_item=item_a,
+                               start=t2),
+            },
+        )
+        book = build_order_book(state)
+
+        def move(machine_id, item, week_idx, start_at='schedule_tail'):
+            return dataclasses.replace(
+                _move(machine_id, item, start_at=start_at),
+                week_idx=week_idx,
+            )
+
+        candidates = [
+            move('M0', item_a, 0), move('M0', item_b, 3),
+            move('M0', item_b, 3, start_at='next_runout'),
+            move('M1', item_b, 3), move('M1', item_a, 0),
+            move('M2', item_a, 0), move('M2', item_b, None),
+        ]
+        whole = summarize_candidates(state, candidates, book)
+        self.assertEqual(whole.n_candidates, len(candidates))
+        self.assertEqual(whole.new_machine_avail,
+                         {'AU_A': True, 'AU_B': True})
+        expected = build_context(state, candidates, book)
+        n = len(candidates)
+        for i in range(n + 1):
+            for j in range(i, n + 1):
+                merged = merge_summaries([
+                    summarize_candidates(state, part, book)
+                    for part in (candidates[:i], candidates[i:j],
+                                 candidates[j:])
+                ])
+                self.assertEqual(merged, whole)
+                self.assertEqual(list(merged.earliest_dp),
+                                 list(whole.earliest_dp))
+                self.assertEqual(list(merged.worst_rank),
+                                 list(whole.worst_rank))
+                self.assertEqual(
+                    build_context_from_summary(state, merged, book),
+                    expected,
+                )
 
 if __name__ == '__main__':
     unittest.main()
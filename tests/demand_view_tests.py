@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 
 import json
+import random
 import unittest
+from unittest import mock
 from collections import namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from swmtplanner.demand.order import WeeklyDemand
 from swmtplanner.demand.view import RawView, SafetyAwareView
+from swmtplanner.demand.view import view as view_module
 from swmtplanner.products import Greige
 
 
@@ -546,6 +549,65 @@ class RawViewRecomputeTests(unittest.TestCase):
         self.assertAlmostEqual(view.lateness, 13200.0)
 
 
+class RawViewIncrementalRecomputeTests(unittest.TestCase):
+    # Spec 6: the kept-stream update path must be bit-for-bit the full walk.
+
+    def _multi_roll_job(self, rng: random.Random) -> _FakeJob:
+        # Several rolls an hour (or zero hours) apart, on a whole-day base so
+        # completion times collide across jobs.
+        base = _START + timedelta(days=rng.randint(0, 35))
+        rolls = tuple(
+            _FakeRoll(
+                lbs=rng.choice([37.5, 90.0, 120.25, 400.0]),
+                completion_time=base + timedelta(hours=rng.choice([0, i])),
+            )
+            for i in range(rng.randint(1, 4))
+        )
+        return _FakeJob(end=rolls[-1].completion_time,
+                        lbs=sum(r.lbs for r in rolls), rolls=rolls)
+
+    def _assert_matches_full(self, view: RawView, jobs, on_hand):
+        full = _make_view([300, 250.5, 410, 180])
+        full.recompute(jobs=list(jobs), on_hand=on_hand)
+        for got, want in zip(view.orders, full.orders):
+            self.assertEqual(got.allocated_lbs, want.allocated_lbs)
+            self.assertEqual(got.late_lbs, want.late_lbs)
+            self.assertEqual(got.late_fill_date, want.late_fill_date)
+        self.assertEqual(view.lateness, full.lateness)
+
+    def test_incremental_updates_match_full_recompute(self):
+        for seed in range(25):
+            rng = random.Random(seed)
+            view = _make_view([300, 250.5, 410, 180])
+            jobs: list[_FakeJob] = []
+            on_hand = rng.choice([0, 75.5])
+            view.recompute(jobs=list(jobs), on_hand=on_hand)
+            for _ in range(12):
+                batch = [self._multi_roll_job(rng)
+                         for _ in range(rng.randint(1, 2))]
+                # A hypothetical, then back — the `cost_if` pattern.
+                trial = sorted(jobs + batch, key=lambda j: j.end)
+                view.recompute(jobs=trial, on_hand=on_hand)
+                self._assert_matches_full(view, trial, on_hand)
+                view.recompute(jobs=list(jobs), on_hand=on_hand)
+                self._assert_matches_full(view, jobs, on_hand)
+                if rng.random() < 0.7:
+                    jobs = trial
+                    view.recompute(jobs=list(jobs), on_hand=on_hand)
+                    self._assert_matches_full(view, jobs, on_hand)
+
+    def test_on_hand_change_and_dropped_job_match_full_recompute(self):
+        rng = random.Random(7)
+        jobs = sorted((self._multi_roll_job(rng) for _ in range(6)),
+                      key=lambda j: j.end)
+        view = _make_view([300, 250.5, 410, 180])
+        view.recompute(jobs=jobs, on_hand=0)
+        view.recompute(jobs=jobs, on_hand=120)
+        self._assert_matches_full(view, jobs, 120)
+        view.recompute(jobs=jobs[1:], on_hand=120)
+        self._assert_matches_full(view, jobs[1:], 120)
+
+
 class SafetyAwareViewRecomputeTests(unittest.TestCase):
     # All tests below default to greige AU2958G, so safety_target == 1400.
 
@@ -1107,5 +1169,87 @@ class SafetyAwareViewRecomputeTests(unittest.TestCase):
         self.assertAlmostEqual(view.drainage, 9800.0)
 
 
+class ViewSimulateTests(unittest.TestCase):
+    # `simulate` returns what `recompute` would leave, and writes nothing.
+
+    def _random_jobs(self, rng: random.Random, n: int) -> list[_FakeJob]:
+        jobs = [
+            _job_at(_START + timedelta(hours=rng.randint(0, 24 * 35)),
+                    lbs=rng.choice([60.0, 175.5, 400.0, 1250.0]))
+            for _ in range(n)
+        ]
+        return sorted(jobs, key=lambda j: j.end)
+
+    def test_simulate_matches_recompute_and_leaves_view_unchanged(self):
+        qtys = [300, 250.5, 410, 180]
+        for seed in range(10):
+            rng = random.Random(seed)
+            jobs = self._random_jobs(rng, 8)
+            raw, safety = _make_view(qtys), _make_safety_view(qtys)
+            raw.recompute(jobs=jobs[:4], on_hand=50)
+            safety.recompute(jobs=jobs[:4], on_hand=50)
+            raw_before = [(o.allocated_lbs, o.late_lbs, o.late_fill_date)
+                          for o in raw.orders]
+            safety_before = (
+                [o.allocated_lbs for o in safety.orders],
+                safety.safety_pool, safety.roll_order_links,
+                safety.drainage, safety.carrying, safety.excess,
+            )
+
+            for on_hand in (50, 80):
+                full_raw, full_safety = _make_view(qtys), _make_safety_view(qtys)
+                full_raw.recompute(jobs=jobs, on_hand=on_hand)
+                full_safety.recompute(jobs=jobs, on_hand=on_hand)
+                self.assertEqual(raw.simulate(jobs, on_hand), full_raw.lateness)
+                self.assertEqual(
+                    safety.simulate(jobs, on_hand),
+                    (full_safety.drainage, full_safety.carrying,
+                     full_safety.excess),
+                )
+
+            self.assertEqual(
+                [(o.allocated_lbs, o.late_lbs, o.late_fill_date)
+                 for o in raw.orders],
+                raw_before,
+            )
+            self.assertEqual(
+                ([o.allocated_lbs for o in safety.orders],
+                 safety.safety_pool, safety.roll_order_links,
+                 safety.drainage, safety.carrying, safety.excess),
+                safety_before,
+            )
+
+
+class SafetyEventPlanTests(unittest.TestCase):
+    # Large simulations plan their events on arrays (`_ARRAY_MIN_CHUNKS`);
+    # either way the costs and detail rows are the same.
+
+    def _run(self, jobs, threshold):
+        with mock.patch.object(view_module, '_ARRAY_MIN_CHUNKS', threshold):
+            view = _make_safety_view([300, 250.5, 410, 180])
+            rows = []
+            view.recompute(jobs=jobs, on_hand=120,
+                           detail_sink=lambda *row: rows.append(row))
+            return (
+                [o.allocated_lbs for o in view.orders], view.safety_pool,
+                view.roll_order_links, view.drainage, view.carrying,
+                view.excess, rows,
+            )
+
+    def test_array_plan_matches_python_plan(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            # Some jobs share an end time, and some land on a due date.
+            ends = [_START + timedelta(hours=rng.randint(0, 24 * 35))
+                    for _ in range(40)]
+            ends += rng.sample(ends, 10) + [_START + timedelta(days=7)] * 3
+            jobs = sorted(
+                (_job_at(end, lbs=rng.choice([60.0, 175.5, 400.0]))
+                 for end in ends),
+                key=lambda j: j.end,
+            )
+            self.assertEqual(self._run(jobs, 0), self._run(jobs, 10**9))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,22 +1,40 @@
 #!/usr/bin/env python
 
+import dataclasses
+import io
+import json
+import math
+import os
+import pickle
+import struct
+import tempfile
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta
 
 from swmtplanner.products import Greige, BeamSet
 from swmtplanner.schedule import (
     Machine, Knit, Job, Roll, ProductionPlan,
     Waste, Doff, TapeOut, Hanging, Threading,
-    StyleChange, RunnerChange, PatternChange, Idle,
+    StyleChange, RunnerChange, PatternChange, Idle, id_counters,
 )
 from swmtplanner.demand.rlsitem import RlsItem
 from swmtplanner.support import WorkCal
+from swmtplanner.planners.infinite.coordination import (
+    build_context, build_priority_prefix,
+)
+from swmtplanner.planners.infinite.coordination import (
+    coordination as coordination_module,
+)
 from swmtplanner.planners.infinite import (
     State, Move, CostWeights, Costing,
     DecisionPoint, OrderKey, RegularOrder, SafetyOrder, ScoringContext,
     assign_priorities, eligible_decision_points, eligible_orders,
-    enumerate_candidates,
-    PlanReport, plan,
+    enumerate_candidates, CandidatePool, next_decision_time,
+    PlanReport, plan, Checkpoint, PhaseTimer,
+)
+from swmtplanner.planners.infinite.loop.plan import (
+    _compute_horizon, _window_steps,
 )
 
 
@@ -544,6 +562,13 @@ class StateTests(unittest.TestCase):
         state.advance_window()
         self.assertEqual(state.window_end, _START + timedelta(hours=6))
 
+    def test_advance_window_multiple_steps(self):
+        state = _make_state(window_end=_START)
+        state.advance_window(3)
+        self.assertEqual(state.window_end, _START + timedelta(hours=72))
+        with self.assertRaises(ValueError):
+            state.advance_window(0)
+
 
 # --- 1.2 Costing -------------------------------------------------------
 
@@ -810,6 +835,344 @@ class CostingTests(unittest.TestCase):
         self.assertAlmostEqual(predicted, costing.score(state))
 
 
+    # ----- 1.2.8 baseline scoring across commits -----
+
+    def test_score_after_move_tracks_commits(self):
+        # Two machines, two items, several greedy iterations. Each iteration
+        # builds a fresh ctx (as the main loop does); the winning prediction
+        # must equal the post-commit score, and the cached score must equal
+        # a fresh Costing's score of the same state.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        weights = _weights(
+            lateness=10.0, drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, tape_out_both=150.0,
+            style_change=50.0, runner_change=60.0, pattern_change=70.0,
+            idle_time=10.0, waste_lbs=1.0,
+        )
+        costing = Costing(weights)
+        for _ in range(4):
+            candidates = enumerate_candidates(state)
+            if not candidates:
+                break
+            ctx = build_context(state, candidates)
+            scores = [costing.score_after_move(state, mv, ctx)
+                      for mv in candidates]
+            best = min(scores)
+            state.commit_move(candidates[scores.index(best)])
+            self.assertAlmostEqual(best, costing.score(state))
+            self.assertAlmostEqual(costing.score(state),
+                                   Costing(weights).score(state))
+
+    # ----- 1.2.9 lower bounds + branch-and-bound argmin -----
+
+    def test_argmin_after_move_matches_exhaustive_min(self):
+        # Each iteration: every lower bound is <= its exact score, and the
+        # branch-and-bound argmin picks the exhaustive min's move — the
+        # first one on a tie (the candidate list is doubled so every score
+        # appears twice). A negative demand weight disables pruning (bound
+        # -inf) without changing the answer.
+        for lateness in (10.0, -1.0):
+            rls_a = _make_rls_item(
+                item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0],
+            )
+            rls_b = _make_rls_item(
+                item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0],
+            )
+            state = _make_state(
+                machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                          'M2': _make_machine('M2', init_item=_ITEM_B)},
+                rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+                window_end=_START + timedelta(days=14),
+            )
+            costing = Costing(_weights(
+                lateness=lateness, drainage=1.0, carrying=2.0, excess=5.0,
+                tape_out_single=100.0, runner_change=60.0, idle_time=10.0,
+            ))
+            for _ in range(4):
+                candidates = enumerate_candidates(state)
+                if not candidates:
+                    break
+                candidates = candidates + candidates
+                ctx = build_context(state, candidates)
+                scores = [costing.score_after_move(state, mv, ctx)
+                          for mv in candidates]
+                for mv, score in zip(candidates, scores):
+                    bound = costing.lower_bound_after_move(state, mv, ctx)
+                    self.assertLessEqual(bound, score)
+                    if lateness < 0:
+                        self.assertEqual(bound, float('-inf'))
+                idx, score = costing.argmin_after_move(state, candidates, ctx)
+                self.assertEqual(idx, scores.index(min(scores)))
+                self.assertEqual(score, min(scores))
+                state.commit_move(candidates[idx])
+
+    # ----- 1.2.10 columnar batch scoring -----
+
+    def test_score_many_matches_score_after_move(self):
+        # Every weight non-zero, so each column contributes. Each
+        # iteration, score_many's array equals the one-at-a-time scores
+        # exactly, in candidate order.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        costing = Costing(_weights(
+            lateness=10.0, drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, tape_out_both=150.0,
+            style_change=50.0, runner_change=60.0, pattern_change=70.0,
+            idle_time=10.0, waste_lbs=1.0,
+            priority=0.5, level_loading=3.0, old_machine=25.0,
+        ))
+        for _ in range(4):
+            candidates = enumerate_candidates(state)
+            if not candidates:
+                break
+            ctx = build_context(state, candidates)
+            expected = [costing.score_after_move(state, mv, ctx)
+                        for mv in candidates]
+            self.assertEqual(
+                costing.score_many(state, candidates, ctx).tolist(),
+                expected,
+            )
+            state.commit_move(candidates[expected.index(min(expected))])
+        self.assertEqual(len(costing.score_many(state, [], ctx)), 0)
+
+    # ----- 1.2.11 weight-specialized evaluation -----
+
+    def test_specialized_costing_matches_general_and_skips_work(self):
+        # Lateness, priority and level-loading weighted 0: the specialized
+        # Costing scores exactly as the unspecialized one and never runs
+        # the raw view's simulation or the priority walk.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        weights = _weights(
+            drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, runner_change=60.0, idle_time=10.0,
+            old_machine=25.0,
+        )
+        specialized = Costing(weights)
+        general = Costing(weights, specialize=False)
+        raw_view_cls = type(rls_a.raw_view)
+        for _ in range(3):
+            candidates = enumerate_candidates(state)
+            if not candidates:
+                break
+            ctx = build_context(state, candidates)
+            expected = [general.score_after_move(state, mv, ctx)
+                        for mv in candidates]
+            expected_best = general.argmin_after_move(state, candidates, ctx)
+            with mock.patch.object(
+                raw_view_cls, 'simulate', side_effect=AssertionError,
+            ), mock.patch.object(
+                Costing, '_priority_raw', side_effect=AssertionError,
+            ):
+                self.assertEqual(
+                    [specialized.score_after_move(state, mv, ctx)
+                     for mv in candidates],
+                    expected,
+                )
+                self.assertEqual(
+                    specialized.score_many(state, candidates, ctx).tolist(),
+                    expected,
+                )
+                self.assertEqual(
+                    specialized.argmin_after_move(state, candidates, ctx),
+                    expected_best,
+                )
+            state.commit_move(candidates[expected.index(min(expected))])
+
+    # ----- 1.2.12 cross-iteration demand cache -----
+
+    def test_demand_cache_reuses_surviving_candidates(self):
+        # Candidates kept alive by a CandidatePool keep their cached
+        # demand costs across iterations. Each iteration, the caching
+        # Costing's argmin and score_many match a fresh Costing's, and a
+        # second score_many in the same iteration simulates nothing.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        weights = _weights(
+            lateness=10.0, drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, runner_change=60.0, idle_time=10.0,
+            level_loading=3.0,
+        )
+        costing = Costing(weights)
+        pool = CandidatePool()
+        for _ in range(4):
+            candidates = pool.refresh(state)
+            if not candidates:
+                break
+            ctx = build_context(state, candidates)
+            best = costing.argmin_after_move(state, candidates, ctx)
+            self.assertEqual(
+                best, Costing(weights).argmin_after_move(
+                    state, candidates, ctx,
+                ),
+            )
+            scores = costing.score_many(state, candidates, ctx).tolist()
+            self.assertEqual(
+                scores,
+                Costing(weights).score_many(state, candidates, ctx).tolist(),
+            )
+            with mock.patch.object(
+                RlsItem, 'cost_if', side_effect=AssertionError,
+            ):
+                self.assertEqual(
+                    costing.score_many(state, candidates, ctx).tolist(),
+                    scores,
+                )
+            state.commit_move(candidates[best[0]])
+
+    def test_demand_cache_survives_pickling_and_rechunking(self):
+        # The cache is keyed by content, not by move object: after scoring
+        # the pool in two chunks, scoring an unpickled copy of the whole
+        # pool simulates nothing and matches a fresh Costing exactly.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        weights = _weights(
+            lateness=10.0, drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, runner_change=60.0, idle_time=10.0,
+            level_loading=3.0,
+        )
+        costing = Costing(weights)
+        for _ in range(3):
+            candidates = enumerate_candidates(state)
+            if len(candidates) < 2:
+                break
+            ctx = build_context(state, candidates)
+            half = len(candidates) // 2
+            costing.score_many(state, candidates[:half], ctx)
+            costing.score_many(state, candidates[half:], ctx)
+            copies = pickle.loads(pickle.dumps(candidates))
+            expected = Costing(weights).score_many(
+                state, candidates, ctx,
+            ).tolist()
+            with mock.patch.object(
+                RlsItem, 'cost_if', side_effect=AssertionError,
+            ):
+                self.assertEqual(
+                    costing.score_many(state, copies, ctx).tolist(),
+                    expected,
+                )
+            state.commit_move(candidates[expected.index(min(expected))])
+
+    # ----- 1.2.13 full-sum rounding -----
+
+    @staticmethod
+    def _full_sum(state: State, move: Move, w: CostWeights) -> float:
+        """The post-move score summed from scratch: every item's weighted
+        demand cost (`cost_if` for the touched ones), then every machine's
+        penalty (the affected one's summary merged with the plan's), in
+        `state` order. Cross-cutting weights are 0 in the caller."""
+        jobs_by_item: dict[str, list] = {}
+        for job in move.plan.jobs:
+            jobs_by_item.setdefault(job.item.id, []).append(job)
+        total = 0.0
+        for item_id, rls in state.rls_items.items():
+            if item_id in jobs_by_item:
+                cc = rls.cost_if(jobs_by_item[item_id])
+                q = (cc.lateness, cc.drainage, cc.carrying, cc.excess)
+            else:
+                q = (rls.raw_view.lateness, rls.safety_view.drainage,
+                     rls.safety_view.carrying, rls.safety_view.excess)
+            total += (w.lateness * q[0] + w.drainage * q[1]
+                      + w.carrying * q[2] + w.excess * q[3])
+        for machine_id, machine in state.machines.items():
+            s = machine.schedule_summary
+            if machine_id == move.machine_id:
+                s = s.merge(move.plan.summary)
+            total += (w.tape_out_single * s.tape_out_single
+                      + w.tape_out_both * s.tape_out_both
+                      + w.style_change * s.style_change
+                      + w.runner_change * s.runner_change
+                      + w.pattern_change * s.pattern_change
+                      + w.idle_time * s.idle_hours
+                      + w.waste_lbs * s.waste_lbs)
+        return total
+
+    def test_scores_round_as_the_full_sum(self):
+        # A lateness weight large enough that the baseline swamps the
+        # schedule terms: the candidates' full sums tie, and a delta added
+        # to the cached total would round them apart. Every score equals
+        # the from-scratch sum exactly, and the argmin is its first
+        # minimum.
+        rls_a = _make_rls_item(item=_ITEM_A, weekly=[300.0, 200.0, 200.0, 0.0])
+        rls_b = _make_rls_item(item=_ITEM_B, weekly=[200.0, 300.0, 0.0, 0.0])
+        state = _make_state(
+            machines={'M1': _make_machine('M1', init_item=_ITEM_A),
+                      'M2': _make_machine('M2', init_item=_ITEM_B)},
+            rls_items={_ITEM_A.id: rls_a, _ITEM_B.id: rls_b},
+            window_end=_START + timedelta(days=14),
+        )
+        weights = _weights(
+            lateness=1e16, drainage=1.0, carrying=2.0, excess=5.0,
+            tape_out_single=100.0, runner_change=60.0, idle_time=10.0,
+        )
+        costing = Costing(weights)
+        saw_tie = False
+        for _ in range(4):
+            candidates = enumerate_candidates(state)
+            if not candidates:
+                break
+            ctx = build_context(state, candidates)
+            expected = [self._full_sum(state, mv, weights)
+                        for mv in candidates]
+            saw_tie = saw_tie or expected.count(min(expected)) > 1
+            self.assertEqual(
+                [costing.score_after_move(state, mv, ctx)
+                 for mv in candidates],
+                expected,
+            )
+            self.assertEqual(
+                costing.score_many(state, candidates, ctx).tolist(),
+                expected,
+            )
+            best = expected.index(min(expected))
+            self.assertEqual(
+                costing.argmin_after_move(state, candidates, ctx),
+                (best, expected[best]),
+            )
+            state.commit_move(candidates[best])
+        self.assertTrue(saw_tie)
+
+    def test_argmin_after_move_rejects_empty(self):
+        state = _make_state()
+        ctx = ScoringContext(
+            priorities={}, regular_orders_by_key={},
+            earliest_dp_excluding={}, earliest_dp_time=_START,
+            new_machine_avail={},
+        )
+        with self.assertRaises(ValueError):
+            Costing(_weights()).argmin_after_move(state, [], ctx)
+
 # --- 1.2.7 Priority cost --------------------------------------------------
 
 class PriorityCostTests(unittest.TestCase):
@@ -981,6 +1344,48 @@ class PriorityCostTests(unittest.TestCase):
             self.costing._priority_cost(move, self.ctx), expected,
         )
 
+    def test_prefix_lookup_equals_scan(self):
+        # 1.2.7.5: with a priority_prefix on the context, each move's
+        # priority cost is read off it and equals the scan exactly —
+        # at a floor-binding fill-from time and at one past every due
+        # date. A move the prefix doesn't reach falls back to the scan.
+        moves = [
+            self._move(self.u_low_reg.item, self.u_low_reg.week_idx),
+            self._move(self.u_high_reg.item, self.u_high_reg.week_idx),
+            self._move(self.safety_order.item, week_idx=None),
+            self._move(self.future_reg.item, self.future_reg.week_idx),
+        ]
+        for other_dp in (_START, _START + timedelta(days=40)):
+            scan_ctx = dataclasses.replace(
+                self.ctx,
+                earliest_dp_excluding={'M1': other_dp, 'M2': other_dp},
+                earliest_dp_time=other_dp,
+            )
+            prefix = build_priority_prefix(
+                scan_ctx.priorities, scan_ctx.regular_orders_by_key,
+                {other_dp: 4},
+            )
+            self.assertEqual(prefix[other_dp][0], 0.0)
+            prefix_ctx = dataclasses.replace(
+                scan_ctx, priority_prefix=prefix,
+            )
+            for move in moves:
+                self.assertEqual(
+                    self.costing._priority_cost(move, prefix_ctx),
+                    self.costing._priority_cost(move, scan_ctx),
+                )
+
+            short_ctx = dataclasses.replace(
+                scan_ctx, priority_prefix=build_priority_prefix(
+                    scan_ctx.priorities, scan_ctx.regular_orders_by_key,
+                    {other_dp: 2},
+                ),
+            )
+            self.assertEqual(
+                self.costing._priority_cost(moves[3], short_ctx),
+                self.costing._priority_cost(moves[3], scan_ctx),
+            )
+
 
 # --- 1.3 Candidate enumeration --------------------------------------------
 
@@ -1415,6 +1820,53 @@ class CandidateEnumerationTests(unittest.TestCase):
                         order_id=f'S@{_ITEM_B.id}'),
         ])
 
+    def test_eligible_orders_reexamines_only_dirty_items(self):
+        # Picks are cached per item against its version and the reference
+        # week; a repeat call re-examines nothing, a register_jobs only its
+        # item, and a reference-week advance every item.
+        rls1 = RlsItem(
+            item=_ITEM_A, start_date=_START, on_hand_lbs=0.0,
+            lead_time=timedelta(0),
+            weekly_lbs_needed=[0.0, 0.0, 100.0, 0.0],
+        )
+        rls2 = RlsItem(
+            item=_ITEM_B, start_date=_START, on_hand_lbs=0.0,
+            lead_time=timedelta(0),
+            weekly_lbs_needed=[200.0, 0.0, 0.0, 0.0],
+        )
+        state = _make_state(machines={}, rls_items={
+            'AU0001': rls1, 'AU0002': rls2,
+        })
+        with mock.patch.object(
+            coordination_module, '_eligible_order',
+            wraps=coordination_module._eligible_order,
+        ) as pick:
+            first = eligible_orders(state)
+            self.assertEqual(pick.call_count, 2)
+            self.assertEqual(eligible_orders(state), first)
+            self.assertEqual(pick.call_count, 2)
+
+            rls2.register_jobs([
+                _job_rec(_ITEM_B, lbs=200.0, completion_time=_START),
+            ])
+            self._assert_orders_match(eligible_orders(state), [
+                first[0],
+                SafetyOrder(item=_ITEM_B, lbs=300.0,
+                            order_id=f'S@{_ITEM_B.id}'),
+            ])
+            self.assertEqual(pick.call_count, 3)
+
+            # Week 2 becomes urgent: item 1 swaps its safety order for it.
+            state.advance_reference_week()
+            self._assert_orders_match(eligible_orders(state), [
+                RegularOrder(item=_ITEM_A, week_idx=2,
+                             due_date=_START + timedelta(weeks=2),
+                             lbs=100.0, order_id=f'P2@{_ITEM_A.id}'),
+                SafetyOrder(item=_ITEM_B, lbs=300.0,
+                            order_id=f'S@{_ITEM_B.id}'),
+            ])
+            self.assertEqual(pick.call_count, 5)
+
     # ===================================================================
     # 1.3.3.1 enumerate_candidates filtering and idling correctness
     # ===================================================================
@@ -1833,6 +2285,95 @@ class CandidateEnumerationTests(unittest.TestCase):
         ))
 
 
+    # ===================================================================
+    # 1.3.4 CandidatePool
+    # ===================================================================
+
+    def _move_signature(self, mv):
+        """Everything a reused move must agree on with a freshly
+        enumerated one (activity ids aside)."""
+        return (
+            mv.machine_id, mv.item.id, mv.lbs, mv.start_at, mv.idle_for,
+            mv.week_idx, mv.order_remaining_lbs,
+            tuple((type(a).__name__, a.start, a.end)
+                  for a in mv.plan.activities),
+            tuple((j.item.id, j.tgt_order, j.total_lbs)
+                  for j in mv.plan.jobs),
+        )
+
+    def _pool_setup(self):
+        m1 = _make_machine('M1', init_item=_T1)
+        m2 = _make_machine('M2', init_item=_T2)
+        rls_t1 = RlsItem(
+            item=_T1, start_date=_START, on_hand_lbs=0.0,
+            lead_time=timedelta(0),
+            weekly_lbs_needed=[100.0, 200.0, 0.0, 0.0],
+        )
+        rls_t2 = RlsItem(
+            item=_T2, start_date=_START, on_hand_lbs=0.0,
+            lead_time=timedelta(0),
+            weekly_lbs_needed=[100.0, 0.0, 0.0, 0.0],
+        )
+        return _make_state(
+            machines={'M1': m1, 'M2': m2},
+            rls_items={_T1.id: rls_t1, _T2.id: rls_t2},
+            window_end=_START + timedelta(days=7),
+        )
+
+    def test_candidate_pool_matches_enumeration(self):
+        # 1. A fresh pool returns what enumerate_candidates returns, in the
+        #    same order.
+        state = self._pool_setup()
+        pool = CandidatePool()
+        self.assertEqual(
+            [self._move_signature(mv) for mv in pool.refresh(state)],
+            [self._move_signature(mv)
+             for mv in enumerate_candidates(state)],
+        )
+
+    def test_candidate_pool_reuses_untouched_pairings(self):
+        # 2./3. Commit M1's move for _T1 (fills _T1's week-0 order). M2's
+        #    pairing for _T2 is reused as the same object; everything on M1
+        #    and every _T1 pairing (its eligible order moved to week 1) is
+        #    re-planned. The refreshed list still matches enumeration.
+        state = self._pool_setup()
+        pool = CandidatePool()
+        before = pool.refresh(state)
+        m2_t2 = [mv for mv in before
+                 if mv.machine_id == 'M2' and mv.item.id == _T2.id]
+        self.assertEqual(len(m2_t2), 1)
+        chosen = next(mv for mv in before
+                      if mv.machine_id == 'M1' and mv.item.id == _T1.id)
+        state.commit_move(chosen)
+
+        after = pool.refresh(state)
+        self.assertEqual(
+            [self._move_signature(mv) for mv in after],
+            [self._move_signature(mv)
+             for mv in enumerate_candidates(state)],
+        )
+        self.assertTrue(any(mv is m2_t2[0] for mv in after))
+        for mv in after:
+            if mv.machine_id == 'M1' or mv.item.id == _T1.id:
+                self.assertFalse(any(mv is old for old in before))
+        self.assertTrue(all(mv.week_idx == 1 for mv in after
+                            if mv.item.id == _T1.id))
+
+    def test_candidate_pool_restricted_to_machines(self):
+        # 4. A pool over one machine returns exactly the full list's moves
+        #    on that machine, in order, before and after a commit.
+        state = self._pool_setup()
+        pools = {m: CandidatePool([m]) for m in ('M1', 'M2')}
+        for _ in range(2):
+            full = enumerate_candidates(state)
+            for machine_id, pool in pools.items():
+                self.assertEqual(
+                    [self._move_signature(mv) for mv in pool.refresh(state)],
+                    [self._move_signature(mv) for mv in full
+                     if mv.machine_id == machine_id],
+                )
+            state.commit_move(full[0])
+
 # --- 1.4 Main loop --------------------------------------------------------
 
 class MainLoopTests(unittest.TestCase):
@@ -2163,6 +2704,43 @@ class MainLoopTests(unittest.TestCase):
             state.window_end, horizon + state.window_advance_amount,
         )
 
+    def test_window_jumps_to_next_decision_point(self):
+        # M1's schedule runs ~10 days out; with window_end at _START the
+        # loop advances straight to the first step that admits M1's tail
+        # (one advance instead of one per day), capped at the horizon.
+        m = _big_beam_machine('M1', init_item=_T1)
+        long_plan = m.plan_production(_T1, 20_000.0, 'schedule_tail')
+        m.add_activities(long_plan.activities)
+        state = _make_state(
+            machines={'M1': m}, rls_items={_T1.id: RlsItem(
+                item=_T1, start_date=_START, on_hand_lbs=0.0,
+                lead_time=timedelta(0),
+                weekly_lbs_needed=[100.0, 100.0, 100.0, 100.0],
+            )},
+        )
+        tail = m.schedule_tail
+        self.assertGreater(tail, _START + timedelta(days=2))
+        self.assertEqual(next_decision_time(state), tail)
+
+        horizon = _compute_horizon(state)
+        steps = _window_steps(state, horizon)
+        self.assertEqual(steps, math.ceil((tail - _START) / timedelta(hours=24)))
+        state.advance_window(steps)
+        self.assertGreaterEqual(state.window_end, tail)
+        self.assertLess(state.window_end - timedelta(hours=24), tail)
+
+        # A nearer horizon caps the jump at the first step reaching it.
+        state.window_end = _START
+        self.assertEqual(
+            _window_steps(state, _START + timedelta(hours=30)), 2,
+        )
+        # With every decision point in the window, jump to the horizon.
+        state.window_end = m.next_runout
+        self.assertIsNone(next_decision_time(state))
+        self.assertEqual(
+            _window_steps(state, state.window_end + timedelta(hours=50)), 3,
+        )
+
     # ===================================================================
     # 1.4.5 PlanReport snapshot fidelity
     # ===================================================================
@@ -2256,6 +2834,324 @@ class MainLoopTests(unittest.TestCase):
             sum(report.rls_items[_T1.id].on_hand_coverage.values()), 0.0,
         )
 
+    # ===================================================================
+    # 1.4.6 Parallel scoring
+    # ===================================================================
+
+    def _parallel_scenario(self) -> State:
+        machines = {
+            'M1': _big_beam_machine('M1', init_item=_T1),
+            'M2': _big_beam_machine('M2', init_item=_T2),
+            'M3': _big_beam_machine('M3', init_item=_TC),
+        }
+        rls_items = {
+            item.id: RlsItem(
+                item=item, start_date=_START, on_hand_lbs=0.0,
+                lead_time=timedelta(0),
+                weekly_lbs_needed=[100.0, 300.0, 100.0, 200.0],
+            )
+            for item in (_T1, _T2, _TC)
+        }
+        return _make_state(machines=machines, rls_items=rls_items)
+
+    @staticmethod
+    def _schedule_signature(state: State) -> list[tuple]:
+        return [
+            (m_id, type(a).__name__, a.start, a.end, getattr(a, 'lbs', None))
+            for m_id, m in sorted(state.machines.items())
+            for a in m.activities
+        ]
+
+    def test_plan_with_workers_matches_serial(self):
+        weights = _weights(
+            lateness=10, drainage=1, carrying=1, excess=1,
+            tape_out_single=1, runner_change=1, idle_time=0.1,
+        )
+        serial = self._parallel_scenario()
+        serial_report = plan(serial, Costing(weights))
+        for workers in (2, 5):
+            with self.subTest(workers=workers):
+                state = self._parallel_scenario()
+                report = plan(state, Costing(weights), workers=workers)
+                self.assertEqual(
+                    self._schedule_signature(state),
+                    self._schedule_signature(serial),
+                )
+                self.assertEqual(report.total_score, serial_report.total_score)
+                self.assertEqual(
+                    report.unmet_lbs_by_item_week,
+                    serial_report.unmet_lbs_by_item_week,
+                )
+
+    def test_plan_with_workers_advancing_the_window(self):
+        # 5. A candidate threshold above any pool size makes the loop
+        #    advance the window before every iteration; the workers follow
+        #    it and the plan still matches serial.
+        weights = _weights(
+            lateness=10, drainage=1, carrying=1, excess=1,
+            tape_out_single=1, runner_change=1, idle_time=0.1,
+        )
+        serial = self._parallel_scenario()
+        serial.candidate_threshold = 1000
+        serial_report = plan(serial, Costing(weights))
+        state = self._parallel_scenario()
+        state.candidate_threshold = 1000
+        report = plan(state, Costing(weights), workers=2)
+        self.assertEqual(
+            self._schedule_signature(state),
+            self._schedule_signature(serial),
+        )
+        self.assertEqual(report.total_score, serial_report.total_score)
+
+    def test_plan_with_workers_mints_unique_ids(self):
+        # 6. Worker processes build moves with their own id counters; the
+        #    committed schedule still has unique ids, minted by this
+        #    process, and the same activities and jobs as the serial run.
+        weights = _weights(
+            lateness=10, drainage=1, carrying=1, excess=1,
+            tape_out_single=1, runner_change=1, idle_time=0.1,
+        )
+        serial = self._parallel_scenario()
+        plan(serial, Costing(weights))
+        state = self._parallel_scenario()
+        plan(state, Costing(weights), workers=2)
+
+        def ids(s: State) -> tuple[list[str], list[str]]:
+            return (
+                [a.id for m in s.machines.values() for a in m.activities],
+                [j.id for m in s.machines.values() for j in m.jobs],
+            )
+
+        def jobs(s: State) -> list[tuple]:
+            return [
+                (m_id, j.item.id, j.tgt_order,
+                 [(r.lbs, r.completion_time, len(r.knits)) for r in j.rolls])
+                for m_id, m in sorted(s.machines.items()) for j in m.jobs
+            ]
+
+        activity_ids, job_ids = ids(state)
+        self.assertEqual(len(set(activity_ids)), len(activity_ids))
+        self.assertEqual(len(set(job_ids)), len(job_ids))
+        self.assertEqual(
+            [len(x) for x in ids(state)], [len(x) for x in ids(serial)],
+        )
+        self.assertEqual(
+            self._schedule_signature(state), self._schedule_signature(serial),
+        )
+        self.assertEqual(jobs(state), jobs(serial))
+        # Every id is at or below the counter this process saves.
+        counters = id_counters()
+        for id_ in activity_ids + job_ids:
+            prefix = id_.rstrip('0123456789')
+            self.assertLessEqual(int(id_[len(prefix):]), counters[prefix])
+
+    def test_plan_rejects_negative_workers(self):
+        with self.assertRaises(ValueError):
+            plan(self._parallel_scenario(), Costing(_weights()), workers=-1)
+
+    def test_plan_with_threads_matches_serial(self):
+        weights = _weights(
+            lateness=10, drainage=1, carrying=1, excess=1,
+            tape_out_single=1, runner_change=1, idle_time=0.1,
+        )
+        serial = self._parallel_scenario()
+        serial_report = plan(serial, Costing(weights))
+        for workers in (2, 5):
+            with self.subTest(workers=workers):
+                state = self._parallel_scenario()
+                report = plan(
+                    state, Costing(weights),
+                    workers=workers, worker_mode='thread',
+                )
+                self.assertEqual(
+                    self._schedule_signature(state),
+                    self._schedule_signature(serial),
+                )
+                self.assertEqual(report.total_score, serial_report.total_score)
+                self.assertEqual(
+                    report.unmet_lbs_by_item_week,
+                    serial_report.unmet_lbs_by_item_week,
+                )
+
+    def test_plan_rejects_unknown_worker_mode(self):
+        with self.assertRaises(ValueError):
+            plan(
+                self._parallel_scenario(), Costing(_weights()),
+                workers=2, worker_mode='fiber',
+            )
+
+    # ===================================================================
+    # 1.4.7 Checkpoint and resume
+    # ===================================================================
+
+    _GREIGE_BY_ID = {item.id: item for item in (_T1, _T2, _TC)}
+
+    def _checkpointed_run(self, path: str) -> tuple[State, PlanReport]:
+        state = self._parallel_scenario()
+        with Checkpoint.create(path, state, every_moves=1) as ckpt:
+            report = plan(state, Costing(_weights(lateness=10)), checkpoint=ckpt)
+        return state, report
+
+    def test_resume_continues_to_the_same_plan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            full_path = os.path.join(tmp, 'full.ckpt')
+            full, full_report = self._checkpointed_run(full_path)
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            self.assertGreater(len(full.machines['M1'].activities), 0)
+
+            # Cut the log mid-record: the partial record is dropped.
+            cut_path = os.path.join(tmp, 'cut.ckpt')
+            with open(cut_path, 'wb') as f:
+                f.write(data[:len(data) // 2])
+            state = self._parallel_scenario()
+            ckpt = Checkpoint.resume(cut_path, state, self._GREIGE_BY_ID)
+            with ckpt:
+                replayed = ckpt.move_count
+                self.assertGreater(replayed, 0)
+                # The logged moves are back, ids and all.
+                for m_id, m in state.machines.items():
+                    n = len(m.activities)
+                    self.assertEqual(
+                        [a.id for a in m.activities],
+                        [a.id for a in full.machines[m_id].activities[:n]],
+                    )
+                report = plan(
+                    state, Costing(_weights(lateness=10)), checkpoint=ckpt,
+                )
+                total_moves = ckpt.move_count
+
+            self.assertEqual(
+                self._schedule_signature(state),
+                self._schedule_signature(full),
+            )
+            self.assertEqual(report.total_score, full_report.total_score)
+            self.assertEqual(state.window_end, full.window_end)
+
+            # The resumed run kept appending to the (repaired) log.
+            again = self._parallel_scenario()
+            with Checkpoint.resume(
+                cut_path, again, self._GREIGE_BY_ID,
+            ) as ckpt:
+                self.assertEqual(ckpt.move_count, total_moves)
+            self.assertEqual(
+                self._schedule_signature(again),
+                self._schedule_signature(full),
+            )
+
+    @staticmethod
+    def _record_spans(data: bytes) -> list[tuple[int, int]]:
+        """`(start, end)` byte offsets of each framed record after the
+        header: an 8-byte little-endian length, then the pickle."""
+        f = io.BytesIO(data)
+        pickle.load(f)
+        spans = []
+        while f.tell() < len(data):
+            start = f.tell()
+            (size,) = struct.unpack('<Q', f.read(8))
+            f.seek(size, 1)
+            spans.append((start, f.tell()))
+        return spans
+
+    def test_resume_drops_a_torn_final_record(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.ckpt')
+            self._checkpointed_run(path)
+            with open(path, 'rb') as f:
+                data = f.read()
+            spans = self._record_spans(data)
+            self.assertGreater(len(spans), 1)
+            last_start, last_end = spans[-1]
+            kept = data[:last_start]
+            with Checkpoint.resume(
+                path, self._parallel_scenario(), self._GREIGE_BY_ID,
+            ) as ckpt:
+                total_moves = ckpt.move_count
+
+            # A pickle that would raise AttributeError, not EOFError or
+            # UnpicklingError, were it unpickled: a global that isn't there.
+            bad = b'\x80\x04cbuiltins\nno_such_name\n.'
+            tails = [data[last_start:cut] for cut in (
+                last_start + 3, last_start + 8, last_start + 9,
+                (last_start + last_end) // 2, last_end - 1,
+            )] + [struct.pack('<Q', len(bad) + 10) + bad]
+            cut_path = os.path.join(tmp, 'cut.ckpt')
+            for tail in tails:
+                with self.subTest(tail_len=len(tail)):
+                    with open(cut_path, 'wb') as f:
+                        f.write(kept + tail)
+                    with Checkpoint.resume(
+                        cut_path, self._parallel_scenario(),
+                        self._GREIGE_BY_ID,
+                    ) as ckpt:
+                        self.assertLess(ckpt.move_count, total_moves)
+                        self.assertGreater(ckpt.move_count, 0)
+                    with open(cut_path, 'rb') as f:
+                        self.assertEqual(f.read(), kept)
+
+    def test_resume_rejects_a_corrupt_complete_record(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.ckpt')
+            self._checkpointed_run(path)
+            with open(path, 'rb') as f:
+                data = f.read()
+            start, end = self._record_spans(data)[0]
+            bad = b'\x80\x04cbuiltins\nno_such_name\n.'
+            with open(path, 'wb') as f:
+                f.write(data[:start] + struct.pack('<Q', len(bad)) + bad
+                        + data[end:])
+            with self.assertRaises(ValueError):
+                Checkpoint.resume(
+                    path, self._parallel_scenario(), self._GREIGE_BY_ID,
+                )
+
+    def test_resume_rejects_different_inputs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.ckpt')
+            self._checkpointed_run(path)
+            state = self._parallel_scenario()
+            del state.machines['M3']
+            with self.assertRaises(ValueError):
+                Checkpoint.resume(path, state, self._GREIGE_BY_ID)
+
+    def test_create_refuses_existing_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'run.ckpt')
+            self._checkpointed_run(path)
+            with self.assertRaises(FileExistsError):
+                Checkpoint.create(path, self._parallel_scenario())
+
+    # ===================================================================
+    # 1.4.8 Phase timing
+    # ===================================================================
+
+    def test_plan_times_each_loop_phase(self):
+        state = self._parallel_scenario()
+        timer = PhaseTimer()
+        plan(state, Costing(_weights(lateness=10)), timer=timer)
+        stats = timer.stats
+
+        commits = stats['commit'].count
+        self.assertGreater(commits, 0)
+        self.assertEqual(stats['score'].count, commits)
+        self.assertEqual(stats['context'].count, commits)
+        self.assertEqual(stats['register_jobs'].count, commits)
+        # One enumeration per iteration plus the final, empty one.
+        self.assertGreaterEqual(stats['enumerate'].count, commits + 1)
+        self.assertEqual(stats['report'].count, 1)
+        # register_jobs runs inside commit.
+        self.assertLessEqual(
+            stats['register_jobs'].total_ns, stats['commit'].total_ns,
+        )
+        for name, s in stats.items():
+            with self.subTest(phase=name):
+                self.assertEqual(sum(s.histogram.values()), s.count)
+                self.assertLessEqual(s.min_ns, s.max_ns)
+
+        dumped = json.loads(json.dumps(timer.to_dict()))
+        self.assertEqual(set(dumped['phases']), set(stats))
+        self.assertEqual(dumped['phases']['commit']['count'], commits)
+
 
 if __name__ == '__main__':
     unittest.main()
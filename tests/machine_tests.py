@@ -1,11 +1,15 @@
 #!/usr/bin/env python
 
+import pickle
+import random
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta
 
 from swmtplanner.products import Greige, BeamSet
 from swmtplanner.schedule import (
-    Machine, Status, Knit, Job, Roll, Waste, Doff, TapeOut,
+    ScheduleSummary,
+    Machine, ProductionPlan, Status, Knit, Job, Roll, Waste, Doff, TapeOut,
     Hanging, Threading, StyleChange, RunnerChange, PatternChange, Idle,
     TAPE_OUT_SINGLE_DURATION, TAPE_OUT_BOTH_DURATION,
     HANGING_SINGLE_DURATION, HANGING_BOTH_DURATION,
@@ -15,6 +19,7 @@ from swmtplanner.schedule import (
 )
 from swmtplanner.schedule.activity import BEAM_FLOOR_LBS
 from swmtplanner.support import WorkCal
+from swmtplanner.support.workcal import FixedDate, FlexDate
 
 
 # --- Fixtures -----------------------------------------------------------
@@ -25,6 +30,14 @@ _24_7 = WorkCal(work_days=(0, 1, 2, 3, 4, 5, 6),
                 day_start=0, day_end=24, holidays=())
 _WEEKDAY_9H = WorkCal(work_days=(0, 1, 2, 3, 4),
                       day_start=8, day_end=17, holidays=())
+# Weekday workcal with holidays inside the engine tests' windows (4.7):
+# a fixed Wednesday, the last Monday of May, and a mid-June Friday.
+_WEEKDAY_HOLIDAYS = WorkCal(
+    work_days=(0, 1, 2, 3, 4), day_start=8, day_end=17,
+    holidays=[FixedDate('mid-week', 5, 20),
+              FlexDate('memorial', 5, 0, -1),
+              FixedDate('june', 6, 12)],
+)
 
 # Synthetic greiges chosen so all status arithmetic is exact under floats.
 # Item A: family A, rate 100 lbs/h on M1, top_pct=0.4 / btm_pct=0.6.
@@ -720,6 +733,146 @@ class AddActivitiesSequencingTests(unittest.TestCase):
         self.assertTrue(s.threaded('top'))
 
 
+    # ----- 1.6.4 version counter -----
+
+    def test_version_bumps_on_each_mutation(self):
+        # add_activities and add_jobs each bump `version` once per call;
+        # reads (activities, current_status, plan_production) don't.
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        self.assertEqual(m.version, 0)
+        m.plan_production(_ITEM_A, lbs=100.0, start_at='schedule_tail')
+        _ = m.activities, m.current_status, m.next_runout
+        self.assertEqual(m.version, 0)
+        m.add_activities([
+            Idle(start=_START, end=_START + timedelta(hours=1)),
+            Idle(start=_START + timedelta(hours=1),
+                 end=_START + timedelta(hours=2)),
+        ])
+        self.assertEqual(m.version, 1)
+        m.add_jobs([])
+        self.assertEqual(m.version, 2)
+
+    # ----- 1.6.5 record layout -----
+
+    def test_records_are_slotted_with_cached_aggregates(self):
+        # Job, Roll and every Activity keep no instance __dict__; a Job's
+        # total_lbs / completion_time are its rolls', and survive pickling.
+        t0 = _START
+        t1 = t0 + timedelta(hours=1)
+        knit = Knit(start=t0, end=t1, item=_ITEM_A, lbs=60.0)
+        rolls = (Roll(lbs=60.0, completion_time=t1, knits=(knit,)),
+                 Roll(lbs=40.5, completion_time=t1 + timedelta(hours=1)))
+        job = Job(item=_ITEM_A, rolls=rolls, tgt_order='P0@AU0001')
+        records = [
+            knit, *rolls, job, Doff(start=t1, end=t1),
+            Waste(start=t0, end=t0, beam=_TOP_BEAM, bar='top', lbs=10.0),
+            TapeOut(start=t0, end=t1, bars='both'),
+            Hanging(start=t0, end=t1, bars='top', top_beam=_TOP_BEAM),
+            Threading(start=t0, end=t1, bars='top'),
+            StyleChange(start=t0, end=t1, from_item=_ITEM_A, to_item=_ITEM_A),
+            Idle(start=t0, end=t1),
+        ]
+        for record in records:
+            with self.subTest(record=type(record).__name__):
+                self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(job.total_lbs, 100.5)
+        self.assertEqual(job.total_rolls, 2)
+        self.assertEqual(job.completion_time, t1 + timedelta(hours=1))
+        self.assertIsNone(Job(item=_ITEM_A).completion_time)
+        self.assertEqual(Job(item=_ITEM_A).total_lbs, 0)
+        copy = pickle.loads(pickle.dumps(job))
+        self.assertEqual(copy, job)
+        self.assertEqual((copy.id, copy.total_lbs, copy.completion_time),
+                         (job.id, job.total_lbs, job.completion_time))
+
+    # ----- 1.7 schedule_summary -----
+
+    def test_schedule_summary_rolls_forward_with_add_activities(self):
+        # Two batches: the running summary equals the summary of the whole
+        # history, and counts each penalized type once.
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        self.assertEqual(m.schedule_summary, ScheduleSummary())
+        t0 = _START
+        t1 = t0 + timedelta(hours=2)
+        t2 = t1 + timedelta(hours=1)
+        t3 = t2 + timedelta(hours=3)
+        m.add_activities([
+            Idle(start=t0, end=t1),
+            Waste(start=t1, end=t1, beam=_TOP_BEAM, bar='top', lbs=195.0),
+            TapeOut(start=t1, end=t2, bars='btm'),
+        ])
+        m.add_activities([
+            Hanging(start=t2, end=t3, bars='both',
+                    top_beam=_ALT_TOP_BEAM, top_lbs=500.0,
+                    btm_beam=_BTM_BEAM, btm_lbs=500.0),
+        ])
+        self.assertEqual(m.schedule_summary, ScheduleSummary(
+            tape_out_single=1, idle_hours=2.0, waste_lbs=195.0,
+        ))
+        self.assertEqual(m.schedule_summary,
+                         ScheduleSummary.of(m.activities, m.workcal))
+
+    def test_plan_production_attaches_summary(self):
+        # The plan's summary is the summary of its own activities, and
+        # merging it onto the machine's matches the committed result.
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        plan = m.plan_production(_ITEM_A, lbs=800.0,
+                                 start_at='schedule_tail',
+                                 idle_for=timedelta(hours=3))
+        self.assertEqual(plan.summary,
+                         ScheduleSummary.of(plan.activities, m.workcal))
+        expected = m.schedule_summary.merge(plan.summary)
+        m.add_activities(plan.activities)
+        self.assertEqual(m.schedule_summary, expected)
+
+# --- 1.8 Version-keyed caches ------------------------------------------
+
+class DerivedCacheTests(unittest.TestCase):
+
+    def test_derived_quantities_are_cached_per_version(self):
+        m = _make_machine(init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        week_end = _START + timedelta(days=7)
+        with mock.patch.object(
+            Machine, '_producible_lbs_by_arithmetic', autospec=True,
+            side_effect=Machine._producible_lbs_by_arithmetic,
+        ) as engine:
+            cap = m.producible_lbs_through(_ITEM_B, week_end)
+            self.assertEqual(m.producible_lbs_through(_ITEM_B, week_end), cap)
+            self.assertEqual(engine.call_count, 1)
+            runout = m.next_runout
+            self.assertIs(m.activities, m.activities)
+            self.assertIs(m.jobs, m.jobs)
+
+            plan = m.plan_production(_ITEM_C, lbs=300.0,
+                                     start_at='schedule_tail')
+            version = m.version
+            m.add_activities(plan.activities)
+            self.assertEqual(m.version, version + 1)
+            self.assertEqual(m.activities, plan.activities)
+            self.assertNotEqual(m.next_runout, runout)
+            m.producible_lbs_through(_ITEM_B, week_end)
+            self.assertEqual(engine.call_count, 2)
+
+            m.add_jobs(plan.jobs)
+            self.assertEqual(m.jobs, plan.jobs)
+            m.producible_lbs_through(_ITEM_B, week_end)
+            self.assertEqual(engine.call_count, 3)
+
+    def test_cache_is_bounded_within_a_version(self):
+        m = _make_machine(init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        ends = [_START + timedelta(hours=10 + i) for i in range(20)]
+        expected = [m.producible_lbs_through(_ITEM_B, end) for end in ends]
+        fresh = _make_machine(init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        with mock.patch('swmtplanner.schedule.machine.machine.'
+                        '_DERIVED_CACHE_SIZE', 8):
+            for _ in range(3):
+                got = [fresh.producible_lbs_through(_ITEM_B, end)
+                       for end in ends]
+                self.assertEqual(got, expected)
+                self.assertLessEqual(len(fresh._cache), 8)
+        self.assertEqual(fresh.version, 0)
+
+
 # --- 1.4 status_at ------------------------------------------------------
 
 class StatusAtTests(unittest.TestCase):
@@ -798,6 +951,19 @@ class StatusAtTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             m.status_at(_START - timedelta(hours=1))
 
+    def test_checkpointed_lookup_matches_full_replay(self):
+        # Long enough to span several checkpoints; sampled at every
+        # activity's start, midpoint and end (Waste is zero-length).
+        m = _make_machine(init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        for item in (_ITEM_C, _ITEM_A, _ITEM_C):
+            plan = m.plan_production(item, lbs=3000.0,
+                                     start_at='schedule_tail')
+            m.add_activities(plan.activities)
+        self.assertGreater(len(m.activities), 100)
+        for a in m.activities:
+            for t in (a.start, a.start + (a.end - a.start) / 2, a.end):
+                self.assertEqual(m.status_at(t), m._status_at_by_walk(t))
+
 
 # --- 1.5 next_runout ----------------------------------------------------
 
@@ -1470,6 +1636,70 @@ class PlanProductionPurityTests(unittest.TestCase):
         # add_jobs committed exactly the plan's Job records.
         self.assertEqual(m_plan.jobs, plan.jobs)
 
+    def test_activities_are_built_on_first_read(self):
+        # Jobs and summary are there up front; the activities are built once,
+        # on first read, and the rolls' knits are among them.
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        plan = m.plan_production(_ITEM_B, lbs=200.0, start_at='next_runout')
+        self.assertFalse(plan.materialized)
+        self.assertTrue(plan.jobs)
+        self.assertIsNotNone(plan.summary)
+        self.assertFalse(plan.materialized)
+
+        twin = pickle.loads(pickle.dumps(plan))
+        activities = plan.activities
+        self.assertTrue(plan.materialized)
+        self.assertIs(plan.activities, activities)
+        self.assertEqual(_shape(twin), _shape(plan))
+        for job in plan.jobs:
+            for roll in job.rolls:
+                for knit in roll.knits:
+                    self.assertTrue(any(a is knit for a in activities))
+
+    def test_plans_compare_by_value(self):
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        plan = m.plan_production(_ITEM_B, lbs=200.0, start_at='next_runout')
+        # A second call builds the same shape with fresh ids; comparing
+        # builds the lazy plans' activities.
+        other = m.plan_production(_ITEM_B, lbs=200.0, start_at='next_runout')
+        self.assertFalse(plan.materialized)
+        self.assertNotEqual(other, plan)
+        self.assertTrue(plan.materialized)
+        self.assertTrue(other.materialized)
+        twin = pickle.loads(pickle.dumps(plan))
+        self.assertIsNot(twin, plan)
+        self.assertEqual(twin, plan)
+        self.assertEqual(hash(twin), hash(plan))
+        self.assertEqual(
+            ProductionPlan(plan.activities, plan.jobs, plan.summary), plan,
+        )
+        self.assertNotEqual(
+            ProductionPlan(plan.activities, plan.jobs, None), plan,
+        )
+        self.assertNotEqual(plan, (plan.activities, plan.jobs, plan.summary))
+
+    def test_with_fresh_ids_rebuilds_with_new_ids(self):
+        m = _make_machine(init_top_lbs=200.0, init_btm_lbs=300.0)
+        plan = m.plan_production(_ITEM_B, lbs=200.0, start_at='next_runout')
+        fresh = plan.with_fresh_ids()
+        self.assertEqual(_shape(fresh), _shape(plan))
+        self.assertIs(fresh.summary, plan.summary)
+        old_ids = {a.id for a in plan.activities} | {j.id for j in plan.jobs}
+        new_ids = {a.id for a in fresh.activities} | {j.id for j in fresh.jobs}
+        self.assertFalse(old_ids & new_ids)
+        self.assertEqual(len(fresh.jobs), len(plan.jobs))
+        for job, old in zip(fresh.jobs, plan.jobs):
+            self.assertEqual(job.tgt_order, old.tgt_order)
+            self.assertEqual(
+                [(r.lbs, r.completion_time) for r in job.rolls],
+                [(r.lbs, r.completion_time) for r in old.rolls],
+            )
+            for roll in job.rolls:
+                for knit in roll.knits:
+                    self.assertTrue(
+                        any(a is knit for a in fresh.activities),
+                    )
+
 
 # --- 2.6 Timing ---------------------------------------------------------
 
@@ -1602,6 +1832,39 @@ class PlanProductionIdleForTests(unittest.TestCase):
             m.plan_production(_ITEM_A, lbs=100.0, start_at='schedule_tail',
                               idle_for=timedelta(hours=-1))
 
+    def test_new_idle_for_reanchors_the_cached_walk(self):
+        # A second plan that differs only in `idle_for` reuses the first
+        # one's walk, shifted in time, and matches a plan made from scratch
+        # to the microsecond — across nights and a weekend.
+        def timeline(plan):
+            return ([(type(a).__name__, a.start, a.end)
+                     for a in plan.activities],
+                    [[r.completion_time for r in job.rolls]
+                     for job in plan.jobs])
+
+        m = _make_machine(workcal=_WEEKDAY_9H,
+                          init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        first = m.plan_production(_ITEM_C, lbs=1500.0,
+                                  start_at='schedule_tail', tgt_order='O1')
+        with mock.patch.object(Machine, '_plan_walk',
+                               side_effect=AssertionError('re-walked')):
+            moved = m.plan_production(_ITEM_C, lbs=1500.0,
+                                      start_at='schedule_tail',
+                                      idle_for=timedelta(hours=31.5),
+                                      tgt_order='O2')
+        fresh = _make_machine(workcal=_WEEKDAY_9H,
+                              init_top_lbs=2800.0, init_btm_lbs=1800.0)
+        expected = fresh.plan_production(_ITEM_C, lbs=1500.0,
+                                         start_at='schedule_tail',
+                                         idle_for=timedelta(hours=31.5),
+                                         tgt_order='O2')
+        self.assertEqual(timeline(moved), timeline(expected))
+        self.assertEqual(moved.summary, expected.summary)
+        self.assertEqual(moved.jobs[0].tgt_order, 'O2')
+        self.assertNotEqual(timeline(moved)[0][1:], timeline(first)[0])
+        self.assertIsNot(moved.jobs[0].rolls[0].knits[0],
+                         first.jobs[0].rolls[0].knits[0])
+
 
 # ---------------------------- PHASE 3 -----------------------------------
 
@@ -2207,5 +2470,67 @@ class ProducibleLbsStartParameterTests(unittest.TestCase):
                                       start=_W21_START - timedelta(hours=1))
 
 
+# --- 4.7 Arithmetic engine vs. the activity walk -----------------------
+
+class ProducibleLbsEngineTests(unittest.TestCase):
+
+    def test_matches_activity_walk_on_random_windows(self):
+        # producible_lbs_through computes capacity arithmetically; the
+        # reference activity walk must agree on every scenario: mixed beams
+        # (keep / tape / waste / load preambles), new vs legacy machines,
+        # runner and pattern changeovers, workcals with weekends and
+        # holidays, machines part-way through a committed plan, and
+        # windows of varied start and length — including the candidate
+        # cap's window to the end of the ISO week and its one-week
+        # bump-up.
+        rng = random.Random(20260518)
+        beams = [(_TOP_BEAM, _BTM_BEAM), (_ALT_TOP_BEAM, _BTM_BEAM),
+                 (_TOP_BEAM, _ALT_BTM_BEAM), (_ALT_TOP_BEAM, _ALT_BTM_BEAM)]
+        for case in range(60):
+            top_beam, btm_beam = rng.choice(beams)
+            m = _make_machine(
+                init_item=rng.choice([_ITEM_A, _ITEM_B, _ITEM_C]),
+                init_top_lbs=rng.choice([0.0, 150.0, 600.0, 2800.0]),
+                init_btm_lbs=rng.choice([0.0, 250.0, 900.0, 1800.0]),
+                init_top_beam=top_beam, init_btm_beam=btm_beam,
+                workcal=rng.choice([_24_7, _WEEKDAY_9H, _WEEKDAY_HOLIDAYS]),
+                start=_START + timedelta(hours=rng.uniform(0, 72)),
+                is_new=rng.random() < 0.5,
+            )
+            if rng.random() < 0.5:
+                item = rng.choice([_ITEM_A, _ITEM_C])
+                plan = m.plan_production(
+                    item, lbs=item.tgt_wt * rng.randint(1, 30),
+                    start_at='schedule_tail',
+                )
+                m.add_activities(plan.activities)
+                m.add_jobs(plan.jobs)
+            as_of = m.current_status.as_of
+            for item in (_ITEM_A, _ITEM_B, _ITEM_C):
+                start = as_of + timedelta(hours=rng.uniform(0, 100))
+                monday = start.date() - timedelta(days=start.weekday())
+                week_end = datetime.combine(monday, datetime.min.time()) \
+                    + timedelta(days=7)
+                ends = (start + timedelta(hours=rng.uniform(1, 400)),
+                        week_end, week_end + timedelta(days=7))
+                for end in ends:
+                    with self.subTest(case=case, item=item.id, end=end):
+                        self.assertEqual(
+                            m.producible_lbs_through(item, end, start),
+                            m._producible_lbs_by_walk(item, end, start),
+                        )
+
+    def test_shifted_workcal_uses_activity_walk(self):
+        shifted = WorkCal(work_days=(0, 1, 2, 3, 4),
+                          day_start=8, day_end=17, holidays=(), cal_shift=2)
+        m = _make_machine(init_top_lbs=2800.0, init_btm_lbs=1800.0,
+                          workcal=shifted, start=_W21_START)
+        end = _W21_START + timedelta(days=3)
+        self.assertEqual(
+            m.producible_lbs_through(_ITEM_C, end),
+            m._producible_lbs_by_walk(_ITEM_C, end, _W21_START),
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
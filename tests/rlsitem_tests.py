@@ -2,6 +2,8 @@
 
 import json
 import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -509,5 +511,134 @@ class RlsItemBatchTests(unittest.TestCase):
         self.assertEqual(self._components(rls), before)
 
 
+    def test_version_bumps_on_register_jobs_only(self):
+        # register_jobs bumps `version` once per call (even an empty batch,
+        # which still re-runs the views); cost_if leaves it unchanged.
+        item = _GREIGES['AU2958G']
+        rls = self._fresh_rls()
+        self.assertEqual(rls.version, 0)
+        rls.cost_if([_real_job(item, _due(0) + timedelta(days=1), 100)])
+        self.assertEqual(rls.version, 0)
+        rls.register_jobs([_real_job(item, _due(1) + timedelta(days=1), 200)])
+        self.assertEqual(rls.version, 1)
+        rls.register_jobs([])
+        self.assertEqual(rls.version, 2)
+
+    def test_cost_if_never_recomputes_the_views(self):
+        # cost_if simulates on scratch state: neither view's recompute runs,
+        # and the fill links are left as they were.
+        item = _GREIGES['AU2958G']
+        rls = self._fresh_rls()
+        rls.register_jobs([_real_job(item, _due(0) + timedelta(days=1), 100)])
+        links = rls.safety_view.roll_order_links
+
+        def refuse(*args, **kwargs):
+            raise AssertionError('cost_if called recompute')
+        for view in (rls.raw_view, rls.safety_view):
+            view.recompute = refuse
+        cost = rls.cost_if([
+            _real_job(item, _due(1) + timedelta(days=1), 200),
+            _real_job(item, _due(2) - timedelta(days=1), 350),
+        ])
+
+        self.assertGreater(cost.lateness, 0.0)
+        self.assertEqual(rls.safety_view.roll_order_links, links)
+
+    def test_cost_if_many_matches_registering_each_batch(self):
+        # Each hypothetical of cost_if_many is priced as if registered on
+        # top of the committed jobs, wherever its rolls land among them.
+        item = _GREIGES['AU2958G']
+        committed = [
+            _real_job(item, _due(w) + timedelta(hours=h), 90)
+            for w in range(4) for h in (-20, 5)
+        ]
+        rls = self._fresh_rls()
+        rls.register_jobs(committed)
+        batches = [
+            [_real_job(item, _due(w % 4) + timedelta(hours=h), 40 + 15 * h)]
+            for w in range(5) for h in range(-24, 24, 5)
+        ] + [
+            [_real_job(item, _due(0) + timedelta(hours=5), 60),
+             _real_job(item, _due(2) - timedelta(hours=20), 120)],
+            [_real_job(item, _due(1), 75)],
+            [],
+        ]
+        expected = []
+        for batch in batches:
+            fresh = self._fresh_rls()
+            fresh.register_jobs(committed + batch)
+            expected.append(self._components(fresh))
+        self.assertEqual(rls.cost_if_many(batches), expected)
+
+    def test_cost_if_skips_unwanted_views(self):
+        # raw=False / safety=False skip that view's simulation and report
+        # its components as 0; the other view's are unchanged.
+        item = _GREIGES['AU2958G']
+        rls = self._fresh_rls()
+        rls.register_jobs([_real_job(item, _due(0) - timedelta(hours=20), 90)])
+        batch = [_real_job(item, _due(1) + timedelta(hours=5), 120)]
+        full = rls.cost_if(batch)
+
+        with mock.patch.object(
+            type(rls.raw_view), 'simulate', side_effect=AssertionError,
+        ):
+            self.assertEqual(
+                rls.cost_if_many([batch], raw=False),
+                [CostComponents(
+                    0.0, full.drainage, full.carrying, full.excess,
+                )],
+            )
+        with mock.patch.object(
+            type(rls.safety_view), 'simulate', side_effect=AssertionError,
+        ):
+            self.assertEqual(
+                rls.cost_if(batch, safety=False),
+                CostComponents(full.lateness, 0.0, 0.0, 0.0),
+            )
+
+    def test_cost_if_from_threads_matches_serial(self):
+        # Many threads pricing different hypotheticals against one item at
+        # once get the serial answers.
+        item = _GREIGES['AU2958G']
+        rls = self._fresh_rls()
+        rls.register_jobs([_real_job(item, _due(1) + timedelta(days=1), 250)])
+        batches = [
+            [_real_job(item, _due(w % 4) + timedelta(hours=h), 50 + 25 * h)]
+            for w in range(8) for h in range(-30, 30, 7)
+        ]
+        serial = [rls.cost_if(b) for b in batches]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            threaded = list(ex.map(rls.cost_if, batches))
+        self.assertEqual(threaded, serial)
+
+
+class RlsItemAggregateTests(unittest.TestCase):
+    # The job / safety-view aggregates are refreshed by register_jobs, not
+    # re-summed on read; they must match a re-sum after every update.
+
+    def _assert_aggregates(self, rls: RlsItem) -> None:
+        view = rls.safety_view
+        self.assertEqual(rls.scheduled_lbs,
+                         sum(j.total_lbs for j in rls.jobs))
+        self.assertEqual(rls.total_demand_lbs,
+                         sum(w.qty_lbs for w in rls.weekly_demand))
+        self.assertEqual(
+            rls.replenishment_need_lbs,
+            sum(o.remaining_lbs for o in view.orders)
+            + max(0.0, view.safety_target - view.safety_pool),
+        )
+        unmet = [o for o in view.orders if o.remaining_lbs > 0]
+        self.assertIs(rls.first_unmet_order, unmet[0] if unmet else None)
+
+    def test_aggregates_track_register_jobs(self):
+        item = _GREIGES['AU2958G']
+        rls = _make_rls_item([100, 200, 150, 300], on_hand_lbs=50.0)
+        self._assert_aggregates(rls)
+        self.assertEqual(rls.first_unmet_order.week.week_idx, 0)
+        for week, lbs in [(1, 120.5), (0, 60), (3, 400), (2, 5000)]:
+            rls.register_jobs([_real_job(item, _due(week), lbs)])
+            self._assert_aggregates(rls)
+        self.assertIsNone(rls.first_unmet_order)
+
 if __name__ == '__main__':
     unittest.main()
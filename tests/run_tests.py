@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 """Coverage of the `run.py` CLI helpers added for verbose-mode persistence —
-the `database`-block override resolution and the interactive `vi` notes flow.
+the `database`-block override resolution and the interactive `vi` notes flow —
+and of the checkpoint-flag validation.
 See `tests/spec-files/RUN_TEST_SPEC.md`. The full `run()` invocation and the
 DB-touching `_persist_debuglog` are covered elsewhere (manual CLI runs;
 `dashboard_tests.py`'s MySQL-gated wiring tests)."""
@@ -104,5 +105,32 @@ class GatherNotesTests(_ChdirTmp):
         self.assertEqual(list(Path('.').glob('temp*.txt')), [])
 
 
+class ValidateCheckpointFlagsTests(unittest.TestCase):
+
+    def test_accepts_plain_and_single_flag_runs(self):
+        with tempfile.TemporaryDirectory() as d:
+            fresh = Path(d) / 'run.ckpt'
+            run._validate_checkpoint_flags(None, None, False, 5.0)
+            run._validate_checkpoint_flags(fresh, None, True, 5.0)
+            fresh.write_bytes(b'')
+            run._validate_checkpoint_flags(None, fresh, False, 5.0)
+
+    def test_rejects_conflicting_or_unsafe_flags(self):
+        with tempfile.TemporaryDirectory() as d:
+            existing = Path(d) / 'run.ckpt'
+            existing.write_bytes(b'')
+            other = Path(d) / 'other.ckpt'
+            cases = {
+                'resume + checkpoint': (other, existing, False, 5.0),
+                'resume + verbose': (None, existing, True, 5.0),
+                'existing checkpoint': (existing, None, False, 5.0),
+                'non-positive minutes': (other, None, False, 0.0),
+            }
+            for label, args in cases.items():
+                with self.subTest(label):
+                    with self.assertRaises(typer.BadParameter):
+                        run._validate_checkpoint_flags(*args)
+
+
 if __name__ == '__main__':
     unittest.main()